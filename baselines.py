@@ -0,0 +1,271 @@
+# Baseline Schedulers
+# Classic single-queue policies (FCFS, SJF, SRTF, Round Robin and Priority)
+# that return the same (timeline, results, frames) as SimpleMLFQScheduler, so
+# the configured MLFQ can be compared with them on the same workload.
+#
+# They are event driven: time jumps from one arrival, completion or quantum
+# end to the next instead of going tick by tick. The ready set is whatever the
+# policy needs: a deque for FCFS and RR, a heap for SJF, SRTF and Priority.
+
+import heapq
+from array import array
+from collections import deque
+
+from process import Process
+from timeline import Timeline
+
+
+class ArrivalStream:
+    """
+    A workload sorted by arrival time once, to be shared by every policy.
+    Ties keep the input order, like the MLFQ scheduler's sort.
+    """
+
+    def __init__(self, process_list):
+        process_list = list(process_list)
+        order = sorted(range(len(process_list)), key=lambda i: process_list[i][1])
+        self.names = [process_list[i][0] for i in order]
+        self.arrivals = array('q', (process_list[i][1] for i in order))
+        self.bursts = array('q', (process_list[i][2] for i in order))
+        self.priorities = array('q', (process_list[i][3] for i in order))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Build a stream straight from an iterable of (name, arrival, burst,
+        priority), without keeping the tuples. Only sorts if the rows are out
+        of arrival order.
+        """
+        stream = cls(())
+        in_order = True
+        for name, arrival, burst, priority in rows:
+            if stream.arrivals and arrival < stream.arrivals[-1]:
+                in_order = False
+            stream.names.append(name)
+            stream.arrivals.append(arrival)
+            stream.bursts.append(burst)
+            stream.priorities.append(priority)
+        return stream if in_order else cls(stream.as_list())
+
+    @classmethod
+    def of(cls, processes):
+        """Use `processes` as is if it is already an ArrivalStream."""
+        return processes if isinstance(processes, cls) else cls(processes)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        # (name, arrival, burst, priority) rows, so a stream can go anywhere a
+        # process list can (SimpleMLFQScheduler, PreparedWorkload)
+        return zip(self.names, self.arrivals, self.bursts, self.priorities)
+
+    def as_list(self):
+        """(name, arrival, burst, priority) tuples in arrival order."""
+        return list(zip(self.names, self.arrivals, self.bursts, self.priorities))
+
+
+class BaselineScheduler:
+    """
+    Common part of the baseline policies: bookkeeping, timeline and results.
+    Subclasses implement _run(stream), calling _run_slice() for every stretch
+    of CPU time they hand out.
+    """
+
+    name = None
+
+    def __init__(self, listeners=None):
+        # Same listener hooks as SimpleMLFQScheduler; only on_complete is called
+        self.listeners = list(listeners) if listeners else []
+
+    def simulate_with_frames(self, process_list, keep_frames=True):
+        # There are no queue levels to animate, so frames is always empty
+        stream = ArrivalStream.of(process_list)
+        n = len(stream)
+        self.stream = stream
+        self.timeline = Timeline()
+        self.remaining = array('q', stream.bursts)
+        self.first_start = [None] * n
+        self.completion = [None] * n
+
+        self._run(stream)
+
+        results = []
+        for i in sorted(range(n), key=lambda i: stream.names[i]):
+            arrival, burst = stream.arrivals[i], stream.bursts[i]
+            completion, first_start = self.completion[i], self.first_start[i]
+            turnaround = None if completion is None else completion - arrival
+            results.append({
+                'name': stream.names[i],
+                'arrival': arrival,
+                'burst': burst,
+                'priority': stream.priorities[i],
+                'first_start': first_start,
+                'completion': completion,
+                'turnaround': turnaround,
+                'waiting': 0 if turnaround is None else turnaround - burst,
+                'response': None if first_start is None else first_start - arrival,
+            })
+        return self.timeline, results, []
+
+    def _run(self, stream):
+        raise NotImplementedError
+
+    def _run_slice(self, i, start, end):
+        # Give process i the CPU for [start, end); returns True if it finished
+        if self.first_start[i] is None:
+            self.first_start[i] = start
+        if end > start:
+            timeline = self.timeline
+            name = self.stream.names[i]
+            if timeline and timeline.ends[-1] == start and timeline.last_name() == name:
+                timeline.extend_last(end)
+            else:
+                timeline.append(start, end, name, 0)
+            self.remaining[i] -= end - start
+        if self.remaining[i] > 0:
+            return False
+        self.completion[i] = end
+        if self.listeners:
+            self._emit_complete(i)
+        return True
+
+    def _emit_complete(self, i):
+        # Listeners expect a Process, so build one for the finished process
+        s = self.stream
+        p = Process(s.names[i], s.arrivals[i], s.bursts[i], s.priorities[i])
+        p.remaining_time = 0
+        p.first_start_time = self.first_start[i]
+        p.completion_time = self.completion[i]
+        p.waiting_time = p.completion_time - p.arrival_time - p.burst_time
+        for listener in self.listeners:
+            fn = getattr(listener, 'on_complete', None)
+            if fn is not None:
+                fn(p)
+
+
+class FCFSScheduler(BaselineScheduler):
+    """First come, first served (non-preemptive)."""
+
+    name = 'FCFS'
+
+    def _run(self, stream):
+        t = 0
+        for i in range(len(stream)):
+            t = max(t, stream.arrivals[i])
+            self._run_slice(i, t, t + stream.bursts[i])
+            t += stream.bursts[i]
+
+
+class _HeapScheduler(BaselineScheduler):
+    """
+    Policies that always run the ready process with the smallest key.
+    Preemptive ones re-check the heap at every arrival.
+    """
+
+    preemptive = False
+
+    def _key(self, i):
+        raise NotImplementedError
+
+    def _run(self, stream):
+        n = len(stream)
+        arrivals = stream.arrivals
+        ready = []   # (key, arrival, stream index); index breaks ties in input order
+        t, j = 0, 0  # j = next process to arrive
+        while ready or j < n:
+            if not ready:
+                t = max(t, arrivals[j])
+            while j < n and arrivals[j] <= t:
+                heapq.heappush(ready, (self._key(j), arrivals[j], j))
+                j += 1
+
+            _, _, i = ready[0]
+            end = t + self.remaining[i]
+            if self.preemptive and j < n:
+                end = min(end, arrivals[j])
+            if self._run_slice(i, t, end):
+                heapq.heappop(ready)
+            else:
+                # Preempted by the next arrival; its key may have changed
+                heapq.heapreplace(ready, (self._key(i), arrivals[i], i))
+            t = end
+
+
+class SJFScheduler(_HeapScheduler):
+    """Shortest job first (non-preemptive)."""
+
+    name = 'SJF'
+
+    def _key(self, i):
+        return self.stream.bursts[i]
+
+
+class SRTFScheduler(_HeapScheduler):
+    """Shortest remaining time first (preemptive SJF)."""
+
+    name = 'SRTF'
+    preemptive = True
+
+    def _key(self, i):
+        return self.remaining[i]
+
+
+class PriorityScheduler(_HeapScheduler):
+    """Lowest priority number first, preemptive by default."""
+
+    name = 'Priority'
+
+    def __init__(self, preempt=True, listeners=None):
+        super().__init__(listeners)
+        self.preemptive = preempt
+
+    def _key(self, i):
+        return self.stream.priorities[i]
+
+
+class RoundRobinScheduler(BaselineScheduler):
+    """
+    Round robin with a fixed quantum. Processes that arrive while a slice runs
+    join the queue before the process whose slice just ended.
+    """
+
+    name = 'RR'
+
+    def __init__(self, quantum=3, listeners=None):
+        super().__init__(listeners)
+        if quantum <= 0:
+            raise ValueError("Round robin quantum must be positive")
+        self.quantum = quantum
+
+    def _run(self, stream):
+        n = len(stream)
+        arrivals = stream.arrivals
+        ready = deque()
+        t, j = 0, 0
+        while ready or j < n:
+            if not ready:
+                t = max(t, arrivals[j])
+                while j < n and arrivals[j] <= t:
+                    ready.append(j)
+                    j += 1
+
+            i = ready.popleft()
+            end = t + min(self.quantum, self.remaining[i])
+            done = self._run_slice(i, t, end)
+            t = end
+            while j < n and arrivals[j] <= t:
+                ready.append(j)
+                j += 1
+            if not done:
+                ready.append(i)
+
+
+# Policy name -> scheduler class, for compare.py
+POLICIES = {
+    'fcfs': FCFSScheduler,
+    'sjf': SJFScheduler,
+    'srtf': SRTFScheduler,
+    'rr': RoundRobinScheduler,
+    'priority': PriorityScheduler,
+}
@@ -0,0 +1,132 @@
+# Policy Comparison
+# Runs the configured MLFQ and the baseline policies (baselines.py) on the
+# same workload, each in its own worker process, and prints their metrics
+# side by side.
+#
+#   python compare.py Processes/sample_processes.txt
+#   python compare.py my_trace.txt --policies mlfq srtf rr --rr-quantum 4
+#
+# The file uses the usual process file format (see process.load_defaults);
+# its Q0/Q1/Q2, DEMOTE and AGING lines configure the MLFQ.
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from baselines import POLICIES, ArrivalStream
+from metrics import MetricsAggregator
+from process import load_defaults
+from scheduler import SimpleMLFQScheduler
+
+DEFAULT_POLICIES = ('mlfq', 'fcfs', 'sjf', 'srtf', 'rr', 'priority')
+
+# (heading, width, function(row) -> value) for each column of the table
+TABLE_COLUMNS = (
+    ('Policy', 10, lambda r: r['label']),
+    ('Avg WT', 9, lambda r: r['overall']['waiting']['mean']),
+    ('P95 WT', 9, lambda r: r['overall']['waiting']['p95']),
+    ('Max WT', 9, lambda r: r['overall']['waiting']['max']),
+    ('Avg TAT', 9, lambda r: r['overall']['turnaround']['mean']),
+    ('Avg RT', 9, lambda r: r['overall']['response']['mean']),
+    ('Makespan', 9, lambda r: r['makespan']),
+    ('CPU %', 7, lambda r: r['cpu_utilization']),
+    ('Slices', 8, lambda r: r['slices']),
+)
+
+
+def _run_policy(task):
+    # Runs in a worker process: one policy on the shared arrival stream
+    label, policy, options, stream = task
+    metrics = MetricsAggregator()
+    if policy == 'mlfq':
+        scheduler = SimpleMLFQScheduler(listeners=[metrics], **options)
+        out = scheduler.simulate_with_frames(stream.as_list(), keep_frames=False)
+    else:
+        scheduler = POLICIES[policy](listeners=[metrics], **options)
+        out = scheduler.simulate_with_frames(stream, keep_frames=False)
+    timeline = out[0] if out else ()
+
+    row = metrics.summary()
+    row['label'] = label
+    row['slices'] = len(timeline)
+    return row
+
+
+def compare(processes, mlfq_config=None, policies=DEFAULT_POLICIES, rr_quantum=None,
+            workers=None):
+    """
+    Run each policy on `processes` and return one metrics row per policy
+    (MetricsAggregator.summary() plus 'label' and 'slices'), in the order given.
+    mlfq_config holds SimpleMLFQScheduler options; rr_quantum defaults to Q0.
+    """
+    mlfq_config = dict(mlfq_config or {})
+    mlfq_config.setdefault('quantums', [3, 3, 3])
+    if rr_quantum is None:
+        rr_quantum = mlfq_config['quantums'][0]
+
+    # Sorted once here, then handed to every worker
+    stream = ArrivalStream.of(processes)
+    tasks = []
+    for policy in policies:
+        if policy == 'mlfq':
+            tasks.append(('MLFQ', policy, mlfq_config, stream))
+        elif policy == 'rr':
+            tasks.append((f"RR (q={rr_quantum})", policy, {'quantum': rr_quantum}, stream))
+        elif policy in POLICIES:
+            tasks.append((POLICIES[policy].name, policy, {}, stream))
+        else:
+            raise ValueError(f"Unknown policy: {policy}")
+
+    if workers == 1 or len(tasks) < 2:
+        return [_run_policy(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_policy, tasks))
+
+
+def format_table(rows):
+    """The comparison as a fixed-width text table."""
+    def cell(value, width):
+        if isinstance(value, float):
+            return f"{value:>{width}.2f}"
+        return f"{value:>{width}}"
+
+    # Policy names on the left, numbers right-aligned
+    first, rest = TABLE_COLUMNS[0], TABLE_COLUMNS[1:]
+    lines = [f"{first[0]:<{first[1]}} " + " ".join(f"{heading:>{width}}" for heading, width, _ in rest)]
+    lines.append("-" * len(lines[0]))
+    for row in rows:
+        label = f"{row['label']:<{first[1]}}"
+        if row['completed'] == 0:
+            lines.append(f"{label} (no processes completed)")
+            continue
+        lines.append(f"{label} " + " ".join(cell(fn(row), width) for _, width, fn in rest))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the MLFQ with classic scheduling policies.")
+    parser.add_argument('file', help="process file (name arrival burst priority per line)")
+    parser.add_argument('--policies', nargs='+', default=list(DEFAULT_POLICIES),
+                        choices=['mlfq'] + list(POLICIES), help="policies to run")
+    parser.add_argument('--rr-quantum', type=int, default=None, help="round robin quantum (default: Q0)")
+    parser.add_argument('--no-preempt', action='store_true', help="run the MLFQ without preemption")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    # load_defaults falls back to the built-in processes for a missing file
+    if not os.path.exists(args.file):
+        parser.error(f"no such file: {args.file}")
+    quantums, demote, aging, processes = load_defaults(args.file)
+    config = {
+        'quantums': list(quantums),
+        'demote_threshold': demote,
+        'aging_threshold': aging,
+        'preempt': not args.no_preempt,
+    }
+    rows = compare(processes, config, args.policies, args.rr_quantum, args.workers)
+    print(f"{len(processes)} processes from {args.file}")
+    print(format_table(rows))
+
+
+if __name__ == '__main__':
+    main()
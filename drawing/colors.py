@@ -0,0 +1,18 @@
+# Process colors, shared by the GUI (MLFQGUI._color_for) and the headless
+# Gantt renderer (gantt_render.py) so both paint a process the same way.
+
+PROCESS_COLORS = ["#8B0000", "#DC143C", "#FF0000", "#FF4500", "#FF8C00",
+                  "#228B22", "#32CD32", "#0000FF", "#4169E1", "#1E90FF"]
+# Idle CPU and processes not named P<number>
+IDLE_COLOR = "#808080"
+
+def process_color(pid, colors=PROCESS_COLORS):
+        """P<n> gets colors[n - 1] (wrapping around), anything else is gray."""
+        if not pid:
+            return IDLE_COLOR
+        if pid.startswith('P') and pid[1:].isdigit():
+            try:
+                return colors[(int(pid[1:]) - 1) % len(colors)]
+            except ValueError:
+                pass
+        return IDLE_COLOR
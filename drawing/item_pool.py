@@ -0,0 +1,112 @@
+# Retained canvas items for the animation views.
+#
+# Instead of canvas.delete('all') and redrawing every frame, each drawn thing
+# (a process box with its texts, a label...) is a "group" of canvas items kept
+# alive between frames. Drawing a frame only moves groups that changed place,
+# reconfigures items whose options changed and hides groups not used this frame.
+
+# Hidden groups kept around for reuse before the oldest ones are deleted
+MAX_HIDDEN_GROUPS = 200
+
+class CanvasItemPool:
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.groups = {}     # key -> {'tag', 'pos', 'items': [(id, kind, coords, opts)], 'hidden'}
+        self._next_tag = 0
+        self._used = set()
+        self._last_config = {}
+
+    def begin(self):
+        """Start a new frame."""
+        self._used = set()
+
+    def place(self, key, x, y, parts):
+        """
+        Show group `key` at (x, y).
+        `parts` is a list of (kind, relative_coords, options) with kind
+        'rectangle' or 'text'; coordinates are relative to (x, y).
+        """
+        self._used.add(key)
+        c = self.canvas
+        group = self.groups.get(key)
+
+        if group is None or len(group['items']) != len(parts):
+            if group is not None:
+                c.delete(group['tag'])
+            tag = f"pool_{self._next_tag}"
+            self._next_tag += 1
+            items = []
+            for kind, rel, opts in parts:
+                coords = _offset(rel, x, y)
+                create = c.create_rectangle if kind == 'rectangle' else c.create_text
+                item = create(*coords, tags=tag, **opts)
+                items.append((item, kind, rel, dict(opts)))
+            self.groups[key] = {'tag': tag, 'pos': (x, y), 'items': items, 'hidden': False}
+            return
+
+        if group['hidden']:
+            c.itemconfigure(group['tag'], state='normal')
+            group['hidden'] = False
+
+        # Move the whole group with one call
+        old_x, old_y = group['pos']
+        if (x, y) != (old_x, old_y):
+            c.move(group['tag'], x - old_x, y - old_y)
+            group['pos'] = (x, y)
+
+        for i, (kind, rel, opts) in enumerate(parts):
+            item, _, old_rel, old_opts = group['items'][i]
+            if rel != old_rel:
+                c.coords(item, *_offset(rel, x, y))
+            changed = {k: v for k, v in opts.items() if old_opts.get(k) != v}
+            if changed:
+                c.itemconfigure(item, **changed)
+                old_opts.update(changed)
+            if rel != old_rel:
+                group['items'][i] = (item, kind, rel, old_opts)
+
+    def end(self):
+        """Finish the frame: hide every group that was not placed."""
+        c = self.canvas
+        hidden = []
+        for key, group in self.groups.items():
+            if key in self._used:
+                continue
+            if not group['hidden']:
+                c.itemconfigure(group['tag'], state='hidden')
+                group['hidden'] = True
+            hidden.append(key)
+
+        # Don't let hidden groups pile up over a long run
+        for key in hidden[:max(0, len(hidden) - MAX_HIDDEN_GROUPS)]:
+            c.delete(self.groups.pop(key)['tag'])
+
+    def configure(self, **kwargs):
+        """canvas.configure, skipped when nothing changed."""
+        if kwargs != self._last_config:
+            self.canvas.configure(**kwargs)
+            self._last_config = kwargs
+
+    def clear(self):
+        """Delete every pooled item (used when the canvas is reset)."""
+        self.canvas.delete('all')
+        self.groups = {}
+        self._used = set()
+        self._last_config = {}
+
+def _offset(rel, x, y):
+    return [v + (x if i % 2 == 0 else y) for i, v in enumerate(rel)]
+
+def item_pool_for(self, canvas):
+    """Return the item pool attached to `canvas`, creating it on first use."""
+    pools = self.__dict__.setdefault('_item_pools', {})
+    key = str(canvas)
+    if key not in pools:
+        pools[key] = CanvasItemPool(canvas)
+    return pools[key]
+
+def clear_item_pools(self):
+    """Delete all pooled items on every animation canvas."""
+    for pool in getattr(self, '_item_pools', {}).values():
+        pool.clear()
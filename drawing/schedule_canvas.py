@@ -1,15 +1,24 @@
+from drawing.item_pool import item_pool_for
+
+# Queued boxes shown per queue level in the bottom row (frames hold at most this many)
+SCHEDULE_BOXES_PER_QUEUE = 12
+
 def draw_schedule_timeline(self, frame):
         """Draw the horizontal timeline with current running process on top and past slices below."""
         c = self.schedule_canvas
-        c.delete('all')
+        # Items are kept between frames and only updated where something changed
+        pool = item_pool_for(self, c)
+        pool.begin()
 
         W = c.winfo_width() or 520
         H = c.winfo_height() or 220
         bw, bh, gap = 100, 64, 8
         
         # Add labels for the two rows
-        c.create_text(5, 25, text="Current:", font=("Arial", 10, "bold"), anchor='w', fill="black")
-        c.create_text(5, 95, text="Queued:", font=("Arial", 10, "bold"), anchor='w', fill="black")
+        pool.place('labels', 5, 0, [
+            ('text', (0, 25), {'text': "Current:", 'font': ("Arial", 10, "bold"), 'anchor': 'w', 'fill': "black"}),
+            ('text', (0, 95), {'text': "Queued:", 'font': ("Arial", 10, "bold"), 'anchor': 'w', 'fill': "black"}),
+        ])
 
         # Row 1: Current running process (TOP ROW)
         current_x = 60  # Start after the label
@@ -18,21 +27,26 @@ def draw_schedule_timeline(self, frame):
         if frame['running']:
             rp = frame['running']
             col = self._color_for(rp['name'])
-            c.create_rectangle(current_x, current_y, current_x+bw, current_y+bh, fill=col, outline='red', width=3)
-            c.create_text(current_x+bw//2, current_y+12, text=rp['name'], font=("Arial", 12, "bold"), fill="white")
-            c.create_text(current_x+bw//2, current_y+30, text=f"Q{rp['queue_level']}  REM:{rp['remaining']}", font=("Arial", 9), fill="white")
             # Display BT, PT on first line and WT, AT on second line for CPU queue
             # Calculate burst time from execution_time + remaining
             burst_time = rp.get('execution_time', 0) + rp.get('remaining', 0)
             line1_text = f"BT:{burst_time} PT:{rp.get('processing_time', 'N/A')}"
             line2_text = f"WT:{rp.get('waiting', 'N/A')} AT:{rp.get('arrival', 'N/A')}"
-            c.create_text(current_x+bw//2, current_y+42, text=line1_text, font=("Arial", 8), fill="white")
-            c.create_text(current_x+bw//2, current_y+54, text=line2_text, font=("Arial", 8), fill="white")
+            pool.place('running', current_x, current_y, [
+                ('rectangle', (0, 0, bw, bh), {'fill': col, 'outline': 'red', 'width': 3}),
+                ('text', (bw//2, 12), {'text': rp['name'], 'font': ("Arial", 12, "bold"), 'fill': "white"}),
+                ('text', (bw//2, 30), {'text': f"Q{rp['queue_level']}  REM:{rp['remaining']}", 'font': ("Arial", 9), 'fill': "white"}),
+                ('text', (bw//2, 42), {'text': line1_text, 'font': ("Arial", 8), 'fill': "white"}),
+                ('text', (bw//2, 54), {'text': line2_text, 'font': ("Arial", 8), 'fill': "white"}),
+            ])
 
         # Row 2: Incoming processes in queues (BOTTOM ROW)
         queue_x = 60  # Start after the label
         queue_y = 80  # Bottom position
         
+        # Use different border colors for different queue levels
+        border_colors = ['#FFD700', '#C0C0C0', '#CD7F32']  # Gold, Silver, Bronze
+
         # Show processes from all queues (Q0, Q1, Q2) in priority order
         for queue_level in range(3):  # Q0 (highest) to Q2 (lowest)
             queue_processes = frame['queues'][queue_level]
@@ -42,16 +56,31 @@ def draw_schedule_timeline(self, frame):
                     continue
                     
                 col = self._color_for(process['name'])
-                # Use different border colors for different queue levels
-                border_colors = ['#FFD700', '#C0C0C0', '#CD7F32']  # Gold, Silver, Bronze
                 border_color = border_colors[queue_level]
-                
-                c.create_rectangle(queue_x, queue_y, queue_x+bw, queue_y+bh, fill=col, outline=border_color, width=2)
-                c.create_text(queue_x+bw//2, queue_y+12, text=process['name'], font=("Arial", 11, "bold"), fill="white")
-                c.create_text(queue_x+bw//2, queue_y+30, text=f"Q{queue_level}  REM:{process['remaining']}", font=("Arial", 9), fill="white")
-                c.create_text(queue_x+bw//2, queue_y+48, text=f"WT:{process['waiting']}", font=("Arial", 9), fill="white")
+
+                # Keyed by process name: when the queue shifts, boxes are only moved
+                pool.place(('queued', process['name']), queue_x, queue_y, [
+                    ('rectangle', (0, 0, bw, bh), {'fill': col, 'outline': border_color, 'width': 2}),
+                    ('text', (bw//2, 12), {'text': process['name'], 'font': ("Arial", 11, "bold"), 'fill': "white"}),
+                    ('text', (bw//2, 30), {'text': f"Q{queue_level}  REM:{process['remaining']}", 'font': ("Arial", 9), 'fill': "white"}),
+                    ('text', (bw//2, 48), {'text': f"WT:{process['waiting']}", 'font': ("Arial", 9), 'fill': "white"}),
+                ])
                 queue_x += bw + gap
 
+            # Top-k frames: one summary box for the rest of the queue
+            stats = frame.get('queue_stats')
+            if stats and stats[queue_level]['count'] > len(queue_processes):
+                level_stats = stats[queue_level]
+                pool.place(('more', queue_level), queue_x, queue_y, [
+                    ('rectangle', (0, 0, bw, bh), {'fill': "#7f8c8d", 'outline': border_colors[queue_level], 'width': 2, 'dash': (4, 2)}),
+                    ('text', (bw//2, 12), {'text': f"+{level_stats['count'] - len(queue_processes)} more", 'font': ("Arial", 10, "bold"), 'fill': "white"}),
+                    ('text', (bw//2, 30), {'text': f"Q{queue_level}  REM:{level_stats['total_remaining']}", 'font': ("Arial", 9), 'fill': "white"}),
+                    ('text', (bw//2, 48), {'text': f"max WT:{level_stats['max_waiting']}", 'font': ("Arial", 9), 'fill': "white"}),
+                ])
+                queue_x += bw + gap
+
+        pool.end()
+
         # Set scroll region to accommodate both rows
         max_x = max(current_x + bw + gap, queue_x + gap)
-        c.configure(scrollregion=(0, 0, max(W, max_x), H))
\ No newline at end of file
+        pool.configure(scrollregion=(0, 0, max(W, max_x), H))
@@ -1,105 +1,251 @@
+from bisect import bisect_left
+
+from drawing.timeline_lod import UtilizationPyramid
+
+# Grid layout (pixels)
+CELL_WIDTH = 30           # pixels per tick at the default zoom
+CELL_HEIGHT = 35
+HEADER_HEIGHT = 25
+LABEL_WIDTH = 100
+# Extra pixels drawn on each side of the visible area so short scrolls don't show gaps
+VIEWPORT_MARGIN = 600
+# Closest zoom allowed, in pixels per tick
+MAX_ZOOM = 120
+
+ROW_HEADERS = ['Q0 (Highest)', 'Q1', 'Q2', 'CPU (Running)']
+# Same gold/silver/bronze used for queue borders in the schedule view
+LEVEL_COLORS = ['#FFD700', '#C0C0C0', '#CD7F32']
+CPU_BAND_COLOR = '#2c3e50'
+
 def draw_timeline_grid(self):
         """Draw the grid-based timeline visualization showing Q0, Q1, Q2, and CPU rows."""
         if not hasattr(self, 'timeline_grid_canvas') or not self.timeline:
             return
-            
+
+        # The run's TimelineIndex finds the slices inside the viewport
+        self._grid_index = self.timeline_index
+        self._grid_max_time = self._grid_index.end
+        # Process whose slices are outlined (picked by clicking the grid)
+        self._grid_highlight = None
+        # Built on first zoom-out past one pixel per tick
+        self._grid_pyramid = None
+        if not hasattr(self, 'timeline_zoom'):
+            self.timeline_zoom = CELL_WIDTH
+
+        _layout_timeline_grid(self)
+
+def _layout_timeline_grid(self):
         canvas = self.timeline_grid_canvas
         canvas.delete('all')
-        
-        # Calculate layout
+
         canvas_width = canvas.winfo_width() or 800
-        canvas_height = canvas.winfo_height() or 200
-        
-        # Grid dimensions
-        cell_width = 30
-        cell_height = 35
-        header_height = 25
-        
-        # Find the maximum time from timeline
-        max_time = max(end for _, end, _, _ in self.timeline) if self.timeline else 0
-        
+        zoom = self.timeline_zoom
+
         # Calculate total grid dimensions
-        total_width = max(canvas_width, (max_time + 1) * cell_width + 100)
-        total_height = header_height + 4 * cell_height + 20  # 4 rows: Q0, Q1, Q2, CPU
-        
+        total_width = max(canvas_width, int((self._grid_max_time + 1) * zoom) + LABEL_WIDTH)
+        total_height = HEADER_HEIGHT + 4 * CELL_HEIGHT + 20  # 4 rows: Q0, Q1, Q2, CPU
+
         # Set scroll region
         canvas.configure(scrollregion=(0, 0, total_width, total_height))
-        
+
         # Draw headers
-        headers = ['Q0 (Highest)', 'Q1', 'Q2', 'CPU (Running)']
-        for i, header in enumerate(headers):
-            y_pos = header_height + i * cell_height
-            canvas.create_text(10, y_pos + cell_height//2, text=header, 
+        for i, header in enumerate(ROW_HEADERS):
+            y_pos = HEADER_HEIGHT + i * CELL_HEIGHT
+            canvas.create_text(10, y_pos + CELL_HEIGHT//2, text=header,
                              font=("Arial", 10, "bold"), anchor='w')
-        
+
+        self._grid_drawn_range = None
+
+        # Only what is inside the scroll viewport is drawn
+        draw_timeline_grid_viewport(self)
+
+def _tick_label_step(zoom):
+        # Smallest 1, 2, 5, 10, 20, 50... step that keeps axis labels apart
+        step, i = 1, 0
+        while step * zoom < 30:
+            step = int(step * (2, 2.5, 2)[i % 3])
+            i += 1
+        return step
+
+def draw_timeline_grid_viewport(self):
+        """Draw the part of the timeline inside the visible canvas area (plus a margin)."""
+        if not hasattr(self, 'timeline_grid_canvas') or not self.timeline or not hasattr(self, '_grid_index'):
+            return
+
+        canvas = self.timeline_grid_canvas
+        zoom = self.timeline_zoom
+        max_time = self._grid_max_time
+
+        # Visible x range in canvas coordinates, as ticks
+        view_width = canvas.winfo_width() or 800
+        x0 = canvas.canvasx(0) - VIEWPORT_MARGIN
+        x1 = canvas.canvasx(view_width) + VIEWPORT_MARGIN
+        first = max(0, int((x0 - LABEL_WIDTH) // zoom))
+        last = min(max_time, int((x1 - LABEL_WIDTH) // zoom) + 1)
+
+        # Nothing to do if the same range is already on the canvas
+        if self._grid_drawn_range == (first, last, zoom):
+            return
+        self._grid_drawn_range = (first, last, zoom)
+        canvas.delete('grid_cell')
+
+        def x_of(t):
+            return LABEL_WIDTH + t * zoom
+
+        # Idle background for each row, the slices are drawn on top
+        for row in range(4):
+            y_pos = HEADER_HEIGHT + row * CELL_HEIGHT
+            canvas.create_rectangle(x_of(first), y_pos, x_of(last + 1), y_pos + CELL_HEIGHT,
+                                 fill="#f0f0f0", outline='red' if row == 3 else 'black',
+                                 width=2 if row == 3 else 1, tags='grid_cell')
+
         # Draw time axis
-        for t in range(max_time + 1):
-            x_pos = 100 + t * cell_width
-            canvas.create_text(x_pos + cell_width//2, header_height//2, text=str(t), 
-                             font=("Arial", 9), anchor='center')
-        
-        # Create a grid to track what's in each cell
-        grid_data = {}
-        for queue_level in range(3):  # Q0, Q1, Q2
-            grid_data[queue_level] = {}
-            for t in range(max_time + 1):
-                grid_data[queue_level][t] = None
-        
-        # CPU row
-        grid_data['cpu'] = {}
-        for t in range(max_time + 1):
-            grid_data['cpu'][t] = None
-        
-        # Fill the grid with timeline data
-        for start, end, process_name, queue_level in self.timeline:
-            for t in range(start, end):
-                if t <= max_time:
-                    if queue_level < 3:  # Process in queue
-                        grid_data[queue_level][t] = process_name
-                    # Also mark CPU execution
-                    grid_data['cpu'][t] = process_name
-        
-        # Draw the grid cells
-        for queue_level in range(3):  # Q0, Q1, Q2
-            for t in range(max_time + 1):
-                x_pos = 100 + t * cell_width
-                y_pos = header_height + queue_level * cell_height
-                
-                process_name = grid_data[queue_level][t]
-                if process_name:
-                    # Process is in this queue at this time
-                    color = self._color_for(process_name)
-                    canvas.create_rectangle(x_pos, y_pos, x_pos + cell_width, y_pos + cell_height,
-                                         fill=color, outline='black', width=1)
-                    canvas.create_text(x_pos + cell_width//2, y_pos + cell_height//2, 
-                                     text=process_name, font=("Arial", 9, "bold"), 
-                                     fill="white", anchor='center')
+        step = _tick_label_step(zoom)
+        for t in range((first // step) * step, last + 1, step):
+            canvas.create_text(x_of(t) + min(zoom, CELL_WIDTH) / 2, HEADER_HEIGHT//2, text=str(t),
+                             font=("Arial", 9), anchor='center', tags='grid_cell')
+
+        if zoom >= 1:
+            _draw_slices(self, canvas, first, last, x_of)
+        else:
+            _draw_bands(self, canvas, first, last, x_of)
+        _draw_highlight(self, canvas, first, last, x_of)
+
+def _draw_slices(self, canvas, first, last, x_of):
+        # One rectangle per slice, in its queue row and in the CPU row
+        index = self._grid_index
+        cpu_y = HEADER_HEIGHT + 3 * CELL_HEIGHT
+
+        for i in index.overlapping_range(first, last + 1):
+            start, end, process_name, queue_level = index[i]
+            # Clip long slices to the drawn range
+            x_start, x_end = x_of(max(start, first)), x_of(min(end, last + 1))
+            color = self._color_for(process_name)
+            show_name = x_end - x_start >= 24
+
+            if queue_level < 3:
+                y_pos = HEADER_HEIGHT + queue_level * CELL_HEIGHT
+                canvas.create_rectangle(x_start, y_pos, x_end, y_pos + CELL_HEIGHT,
+                                     fill=color, outline='black', width=1, tags='grid_cell')
+                if show_name:
+                    canvas.create_text((x_start + x_end) / 2, y_pos + CELL_HEIGHT//2,
+                                     text=process_name, font=("Arial", 9, "bold"),
+                                     fill="white", anchor='center', tags='grid_cell')
+
+            canvas.create_rectangle(x_start, cpu_y, x_end, cpu_y + CELL_HEIGHT,
+                                 fill=color, outline='red', width=2, tags='grid_cell')  # Red border for CPU
+            if show_name:
+                canvas.create_text((x_start + x_end) / 2, cpu_y + CELL_HEIGHT//2,
+                                 text=process_name, font=("Arial", 9, "bold"),
+                                 fill="white", anchor='center', tags='grid_cell')
+
+def _draw_bands(self, canvas, first, last, x_of):
+        # Zoomed out past one pixel per tick: draw occupancy bands from the pyramid.
+        # Each row shows, per bucket, the share of ticks the CPU spent on that queue level.
+        if self._grid_pyramid is None:
+            self._grid_pyramid = UtilizationPyramid(self._grid_index, max_time=self._grid_max_time)
+        pyramid = self._grid_pyramid
+        level = pyramid.level_for(1 / self.timeline_zoom)
+        size = 2 ** level
+
+        # Consecutive buckets with the same bar height become one rectangle
+        runs = [None] * 4  # row -> [x_start, x_end, height]
+
+        def flush(row):
+            run = runs[row]
+            if run and run[2] > 0:
+                bottom = HEADER_HEIGHT + (row + 1) * CELL_HEIGHT
+                color = CPU_BAND_COLOR if row == 3 else LEVEL_COLORS[row]
+                canvas.create_rectangle(run[0], bottom - run[2], run[1], bottom,
+                                     fill=color, outline='', tags='grid_cell')
+            runs[row] = None
+
+        for t, ticks, per_level in pyramid.buckets(level, first // size, last // size):
+            x_start, x_end = x_of(t), x_of(t + ticks)
+            heights = [round(CELL_HEIGHT * busy / ticks) for busy in per_level]
+            heights.append(round(CELL_HEIGHT * sum(per_level) / ticks))
+            for row, height in enumerate(heights):
+                run = runs[row]
+                if run and run[2] == height and run[1] == x_start:
+                    run[1] = x_end
                 else:
-                    # Empty cell
-                    canvas.create_rectangle(x_pos, y_pos, x_pos + cell_width, y_pos + cell_height,
-                                         fill="#f0f0f0", outline='black', width=1)
-                    canvas.create_text(x_pos + cell_width//2, y_pos + cell_height//2, 
-                                     text="Idle", font=("Arial", 8), 
-                                     fill="#999999", anchor='center')
-        
-        # Draw CPU row
-        for t in range(max_time + 1):
-            x_pos = 100 + t * cell_width
-            y_pos = header_height + 3 * cell_height  # CPU is the 4th row
-            
-            process_name = grid_data['cpu'][t]
-            if process_name:
-                # Process is running on CPU
-                color = self._color_for(process_name)
-                canvas.create_rectangle(x_pos, y_pos, x_pos + cell_width, y_pos + cell_height,
-                                     fill=color, outline='red', width=2)  # Red border for CPU
-                canvas.create_text(x_pos + cell_width//2, y_pos + cell_height//2, 
-                                 text=process_name, font=("Arial", 9, "bold"), 
-                                 fill="white", anchor='center')
-            else:
-                # CPU is idle
-                canvas.create_rectangle(x_pos, y_pos, x_pos + cell_width, y_pos + cell_height,
-                                     fill="#f0f0f0", outline='red', width=2)
-                canvas.create_text(x_pos + cell_width//2, y_pos + cell_height//2, 
-                                 text="Idle", font=("Arial", 8), 
-                                 fill="#999999", anchor='center')
\ No newline at end of file
+                    flush(row)
+                    runs[row] = [x_start, x_end, height]
+        for row in range(4):
+            flush(row)
+
+def _draw_highlight(self, canvas, first, last, x_of):
+        # Outline the drawn slices of the highlighted process (both rows)
+        name = self._grid_highlight
+        if name is None:
+            return
+        index = self._grid_index
+        positions = index.by_process.get(name, ())
+        drawn = index.overlapping_range(first, last + 1)
+        lo, hi = bisect_left(positions, drawn.start), bisect_left(positions, drawn.stop)
+        cpu_y = HEADER_HEIGHT + 3 * CELL_HEIGHT
+        for i in positions[lo:hi]:
+            start, end, _, queue_level = index[i]
+            x_start, x_end = x_of(max(start, first)), x_of(min(end, last + 1))
+            rows = [cpu_y] if queue_level >= 3 else [HEADER_HEIGHT + queue_level * CELL_HEIGHT, cpu_y]
+            for y_pos in rows:
+                canvas.create_rectangle(x_start, y_pos, x_end, y_pos + CELL_HEIGHT,
+                                     outline='#00bfff', width=3, tags='grid_cell')
+
+def timeline_grid_click(self, event):
+        """Show what ran at the clicked tick, outline that process and seek the animation there."""
+        if not hasattr(self, 'timeline_grid_canvas') or not self.timeline or not hasattr(self, '_grid_index'):
+            return
+        canvas = self.timeline_grid_canvas
+        t = int((canvas.canvasx(event.x) - LABEL_WIDTH) // self.timeline_zoom)
+        if t < 0 or t > self._grid_max_time:
+            return
+
+        running = self._grid_index.at(t)
+        if running is None:
+            self._grid_highlight = None
+            self.timeline_info_label.config(text=f"t={t}: CPU idle")
+        else:
+            start, end, name, queue_level = running
+            self._grid_highlight = name
+            count = len(self._grid_index.by_process.get(name, ()))
+            self.timeline_info_label.config(
+                text=f"t={t}: {name} in Q{queue_level}, slice {start}-{end} ({count} slices in total)")
+
+        # Redraw the viewport with the new outline
+        self._grid_drawn_range = None
+        draw_timeline_grid_viewport(self)
+        self._seek_animation_to_time(t)
+
+def zoom_timeline_grid(self, factor=None):
+        """Zoom the results timeline by `factor` (None = fit the whole run in the window)."""
+        if not hasattr(self, 'timeline_grid_canvas') or not self.timeline or not hasattr(self, '_grid_index'):
+            return
+        canvas = self.timeline_grid_canvas
+        view_width = canvas.winfo_width() or 800
+        fit = max(1e-6, (view_width - LABEL_WIDTH) / (self._grid_max_time + 1))
+
+        # Keep the tick in the middle of the view in place
+        center_tick = (canvas.canvasx(view_width / 2) - LABEL_WIDTH) / self.timeline_zoom
+
+        if factor is None:
+            self.timeline_zoom = fit
+        else:
+            self.timeline_zoom = max(fit, min(MAX_ZOOM, self.timeline_zoom * factor))
+
+        _layout_timeline_grid(self)
+        total_width = max(view_width, int((self._grid_max_time + 1) * self.timeline_zoom) + LABEL_WIDTH)
+        left = LABEL_WIDTH + center_tick * self.timeline_zoom - view_width / 2
+        canvas.xview_moveto(max(0.0, left / total_width))
+
+def schedule_timeline_grid_redraw(self):
+        """Coalesce scroll/resize events into a single viewport redraw when Tk is idle."""
+        if getattr(self, '_grid_redraw_pending', False):
+            return
+        self._grid_redraw_pending = True
+
+        def _redraw():
+            self._grid_redraw_pending = False
+            draw_timeline_grid_viewport(self)
+
+        self.root.after_idle(_redraw)
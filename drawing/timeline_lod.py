@@ -0,0 +1,62 @@
+from array import array
+
+# Multi-resolution summary of a timeline, used when the results timeline is zoomed
+# out so far that single slices would be narrower than a pixel.
+#
+# Level k splits time into buckets of (2 ** k) ticks and stores, for every bucket,
+# how many ticks the CPU spent running a process from Q0, Q1 and Q2.
+
+NUM_QUEUES = 3
+
+class UtilizationPyramid:
+
+    def __init__(self, timeline, min_level=1, max_time=None):
+        self.min_level = min_level
+        if max_time is None:
+            max_time = max((end for _, end, _, _ in timeline), default=0)
+        self.max_time = max_time
+        self.levels = {}  # level -> [array per queue level]
+
+        size = 2 ** min_level
+        n = self.max_time // size + 1
+        base = [array('I', bytes(4 * n)) for _ in range(NUM_QUEUES)]
+
+        # Spread every slice over the buckets it touches
+        for start, end, _, queue_level in timeline:
+            counts = base[min(queue_level, NUM_QUEUES - 1)]
+            b = start // size
+            while start < end:
+                bucket_end = min(end, (b + 1) * size)
+                counts[b] += bucket_end - start
+                start = bucket_end
+                b += 1
+        self.levels[min_level] = base
+
+        # Each coarser level sums neighbouring pairs of the level below
+        level = min_level
+        while len(self.levels[level][0]) > 1:
+            finer = self.levels[level]
+            coarser = []
+            for counts in finer:
+                merged = array('I', bytes(4 * ((len(counts) + 1) // 2)))
+                for i in range(len(counts)):
+                    merged[i >> 1] += counts[i]
+                coarser.append(merged)
+            level += 1
+            self.levels[level] = coarser
+        self.max_level = level
+
+    def level_for(self, ticks_per_pixel):
+        """Smallest level whose buckets are at least one pixel wide."""
+        level = self.min_level
+        while level < self.max_level and 2 ** level < ticks_per_pixel:
+            level += 1
+        return level
+
+    def buckets(self, level, first, last):
+        """Yield (bucket_start_tick, bucket_size, [ticks in Q0, Q1, Q2]) for buckets first..last."""
+        size = 2 ** level
+        counts = self.levels[level]
+        last = min(last, len(counts[0]) - 1)
+        for b in range(max(0, first), last + 1):
+            yield b * size, size, [counts[q][b] for q in range(NUM_QUEUES)]
@@ -0,0 +1,172 @@
+# Compact Binary Encoding for Animation Frames and Timelines
+# Frames produced by SimpleMLFQScheduler._snapshot are dicts of dicts. Here they
+# are flattened into one array of 32-bit ints plus an offset index, so they can be
+# moved between processes (or written to disk) as raw bytes and decoded lazily.
+#
+# Layout of one frame (all int32):
+#   t, has_running, has_stats, len(Q0), len(Q1), len(Q2)
+#   [running record]                 if has_running
+#   [queue stats] * 3                if has_stats (top-k frames)
+#   [queued record] * (len(Q0) + len(Q1) + len(Q2))
+# Running record: name_id, arrival, queue_level, waiting, remaining, execution_time, time_in_queue, processing_time
+# Queued record:  name_id, arrival, burst, priority, waiting, remaining, time_in_queue, processing_time
+# Queue stats:    count, total_remaining, max_waiting
+
+from array import array
+
+RUNNING_FIELDS = ('arrival', 'queue_level', 'waiting', 'remaining', 'execution_time', 'time_in_queue', 'processing_time')
+QUEUED_FIELDS = ('arrival', 'burst', 'priority', 'waiting', 'remaining', 'time_in_queue', 'processing_time')
+STATS_FIELDS = ('count', 'total_remaining', 'max_waiting')
+RECORD_SIZE = 8
+HEADER_SIZE = 6
+
+
+class NameTable:
+    """Interns process names as small ints."""
+
+    def __init__(self, names=None):
+        self.names = list(names) if names else []
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+    def id_for(self, name):
+        i = self.ids.get(name)
+        if i is None:
+            i = len(self.names)
+            self.names.append(name)
+            self.ids[name] = i
+        return i
+
+
+class FrameEncoder:
+    """Appends frames to an int32 data array and an int64 offset index."""
+
+    def __init__(self, names=None):
+        self.names = names if names is not None else NameTable()
+        self.data = array('i')
+        self.offsets = array('q', [0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def add(self, frame):
+        out = self.data
+        start = len(out)
+        id_for = self.names.id_for
+        running = frame['running']
+        queues = frame['queues']
+        stats = frame.get('queue_stats')
+        out.extend((frame['t'], 1 if running else 0, 1 if stats else 0,
+                    len(queues[0]), len(queues[1]), len(queues[2])))
+        if running:
+            out.append(id_for(running['name']))
+            out.extend([running[k] for k in RUNNING_FIELDS])
+        if stats:
+            for level_stats in stats:
+                out.extend([level_stats[k] for k in STATS_FIELDS])
+        for queue in queues:
+            for p in queue:
+                out.append(id_for(p['name']))
+                out.extend([p[k] for k in QUEUED_FIELDS])
+        self.offsets.append(self.offsets[-1] + len(out) - start)
+
+    def take_chunk(self):
+        """
+        Hand over the frames encoded so far as (data, end_offsets) and start a new chunk.
+        Offsets keep counting from the previous chunks, so chunks can simply be appended
+        to a PackedFrames on the receiving side.
+        """
+        data, ends = self.data, self.offsets[1:]
+        self.data = array('i')
+        self.offsets = array('q', [self.offsets[-1]])
+        return data, ends
+
+    # Scheduler listener hook
+    def on_frame(self, frame):
+        self.add(frame)
+
+
+def decode_frame(data, start, names):
+    """Rebuild the frame dict that starts at data[start]."""
+    t, has_running, has_stats, n0, n1, n2 = data[start:start + HEADER_SIZE]
+    pos = start + HEADER_SIZE
+    running = None
+    if has_running:
+        rec = data[pos:pos + RECORD_SIZE]
+        running = {'name': names[rec[0]]}
+        running.update(zip(RUNNING_FIELDS, rec[1:]))
+        pos += RECORD_SIZE
+    stats = None
+    if has_stats:
+        stats = []
+        for _ in range(3):
+            stats.append(dict(zip(STATS_FIELDS, data[pos:pos + len(STATS_FIELDS)])))
+            pos += len(STATS_FIELDS)
+    queues = []
+    for n in (n0, n1, n2):
+        queue = []
+        for _ in range(n):
+            rec = data[pos:pos + RECORD_SIZE]
+            p = {'name': names[rec[0]]}
+            p.update(zip(QUEUED_FIELDS, rec[1:]))
+            queue.append(p)
+            pos += RECORD_SIZE
+        queues.append(queue)
+    frame = {'t': t, 'queues': queues, 'running': running}
+    if stats is not None:
+        frame['queue_stats'] = stats
+    return frame
+
+
+class PackedFrames:
+    """
+    Read-only list of frames backed by encoded data.
+    Frames are decoded only when indexed, so holding a long run costs
+    a few ints per queued process instead of a dict per process.
+    """
+
+    def __init__(self, data, offsets, names):
+        self.data = data
+        self.offsets = offsets
+        self.names = names
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def extend(self, data, end_offsets):
+        """Append a chunk produced by FrameEncoder.take_chunk()."""
+        self.data.extend(data)
+        self.offsets.extend(end_offsets)
+
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("frame index out of range")
+        return decode_frame(self.data, self.offsets[i], self.names)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def encode_timeline(timeline, names):
+    """Split (start, end, name, queue_level) slices into four int arrays."""
+    if hasattr(timeline, 'pids'):
+        # Columnar timeline.Timeline: copy the arrays, only the ids need remapping
+        remap = [names.id_for(name) for name in timeline.names.names]
+        ids = array('i', [remap[pid] for pid in timeline.pids])
+        return array('q', timeline.starts), array('q', timeline.ends), ids, array('i', timeline.levels)
+    starts, ends, ids, levels = array('q'), array('q'), array('i'), array('i')
+    for start, end, name, level in timeline:
+        starts.append(start)
+        ends.append(end)
+        ids.append(names.id_for(name))
+        levels.append(level)
+    return starts, ends, ids, levels
+
+
+def decode_timeline(starts, ends, ids, levels, names):
+    """Rebuild a columnar timeline.Timeline around the decoded arrays."""
+    from timeline import Timeline  # timeline.py imports NameTable from here
+    return Timeline.from_arrays(starts, ends, ids, levels, names)
@@ -0,0 +1,89 @@
+# On-Disk Frame Store
+# Keeps encoded animation frames (see frame_codec.py) in a temporary file and
+# reads them back through a memory map, so a very long animated run does not
+# have to fit in RAM. Only the offset index (8 bytes per frame) stays in memory;
+# the operating system pages frame data in and out as the animation moves.
+
+import mmap
+import os
+import tempfile
+import weakref
+from array import array
+
+from frame_codec import decode_frame
+
+
+def _close_resources(res, path):
+    # Release the int view and the mapping before closing and deleting the file
+    if res.get('view') is not None:
+        res['view'].release()
+        res['view'] = None
+    if res.get('map') is not None:
+        res['map'].close()
+        res['map'] = None
+    if not res['file'].closed:
+        res['file'].close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class FrameStore:
+    """
+    Append-only frame list backed by a memory-mapped temporary file.
+    Has the same interface as frame_codec.PackedFrames (len, indexing,
+    iteration, extend), so the GUI can use either one.
+    """
+
+    def __init__(self, names, directory=None):
+        self.names = names
+        fd, self.path = tempfile.mkstemp(prefix='mlfq_frames_', suffix='.bin', dir=directory)
+        self._res = {'file': os.fdopen(fd, 'r+b'), 'map': None, 'view': None}
+        self.offsets = array('q', [0])   # int32 positions, like PackedFrames
+        self._size = 0                   # bytes written
+        self._mapped = 0                 # bytes covered by the current mapping
+        # Delete the file when the store is closed, collected, or at exit
+        self._finalizer = weakref.finalize(self, _close_resources, self._res, self.path)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def extend(self, data, end_offsets):
+        """Append a chunk produced by FrameEncoder.take_chunk()."""
+        f = self._res['file']
+        f.seek(self._size)
+        raw = data.tobytes()
+        f.write(raw)
+        self._size += len(raw)
+        self.offsets.extend(end_offsets)
+
+    def _view_covering(self, nbytes):
+        # Remap when a frame lies past the end of the current mapping
+        res = self._res
+        if nbytes > self._mapped:
+            res['file'].flush()
+            if res['view'] is not None:
+                res['view'].release()
+                res['map'].close()
+            res['map'] = mmap.mmap(res['file'].fileno(), self._size, access=mmap.ACCESS_READ)
+            res['view'] = memoryview(res['map']).cast('i')
+            self._mapped = self._size
+        return res['view']
+
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("frame index out of range")
+        view = self._view_covering(self.offsets[i + 1] * 4)
+        return decode_frame(view, self.offsets[i], self.names)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self):
+        """Unmap and delete the backing file."""
+        self._finalizer()
@@ -0,0 +1,377 @@
+# Gantt Renderer
+# Draws a run's timeline as an SVG or PNG file without Tk, with the same
+# Q0 / Q1 / Q2 / CPU lanes and process colors as the Results tab's timeline.
+#
+#   python gantt_render.py Processes/sample_processes.txt run.svg
+#   python gantt_render.py big_trace.txt run.png --width 4000 --queues
+#
+# When a tick is at least one pixel wide every slice is drawn as it is.
+# Otherwise the slices are binned per pixel column: each lane draws, per
+# column, a bar as tall as the share of the column the CPU was busy, in the
+# color of the process that ran longest there, and equal neighbouring columns
+# are merged. So the output never has more than a few shapes per pixel column,
+# however many slices the run has, and slices are read one by one in order.
+#
+# PNGs are encoded here with zlib, so no imaging library is needed. They have
+# no text (lane order is the same as in the SVG).
+
+import argparse
+import os
+import struct
+import zlib
+from array import array
+
+from drawing.colors import process_color
+from drawing.timeline_grid import (CELL_HEIGHT, HEADER_HEIGHT, LABEL_WIDTH, LEVEL_COLORS,
+                                   ROW_HEADERS, _tick_label_step)
+from process import load_defaults
+from scheduler import SimpleMLFQScheduler
+
+CPU_ROW = 3
+BACKGROUND = '#ffffff'
+LANE_BACKGROUND = '#f0f0f0'
+# Lane borders: red for the CPU lane, like the Results tab
+LANE_OUTLINE = '#000000'
+CPU_OUTLINE = '#ff0000'
+# Queue-length shading behind the slices of a queue lane (render_gantt(queue_lengths=...))
+QUEUE_SHADE = '#c8d6e5'
+
+
+# == Output ==
+
+class SvgCanvas:
+    """Writes shapes straight to an SVG file through a buffer."""
+
+    def __init__(self, path, width, height, buffer_size=1 << 16):
+        self._file = open(path, 'w', encoding='utf-8')
+        self._buffer = []
+        self._buffer_size = buffer_size
+        self._write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                    f'font-family="Arial" font-size="9">\n')
+
+    def _write(self, text):
+        self._buffer.append(text)
+        if len(self._buffer) >= self._buffer_size // 64:
+            self._file.write(''.join(self._buffer))
+            self._buffer.clear()
+
+    def rect(self, x0, y0, x1, y1, fill, outline=None, width=1):
+        stroke = f' stroke="{outline}" stroke-width="{width}"' if outline else ''
+        self._write(f'<rect x="{_num(x0)}" y="{_num(y0)}" width="{_num(x1 - x0)}" '
+                    f'height="{_num(y1 - y0)}" fill="{fill}"{stroke}/>\n')
+
+    def text(self, x, y, text, fill='#000000', anchor='middle', bold=False, size=None):
+        weight = ' font-weight="bold"' if bold else ''
+        font_size = f' font-size="{size}"' if size else ''
+        text = text.replace('&', '&amp;').replace('<', '&lt;')
+        self._write(f'<text x="{_num(x)}" y="{_num(y)}" fill="{fill}" text-anchor="{anchor}" '
+                    f'dominant-baseline="central"{weight}{font_size}>{text}</text>\n')
+
+    def close(self):
+        self._write('</svg>\n')
+        self._file.write(''.join(self._buffer))
+        self._file.close()
+
+
+class PngCanvas:
+    """RGB pixel buffer saved as a PNG on close(); text is ignored."""
+
+    def __init__(self, path, width, height):
+        self.path = path
+        self.width, self.height = width, height
+        self.pixels = bytearray(_rgb(BACKGROUND) * (width * height))
+
+    def rect(self, x0, y0, x1, y1, fill, outline=None, width=1):
+        x0, x1 = max(0, round(x0)), min(self.width, round(x1))
+        y0, y1 = max(0, round(y0)), min(self.height, round(y1))
+        if x1 <= x0 or y1 <= y0:
+            return
+        if fill is not None:
+            self._fill(x0, y0, x1, y1, _rgb(fill))
+        if outline:
+            color, w = _rgb(outline), max(1, round(width))
+            self._fill(x0, y0, x1, min(y1, y0 + w), color)
+            self._fill(x0, max(y0, y1 - w), x1, y1, color)
+            self._fill(x0, y0, min(x1, x0 + w), y1, color)
+            self._fill(max(x0, x1 - w), y0, x1, y1, color)
+
+    def _fill(self, x0, y0, x1, y1, rgb):
+        row = rgb * (x1 - x0)
+        stride = self.width * 3
+        for y in range(y0, y1):
+            start = y * stride + x0 * 3
+            self.pixels[start:start + len(row)] = row
+
+    def text(self, *args, **kwargs):
+        pass
+
+    def close(self):
+        stride = self.width * 3
+        # Filter type 0 (none) in front of every row
+        raw = b''.join(b'\x00' + self.pixels[y * stride:(y + 1) * stride] for y in range(self.height))
+
+        def chunk(kind, data):
+            return (struct.pack('>I', len(data)) + kind + data
+                    + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+        with open(self.path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)))
+            f.write(chunk(b'IDAT', zlib.compress(raw, 6)))
+            f.write(chunk(b'IEND', b''))
+
+
+def _rgb(color):
+    return bytes.fromhex(color.lstrip('#'))
+
+
+def _num(x):
+    # Short numbers keep big SVGs small
+    return f"{x:.2f}".rstrip('0').rstrip('.') if isinstance(x, float) else str(x)
+
+
+# == Binning ==
+
+class _Lane:
+    """
+    Collects one lane's busy time per pixel column (columns come in order) and
+    draws runs of equal columns as single bars.
+    """
+
+    def __init__(self, canvas, x_origin, y_bottom, outline=None):
+        self.canvas = canvas
+        self.x_origin = x_origin
+        self.y_bottom = y_bottom
+        self.outline = outline
+        self.column = -1
+        self.weights = {}       # color -> busy share of the current column
+        self.run = None         # [first column, end column, color, height]
+
+    def add(self, x0, x1, color):
+        c0, c1 = int(x0), int(x1)
+        if c0 != self.column:
+            self._close_column()
+            self.column = c0
+        weights = self.weights
+        if c0 == c1:
+            weights[color] = weights.get(color, 0) + x1 - x0
+            return
+        weights[color] = weights.get(color, 0) + c0 + 1 - x0
+        self._close_column()
+        if c1 > c0 + 1:
+            self.bar(c0 + 1, c1, color, CELL_HEIGHT)
+        self.column = c1
+        if x1 > c1:
+            self.weights[color] = x1 - c1
+
+    def _close_column(self):
+        if self.weights:
+            color = max(self.weights, key=self.weights.get)
+            height = round(CELL_HEIGHT * min(1.0, sum(self.weights.values())))
+            self.weights = {}
+            self.bar(self.column, self.column + 1, color, height)
+
+    def bar(self, first, end, color, height):
+        # Bar of `height` pixels over columns first..end-1
+        run = self.run
+        if run is not None and run[1] == first and run[2] == color and run[3] == height:
+            run[1] = end
+            return
+        self._flush()
+        self.run = [first, end, color, height]
+
+    def _flush(self):
+        run = self.run
+        if run is not None and run[3] > 0:
+            self.canvas.rect(self.x_origin + run[0], self.y_bottom - run[3],
+                             self.x_origin + run[1], self.y_bottom, run[2], self.outline)
+        self.run = None
+
+    def close(self):
+        self._close_column()
+        self._flush()
+
+
+def _columns(timeline):
+    # (starts, ends, names per slice or per pid, pids, levels) without building tuples
+    if hasattr(timeline, 'starts'):
+        return timeline.starts, timeline.ends, timeline.names.names, timeline.pids, timeline.levels
+    slices = list(timeline)
+    names = [name for _, _, name, _ in slices]
+    return ([s[0] for s in slices], [s[1] for s in slices], names,
+            range(len(slices)), [s[3] for s in slices])
+
+
+def queue_lengths(frames):
+    """(t, (len Q0, len Q1, len Q2)) for each frame; whole-queue counts in top-k frames."""
+    for frame in frames:
+        if 'queue_stats' in frame:
+            yield frame['t'], tuple(s['count'] for s in frame['queue_stats'])
+        else:
+            yield frame['t'], tuple(len(q) for q in frame['queues'])
+
+
+class QueueLengthBins:
+    """
+    Longest Q0/Q1/Q2 lengths per time bin, fed frame by frame (a scheduler
+    listener), in memory bounded by `max_bins`: when a frame falls past the
+    last bin, neighbouring bins are merged and the bin width doubles. Iterates
+    as (bin start, counts) like queue_lengths(), so it can go to render_gantt;
+    with max_bins at least the image width, no bin is wider than a pixel column.
+    """
+
+    def __init__(self, max_bins):
+        self.max_bins = max(2, int(max_bins))
+        self.bin_width = 1   # ticks per bin
+        self.peaks = [array('i') for _ in range(3)]   # -1 = no frame in the bin
+
+    def on_frame(self, frame):
+        for t, counts in queue_lengths([frame]):
+            self.add(t, counts)
+
+    def add(self, t, counts):
+        b = t // self.bin_width
+        while b >= self.max_bins:
+            self._merge()
+            b = t // self.bin_width
+        for level, column in enumerate(self.peaks):
+            if len(column) <= b:
+                column.extend([-1] * (b + 1 - len(column)))
+            if counts[level] > column[b]:
+                column[b] = counts[level]
+
+    def _merge(self):
+        for level, column in enumerate(self.peaks):
+            self.peaks[level] = array('i', (max(column[i:i + 2]) for i in range(0, len(column), 2)))
+        self.bin_width *= 2
+
+    def __iter__(self):
+        for b in range(len(self.peaks[0])):
+            counts = tuple(column[b] for column in self.peaks)
+            if counts[0] >= 0:
+                yield b * self.bin_width, counts
+
+
+# == Rendering ==
+
+def render_gantt(timeline, path, width=1600, format=None, queue_lengths=None, max_time=None):
+    """
+    Draw `timeline` (Timeline or (start, end, name, level) tuples in time order)
+    to `path` as 'svg' or 'png' (default: from the extension). `width` is the
+    width of the time axis in pixels. queue_lengths, e.g. from
+    queue_lengths(frames), shades each queue lane by how many processes wait in it.
+    """
+    if format is None:
+        format = 'png' if path.lower().endswith('.png') else 'svg'
+    if format not in ('svg', 'png'):
+        raise ValueError(f"Unknown image format: {format}")
+    starts, ends, names, pids, levels = _columns(timeline)
+    if max_time is None:
+        max_time = max(ends) if len(ends) else 0
+    span = max(1, max_time)
+    scale = width / span   # pixels per tick
+
+    image_width = LABEL_WIDTH + width + 10
+    image_height = HEADER_HEIGHT + 4 * CELL_HEIGHT + 20
+    canvas = SvgCanvas(path, image_width, image_height) if format == 'svg' else PngCanvas(path, image_width, image_height)
+
+    def x_of(t):
+        return LABEL_WIDTH + t * scale
+
+    # Lanes, labels and time axis
+    for row, header in enumerate(ROW_HEADERS):
+        y = HEADER_HEIGHT + row * CELL_HEIGHT
+        canvas.rect(LABEL_WIDTH, y, LABEL_WIDTH + width, y + CELL_HEIGHT, LANE_BACKGROUND,
+                    CPU_OUTLINE if row == CPU_ROW else LANE_OUTLINE, 2 if row == CPU_ROW else 1)
+        canvas.text(10, y + CELL_HEIGHT // 2, header, anchor='start', bold=True, size=10)
+        if row < CPU_ROW:
+            # Level color swatch (the only lane label a PNG has)
+            canvas.rect(LABEL_WIDTH - 8, y + 4, LABEL_WIDTH - 3, y + CELL_HEIGHT - 4, LEVEL_COLORS[row])
+    step = _tick_label_step(scale)
+    for t in range(0, max_time + 1, step):
+        canvas.text(x_of(t), HEADER_HEIGHT // 2, str(t))
+
+    if queue_lengths is not None:
+        _draw_queue_lengths(canvas, queue_lengths, scale, width)
+
+    colors = [process_color(name) for name in names]
+    if scale >= 1:
+        _draw_slices(canvas, starts, ends, names, colors, pids, levels, x_of)
+    else:
+        lanes = [_Lane(canvas, LABEL_WIDTH, HEADER_HEIGHT + (row + 1) * CELL_HEIGHT) for row in range(4)]
+        cpu = lanes[CPU_ROW]
+        for start, end, pid, level in zip(starts, ends, pids, levels):
+            x0, x1 = start * scale, end * scale
+            color = colors[pid]
+            if level < CPU_ROW:
+                lanes[level].add(x0, x1, color)
+            cpu.add(x0, x1, color)
+        for lane in lanes:
+            lane.close()
+    canvas.close()
+    return path
+
+
+def _draw_slices(canvas, starts, ends, names, colors, pids, levels, x_of):
+    # One rectangle per slice, in its queue lane and in the CPU lane (like the Results tab)
+    cpu_y = HEADER_HEIGHT + CPU_ROW * CELL_HEIGHT
+    for start, end, pid, level in zip(starts, ends, pids, levels):
+        x0, x1 = x_of(start), x_of(end)
+        color, name = colors[pid], names[pid]
+        show_name = x1 - x0 >= 24
+        rows = [(cpu_y, CPU_OUTLINE, 2)]
+        if level < CPU_ROW:
+            rows.insert(0, (HEADER_HEIGHT + level * CELL_HEIGHT, LANE_OUTLINE, 1))
+        for y, outline, width in rows:
+            canvas.rect(x0, y, x1, y + CELL_HEIGHT, color, outline, width)
+            if show_name:
+                canvas.text((x0 + x1) / 2, y + CELL_HEIGHT // 2, name, fill='#ffffff', bold=True)
+
+
+def _draw_queue_lengths(canvas, lengths, scale, width):
+    # Longest queue seen per pixel column, carried forward until the next frame
+    columns = [array('i', [-1]) * (width + 1) for _ in range(3)]
+    for t, counts in lengths:
+        c = min(width, int(t * scale))
+        for level in range(3):
+            if counts[level] > columns[level][c]:
+                columns[level][c] = counts[level]
+    for level, column in enumerate(columns):
+        peak = max(max(column), 1)
+        lane = _Lane(canvas, LABEL_WIDTH, HEADER_HEIGHT + (level + 1) * CELL_HEIGHT)
+        last = 0
+        for c in range(width):
+            if column[c] >= 0:
+                last = column[c]
+            lane.bar(c, c + 1, QUEUE_SHADE, round(CELL_HEIGHT * last / peak))
+        lane.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the MLFQ and draw its Gantt chart as SVG or PNG.")
+    parser.add_argument('file', help="process file (name arrival burst priority per line)")
+    parser.add_argument('out', help="image file (.svg or .png)")
+    parser.add_argument('--width', type=int, default=1600, help="width of the time axis in pixels")
+    parser.add_argument('--queues', action='store_true',
+                        help="shade queue lanes by queue length (records frames, slower)")
+    parser.add_argument('--no-preempt', action='store_true', help="run the MLFQ without preemption")
+    args = parser.parse_args(argv)
+
+    # load_defaults falls back to the built-in processes for a missing file
+    if not os.path.exists(args.file):
+        parser.error(f"no such file: {args.file}")
+    quantums, demote, aging, processes = load_defaults(args.file)
+    # The run's length isn't known yet, so bin at up to twice the pixel resolution
+    lengths = QueueLengthBins(2 * args.width) if args.queues else None
+
+    scheduler = SimpleMLFQScheduler(quantums=list(quantums), demote_threshold=demote,
+                                    aging_threshold=aging, preempt=not args.no_preempt,
+                                    snapshot_limit=0 if args.queues else None,
+                                    listeners=[lengths] if args.queues else None)
+    timeline = (scheduler.simulate_with_frames(processes, keep_frames=False) or ([],))[0]
+    render_gantt(timeline, args.out, args.width, queue_lengths=lengths)
+    print(f"Drew {len(timeline)} slices to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -23,9 +23,12 @@ IMPORTS AND DEPENDENCIES
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
-# Import threading for running simulations without freezing the GUI
-# (W3Schools, 2024, https://www.w3schools.com/python/python_threading.asp)
-import threading
+
+# Import time for wall-clock based animation playback
+import time
+
+# Import argparse for the command line options (--measure-startup)
+import argparse
 
 # Import os for file operations (W3Schools, 2024, https://www.w3schools.com/python/python_file_handling.asp)
 import os
@@ -33,12 +36,19 @@ import os
 # Import our custom classes for process management and scheduling
 from process import DEFAULT_PROCESSES, DEFAULT_QUANTUM, DEFAULT_DEMOTE_THRESHOLD, DEFAULT_AGING_THRESHOLD, load_defaults
 from scheduler import SimpleMLFQScheduler
+from process_table import ProcessTableModel
+from results_model import ResultsTableModel
+from timeline_index import TimelineIndex
+from sim_worker import SimulationRunner
+from swf import read_swf
 from gui_tabs.config_tab import setup_configuration_tab
 from gui_tabs.simulation_tab import setup_simulation_tab, repaint_animation_frame
 from gui_tabs.results_tab import setup_results_tab, populate_results_tab
-from drawing.queue_canvas import draw_queue_canvas
-from drawing.schedule_canvas import draw_schedule_timeline
-from drawing.timeline_grid import draw_timeline_grid
+from drawing.queue_canvas import draw_queue_canvas, QUEUE_BOXES_SHOWN
+from drawing.schedule_canvas import draw_schedule_timeline, SCHEDULE_BOXES_PER_QUEUE
+from drawing.item_pool import clear_item_pools
+from drawing.colors import PROCESS_COLORS, process_color
+from drawing.timeline_grid import draw_timeline_grid, schedule_timeline_grid_redraw, zoom_timeline_grid, timeline_grid_click
 
 """
 MAIN GUI CLASS
@@ -63,13 +73,16 @@ class MLFQGUI:
     - W3Schools. (2024). Python tkinter widgets. https://www.w3schools.com/python/python_tkinter_widgets.asp
     """
     
-    def __init__(self):
+    def __init__(self, measure_startup=False):
         """
         Initialize the MLFQ GUI application.
         
         This constructor method sets up the main window, creates all GUI components,
         and initializes the application state. It's called automatically when you
         create a new MLFQGUI object.
+
+        With measure_startup=True the startup times are printed and the window
+        closes again (see main's --measure-startup).
         
         References:
         - W3Schools. (2024). Python __init__ method. https://www.w3schools.com/python/python_classes.asp
@@ -78,6 +91,11 @@ class MLFQGUI:
         # =====================================================================
         # MAIN WINDOW SETUP
         # =====================================================================
+
+        # Startup timing: seconds since this point, by stage (see _finish_startup)
+        self._startup_began = time.perf_counter()
+        self.startup_times = {}
+        self.measure_startup = measure_startup
         
         # Create the main window (W3Schools, 2024, https://www.w3schools.com/python/python_tkinter.asp)
         self.root = tk.Tk()
@@ -131,12 +149,18 @@ class MLFQGUI:
         self._animating = False   # Flag to track if animation is currently playing
         self.anim_delay_ms = 300  # Animation speed in milliseconds (default corresponds to slider value 5)
         self._anim_after_id = None # ID for scheduled animation updates (used to cancel animations)
+        self.playback_multiplier = tk.IntVar(value=1)  # Multiplies the ticks per second set by the speed slider
+        self._play_start_time = 0.0  # Wall-clock time playback (re)started
+        self._play_start_frame = 0   # Frame shown when playback (re)started
+        self._sim_runner = None      # Worker process running the current simulation (if any)
+        self._streaming = False           # Frames are still arriving from the running simulation
+        self._frames_complete = True      # All frames of the current run have arrived
+        self._waiting_for_frames = False  # Playback caught up with the simulation and is waiting
 
         # Color Management for Process Visualization
         # Each process gets a unique color for easy identification in charts and timelines
         # (W3Schools, 2024, https://www.w3schools.com/colors/colors_hexadecimal.asp)
-        self.colors = ["#8B0000", "#DC143C", "#FF0000", "#FF4500", "#FF8C00", 
-                      "#228B22", "#32CD32", "#0000FF", "#4169E1", "#1E90FF"]
+        self.colors = list(PROCESS_COLORS)
         self.color_map = {}  # Dictionary mapping process names to their assigned colors
         
         # =====================================================================
@@ -145,7 +169,7 @@ class MLFQGUI:
         
         # Process Management Lists
         # These lists store different sets of processes that can be used in simulation
-        self.custom_processes = []       # User-defined processes from the GUI table
+        self.custom_processes = ProcessTableModel()  # User-defined processes shown in the GUI table
         self.loaded_file_path = None         # Path to the currently loaded process file
         self.loaded_file_processes = []     # Processes loaded from external files
         
@@ -156,6 +180,7 @@ class MLFQGUI:
         # Create all the GUI widgets and layout
         # This method builds the entire interface structure
         self.setup_gui()
+        self.startup_times['constructed'] = time.perf_counter() - self._startup_began
     
     """
     =============================================================================
@@ -321,10 +346,19 @@ class MLFQGUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=5)
         
-        # Create tabs
+        # Create tabs. Only the Configuration tab is built now; the other two
+        # start as empty frames and are filled in the first time they are needed
         self.setup_configuration_tab()
-        self.setup_simulation_tab()
-        self.setup_results_tab()
+        self.simulation_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.simulation_tab, text="Simulation")
+        self.results_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.results_tab, text="Simulation Results")
+        self._built_tabs = set()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+        # Load the default workload once the window has been drawn
+        # (the idle hop lets Tk paint the window first)
+        self.root.after_idle(lambda: self.root.after(0, self._finish_startup))
     
     """
     =============================================================================
@@ -341,6 +375,44 @@ class MLFQGUI:
 
     def setup_results_tab(self):
         return setup_results_tab(self)
+
+    def ensure_simulation_tab(self):
+        # Build the Simulation tab the first time it is shown or used
+        if 'simulation' not in self._built_tabs:
+            self._built_tabs.add('simulation')
+            self.setup_simulation_tab()
+
+    def ensure_results_tab(self):
+        # Build the Results tab the first time it is shown or used
+        if 'results' not in self._built_tabs:
+            self._built_tabs.add('results')
+            self.setup_results_tab()
+
+    def _on_tab_changed(self, event=None):
+        selected = self.notebook.select()
+        if selected == str(self.simulation_tab):
+            self.ensure_simulation_tab()
+        elif selected == str(self.results_tab):
+            self.ensure_results_tab()
+
+    def _finish_startup(self):
+        # Deferred from __init__ so the window shows up before the default
+        # workload is read and the process table is filled
+        self.startup_times['first_paint'] = time.perf_counter() - self._startup_began
+        self.toggle_custom_processes()
+        self.startup_times['ready'] = time.perf_counter() - self._startup_began
+
+        if self.measure_startup:
+            # Also time the tabs that are no longer built at startup, then quit
+            for name, build in (('simulation_tab', self.ensure_simulation_tab),
+                                ('results_tab', self.ensure_results_tab)):
+                began = time.perf_counter()
+                build()
+                self.root.update_idletasks()
+                self.startup_times[name] = time.perf_counter() - began
+            for name, seconds in self.startup_times.items():
+                print(f"{name:<16} {seconds * 1000:8.1f} ms")
+            self.root.after(0, self.root.destroy)
     
     def _repaint_animation_frame(self):
         return repaint_animation_frame(self)
@@ -351,9 +423,21 @@ class MLFQGUI:
     def _draw_schedule_timeline(self, frame):
         return draw_schedule_timeline(self, frame)
 
+    def _clear_item_pools(self):
+        return clear_item_pools(self)
+
     def _draw_timeline_grid(self):
         return draw_timeline_grid(self)
 
+    def _schedule_timeline_grid_redraw(self):
+        return schedule_timeline_grid_redraw(self)
+
+    def _zoom_timeline_grid(self, factor):
+        return zoom_timeline_grid(self, factor)
+
+    def _on_timeline_grid_click(self, event):
+        return timeline_grid_click(self, event)
+
     def _populate_results_tab(self):
         return populate_results_tab(self)
     
@@ -380,9 +464,6 @@ class MLFQGUI:
             self.demote_threshold.set(demote)
             self.aging_threshold.set(aging)
 
-            src = file_procs
-            for name, arrival, burst, priority in src[:n]:
-                self.process_tree.insert('', 'end', values=(name, arrival, burst, priority))  
         else:
             self.count_spinbox.config(state='normal')
             self.help_label.config(text="💡 Double-click on Arrival, Burst, or Priority to edit values.")
@@ -394,28 +475,22 @@ class MLFQGUI:
         if not use_defaults:
             # If we have a loaded file, use those processes
             if self.loaded_file_processes:
-                self.custom_processes = list(self.loaded_file_processes)
+                self.custom_processes = ProcessTableModel(self.loaded_file_processes)
             else:
-                # Otherwise, use currently visible rows
-                visible_rows = [self.process_tree.item(i, 'values') for i in self.process_tree.get_children()]
-                if visible_rows:
-                    self.custom_processes = [(str(nm), int(a), int(b), int(p)) for (nm, a, b, p) in visible_rows]
+                # Otherwise, use the rows currently in the table
+                if len(self.process_view.model):
+                    self.custom_processes = ProcessTableModel(self.process_view.model)
                 # If nothing visible yet (e.g., first time), fall back to defaults[:n]
-                if not self.custom_processes:
-                    self.custom_processes = list(DEFAULT_PROCESSES[:n])
-
-        # Clear table before repopulating
-        for item in self.process_tree.get_children():
-            self.process_tree.delete(item)
+                if not len(self.custom_processes):
+                    self.custom_processes = ProcessTableModel(DEFAULT_PROCESSES[:n])
 
+        # Point the table at the right model (only the visible rows get drawn)
         if use_defaults:
             # Exactly N defaults
-            for name, arrival, burst, priority in DEFAULT_PROCESSES[:n]:
-                self.process_tree.insert('', 'end', values=(name, arrival, burst, priority))
+            self.process_view.set_model(ProcessTableModel(DEFAULT_PROCESSES[:n]))
         else:
             # Use the seeded custom rows, then ensure we have exactly N
-            for name, arrival, burst, priority in self.custom_processes:
-                self.process_tree.insert('', 'end', values=(name, arrival, burst, priority)) 
+            self.process_view.set_model(self.custom_processes)
             self._ensure_custom_row_count(n)
 
         self.update_settings_display()
@@ -427,11 +502,8 @@ class MLFQGUI:
             return
         
         try:
-            # Read and validate all rows from the table
-            rows = [self.process_tree.item(i, 'values') for i in self.process_tree.get_children()]
-            validated_processes = []
-            
-            for i, (name, arrival, burst, priority) in enumerate(rows):
+            # Validate all rows of the table model (values are already ints)
+            for i, (name, arrival, burst, priority) in enumerate(self.custom_processes):
                 # Validate each field
                 try:
                     arrival_val = int(arrival)
@@ -445,22 +517,20 @@ class MLFQGUI:
                     if priority_val not in (1, 2, 3):
                         raise ValueError(f"Process {name}: Priority must be 1, 2, or 3")
                     
-                    validated_processes.append((str(name), arrival_val, burst_val, priority_val))
-                    
                 except ValueError as e:
                     messagebox.showerror("Validation Error", str(e))
                     return
             
-            # Update the custom processes list
-            self.custom_processes = validated_processes
+            # The table already edits self.custom_processes, nothing to copy
+            loaded = len(self.custom_processes)
             
             # Update status
-            self.custom_status_label.config(text=f"✓ Loaded {len(validated_processes)} custom processes", fg="#27ae60")
+            self.custom_status_label.config(text=f"✓ Loaded {loaded} custom processes", fg="#27ae60")
             
             # Update settings display
             self.update_settings_display()
             
-            messagebox.showinfo("Success", f"Successfully loaded {len(validated_processes)} custom processes!\nYou can now run the simulation.")
+            messagebox.showinfo("Success", f"Successfully loaded {loaded} custom processes!\nYou can now run the simulation.")
             
         except Exception as e:
             messagebox.showerror("Load Error", f"Error loading custom processes: {str(e)}")
@@ -471,7 +541,7 @@ class MLFQGUI:
         # Open file dialog
         file_path = filedialog.askopenfilename(
             title="Select Process File",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=[("Text files", "*.txt"), ("SWF traces", "*.swf"), ("All files", "*.*")]
         )
         
         if not file_path:
@@ -508,6 +578,10 @@ class MLFQGUI:
     
     def parse_process_file(self, file_path):
         """Simplified file parsing"""
+        # Job traces in the Standard Workload Format (see swf.py)
+        if file_path.lower().endswith('.swf'):
+            return list(read_swf(file_path))
+
         processes = []
         settings = {}
         
@@ -570,52 +644,30 @@ class MLFQGUI:
         messagebox.showinfo("File Cleared", "Uploaded file cleared. Using default processes.")
     
     
-    def _next_expected_name(self):
-        names = [self.process_tree.item(i, 'values')[0] for i in self.process_tree.get_children()]
-        nums = []
-        for nm in names:
-            if isinstance(nm, str) and nm.startswith('P') and nm[1:].isdigit():
-                nums.append(int(nm[1:]))
-        nxt = (max(nums) + 1) if nums else 1
-        return f"P{nxt}"
-
     def _ensure_custom_row_count(self, target_n):
         # Make table have exactly target_n rows; auto-add P# rows or trim from bottom.
-        current_iids = list(self.process_tree.get_children())
-        cur_n = len(current_iids)
-
-        # Add rows if fewer
-        while cur_n < target_n:
-            next_name = self._next_expected_name()     # e.g., 'P8'
-            try:
-                idx = int(next_name[1:]) - 1          # 0-based index into DEFAULT_PROCESSES
-            except ValueError:
-                idx = None
-
-            if idx is not None and 0 <= idx < len(DEFAULT_PROCESSES):
-                name, arrival, burst, priority = DEFAULT_PROCESSES[idx]
-                # Ensure the name matches the sequence we're enforcing
-                name = next_name
-            else:
-                # Fallback if we ran out of built-ins
-                name, arrival, burst, priority = next_name, 0, 1, 1
+        model = self.custom_processes
+        cur_n = len(model)
+
+        # Add rows if fewer (all at once, continuing the P# sequence)
+        if cur_n < target_n:
+            nxt = model.next_number()
+            new_rows = []
+            for num in range(nxt, nxt + target_n - cur_n):
+                idx = num - 1                          # 0-based index into DEFAULT_PROCESSES
+                if 0 <= idx < len(DEFAULT_PROCESSES):
+                    _, arrival, burst, priority = DEFAULT_PROCESSES[idx]
+                else:
+                    # Fallback if we ran out of built-ins
+                    arrival, burst, priority = 0, 1, 1
+                new_rows.append((f"P{num}", arrival, burst, priority))
+            model.extend(new_rows)
 
-            self.process_tree.insert('', 'end', values=(name, arrival, burst, priority))
-            if not self.use_default_processes.get():
-                self.custom_processes.append((name, arrival, burst, priority))
-            cur_n += 1
-        
         # Trim rows if more (remove from bottom)
-        while cur_n > target_n:
-            iid = self.process_tree.get_children()[-1]
-            vals = self.process_tree.item(iid, 'values')
-            self.process_tree.delete(iid)
-            if not self.use_default_processes.get():
-                try:
-                    self.custom_processes.remove((vals[0], int(vals[1]), int(vals[2]), int(vals[3])))
-                except ValueError:
-                    pass
-            cur_n -= 1
+        elif cur_n > target_n:
+            model.truncate(target_n)
+
+        self.process_view.refresh()
 
     def _on_tree_double_click(self, event):
         # For process customizations
@@ -632,7 +684,8 @@ class MLFQGUI:
 
         row_id = self.process_tree.identify_row(event.y)
         col_id = self.process_tree.identify_column(event.x)  # '#1'..'#4'
-        if not row_id or not col_id:
+        row_index = self.process_view.index_of(row_id)
+        if not row_id or not col_id or row_index is None:
             return
 
         # Column mapping: #1=Name (locked), #2=Arrival, #3=BT_Now, #4=PT_Now
@@ -646,8 +699,7 @@ class MLFQGUI:
         x, y, w, h = bbox
 
         # Current value
-        cur_vals = list(self.process_tree.item(row_id, "values"))
-        cur_text = cur_vals[int(col_id[1:]) - 1]
+        cur_text = self.custom_processes.row(row_index)[int(col_id[1:]) - 1]
 
         # Create an Entry overlayed on the cell
         self._cell_editor = tk.Entry(self.process_tree)
@@ -657,18 +709,19 @@ class MLFQGUI:
         self._cell_editor.place(x=x, y=y, width=w, height=h)
 
         # Commit/cancel
-        self._cell_editor.bind("<Return>",      lambda e: self._commit_cell_edit(row_id, col_id))
-        self._cell_editor.bind("<KP_Enter>",    lambda e: self._commit_cell_edit(row_id, col_id))
+        # (row_index is the model row, so scrolling while editing doesn't move the edit)
+        self._cell_editor.bind("<Return>",      lambda e: self._commit_cell_edit(row_index, col_id))
+        self._cell_editor.bind("<KP_Enter>",    lambda e: self._commit_cell_edit(row_index, col_id))
         self._cell_editor.bind("<Escape>",      lambda e: self._cancel_cell_edit())
-        self._cell_editor.bind("<FocusOut>",    lambda e: self._commit_cell_edit(row_id, col_id))
+        self._cell_editor.bind("<FocusOut>",    lambda e: self._commit_cell_edit(row_index, col_id))
 
     def _cancel_cell_edit(self):
         if hasattr(self, "_cell_editor") and self._cell_editor:
             self._cell_editor.destroy()
             self._cell_editor = None
 
-    def _commit_cell_edit(self, row_id, col_id):
-        # Validate input, write back to Treeview, and sync self.custom_processes.
+    def _commit_cell_edit(self, row_index, col_id):
+        # Validate input and write it into the custom_processes model (one cell).
         if not hasattr(self, "_cell_editor") or not self._cell_editor:
             return
         new_text = self._cell_editor.get().strip()
@@ -697,34 +750,23 @@ class MLFQGUI:
                 messagebox.showerror("Invalid PT_Now", "PT_Now must be between 1 and 3.")
                 return
 
-        # Write back to Treeview
-        values = list(self.process_tree.item(row_id, "values"))
-        values[idx] = str(val)
-        self.process_tree.item(row_id, values=values)
-
-        # Sync custom_processes (custom mode only)
+        # Write to the model, then redraw that row if it is on screen
         if not self.use_default_processes.get():
-            rows = [self.process_tree.item(i, 'values') for i in self.process_tree.get_children()]
-            self.custom_processes = [(str(n), int(a), int(b), int(p)) for (n, a, b, p) in rows]
+            self.custom_processes.set_value(row_index, idx, val)
+            self.process_view.refresh_row(row_index)
 
     def on_num_processes_changed(self):
         # Keep the table in sync with the requested count in both modes.
         n = max(1, int(self.num_processes.get()))
         if self.use_default_processes.get():
             # repopulate exactly N defaults
-            for item in self.process_tree.get_children():
-                self.process_tree.delete(item)
-            for name, arrival, burst, priority in DEFAULT_PROCESSES[:n]:
-                self.process_tree.insert('', 'end', values=(name, arrival, burst, priority))
+            self.process_view.set_model(ProcessTableModel(DEFAULT_PROCESSES[:n]))
         else:
             # If custom list is empty (first-time custom), seed from defaults[:n]
-            if not self.custom_processes:
-                self.custom_processes = list(DEFAULT_PROCESSES[:n])
+            if not len(self.custom_processes):
+                self.custom_processes = ProcessTableModel(DEFAULT_PROCESSES[:n])
                 # also reflect in the table immediately
-                for item in self.process_tree.get_children():
-                    self.process_tree.delete(item)
-                for name, arrival, burst, priority in self.custom_processes:
-                    self.process_tree.insert('', 'end', values=(name, arrival, burst, priority))
+                self.process_view.set_model(self.custom_processes)
             # then enforce exact N in custom mode (adds beyond using remaining defaults if available)
             self._ensure_custom_row_count(n)
 
@@ -734,6 +776,8 @@ class MLFQGUI:
     def update_settings_display(self):
         # Update the settings display in the simulation tab.
         # Uses tkinter Text widget methods to update display (W3Schools: Python Tkinter Text)
+        if not hasattr(self, "settings_text"):
+            return  # Simulation tab not built yet; it fills this in when it is
         self.settings_text.config(state='normal')
         self.settings_text.delete('1.0', 'end')
         
@@ -762,71 +806,151 @@ class MLFQGUI:
         self.settings_text.config(state='disabled')
     
     def run_simulation(self):
-        # Run the MLFQ simulation in a separate thread.
-        # Uses threading to prevent GUI freezing (GeeksforGeeks: Python Threading)
+        # Run the MLFQ simulation in a separate worker process.
+        # A process (not a thread) keeps the GUI smooth even for heavy runs,
+        # and lets the run be cancelled.
+        if self._sim_runner is not None and self._sim_runner.is_running():
+            return  # A simulation is already running
+
+        # A run shows up in both tabs
+        self.ensure_simulation_tab()
+        self.ensure_results_tab()
+
+        try:
+            processes = self._collect_processes()
+            config = {
+                'quantums': [self.quantum_q0.get(), self.quantum_q1.get(), self.quantum_q2.get()],
+                'demote_threshold': self.demote_threshold.get(),
+                'aging_threshold': self.aging_threshold.get(),
+                'preempt': self.preempt.get(),
+                # Frames only need as many queued processes as the views can show
+                'snapshot_limit': max(QUEUE_BOXES_SHOWN, SCHEDULE_BOXES_PER_QUEUE),
+            }
+        except (ValueError, tk.TclError) as e:
+            self._show_error(str(e))
+            return
+
         self.play_btn.config(state='disabled')
+        self.cancel_btn.config(state='normal')
         self.status_label.config(text="Running simulation...")
-        
-        # Uses threading.Thread to run simulation in background (W3Schools: Python Threading)
-        t = threading.Thread(target=self._run_simulation_background, daemon=True)
-        t.start()
-    
-    def _run_simulation_background(self):
-        # Run the actual simulation in the background thread.
-        try:
-            # Get processes to use
-            if self.use_default_processes.get():
-                # Uses slicing to get the right number of default processes (GeeksforGeeks: Python List Slicing)
-                processes = DEFAULT_PROCESSES[:self.num_processes.get()]
-            else:
-                 # Read rows directly from the table to use the visible configuration
-                rows  = [self.process_tree.item(i, 'values') for i in self.process_tree.get_children()]
-                processes = [
-                    (str(name), int(arrival), int(burst), int(priority))
-                    for (name, arrival, burst, priority) in rows
-                ][:self.num_processes.get()]
-            
-            # Create scheduler with separate quantums for each queue
-            scheduler = SimpleMLFQScheduler(
-                quantums=[self.quantum_q0.get(), self.quantum_q1.get(), self.quantum_q2.get()],
-                demote_threshold=self.demote_threshold.get(),
-                aging_threshold=self.aging_threshold.get(),
-                preempt=self.preempt.get()
-            )
-            
-            # Run simulation
-            timeline, results, frames = scheduler.simulate_with_frames(processes)
-            
-            # Update GUI in main thread
-            # Uses tkinter.after to update GUI from background thread (GeeksforGeeks: Python Tkinter Threading)
-            self.root.after(0, self._display_results, timeline, results, frames)
-            
-        except Exception as e:
-            # Uses tkinter.after to show error in main thread
-            self.root.after(0, self._show_error, str(e))
-    
-    def _display_results(self, timeline, results, frames):
-        self.notebook.select(self.simulation_tab)
+        self._sim_total = len(processes)
+
+        # Frames are spilled to a memory-mapped file, so long runs don't fill RAM
+        self._sim_runner = SimulationRunner(processes, config, on_disk=True)
+        self._sim_runner.start()
+        self.root.after(50, self._poll_simulation)
 
+    def _collect_processes(self):
+        # Get processes to use (read on the GUI thread, before the worker starts)
+        if self.use_default_processes.get():
+            # Uses slicing to get the right number of default processes (GeeksforGeeks: Python List Slicing)
+            return DEFAULT_PROCESSES[:self.num_processes.get()]
+        # Read rows from the table model to use the visible configuration
+        return self.process_view.model.to_list(self.num_processes.get())
+
+    def _poll_simulation(self):
+        # Handle messages from the worker process, then check again shortly.
+        runner = self._sim_runner
+        if runner is None:
+            return
+        for msg in runner.poll():
+            if msg[0] == 'progress':
+                _, tick, completed = msg
+                self.status_label.config(
+                    text=f"Running simulation... tick {tick}, {completed}/{self._sim_total} processes completed")
+            elif msg[0] == 'frames':
+                # Ignore late chunks from a run that is being cancelled
+                if not runner.cancel_event.is_set():
+                    self._on_frames_arrived(msg[1])
+            elif msg[0] == 'done':
+                self.cancel_btn.config(state='disabled')
+                self._display_results(*msg[1:])
+            elif msg[0] == 'cancelled':
+                self.cancel_btn.config(state='disabled')
+                self.play_btn.config(state='normal')
+                if self._waiting_for_frames:
+                    # Playback had caught up and was waiting for more frames
+                    self.pause_animation()
+                self._streaming = False
+                self._frames_complete = True
+                self._waiting_for_frames = False
+                self.status_label.config(text="Simulation cancelled.")
+            elif msg[0] == 'error':
+                self.cancel_btn.config(state='disabled')
+                self._show_error(msg[1])
+        if runner.is_running():
+            self.root.after(50, self._poll_simulation)
+        else:
+            self._sim_runner = None
+
+    def cancel_simulation(self):
+        # Ask the worker process to stop; it answers with a 'cancelled' message.
+        if self._sim_runner is not None and self._sim_runner.is_running():
+            self._sim_runner.cancel()
+            self.cancel_btn.config(state='disabled')
+            self.status_label.config(text="Cancelling simulation...")
+    
+    def _display_results(self, timeline, results, frames, metrics=None):
         # store data for later
         self.timeline = timeline or []
+        # Built once per run; rendering, seeking and the summary query it
+        self.timeline_index = TimelineIndex(self.timeline)
         self.results  = results or []
-        self.frames   = frames or []
+        self.metrics  = metrics
+        self._frames_complete = True
+
+        if self._streaming:
+            # The animation is already playing the streamed frames
+            self._streaming = False
+            self._update_frame_count(frames)
+            if self._waiting_for_frames:
+                # Playback had caught up, so it was on the last frame
+                self._waiting_for_frames = False
+                self._animating = False
+                self._on_animation_finished()
+            return
+
+        self._start_playback(frames)
+        self.status_label.config(text="Simulation ready. Use ▶, Next, or Prev.")
+
+    def _on_frames_arrived(self, frames):
+        # First chunk of frames: start the animation while the simulation keeps running.
+        if not self._streaming:
+            self._streaming = True
+            self._frames_complete = False
+            self._start_playback(frames)
+            self.status_label.config(text="Simulation running, playing animation…")
+            return
 
-        # UI status
-        self.status_label.config(text="Simulation completed. Playing animation…")
+        self._update_frame_count(frames)
+        if self._waiting_for_frames and self._animating:
+            # Playback had caught up with the simulation, continue
+            self._waiting_for_frames = False
+            self.status_label.config(text="Simulation running, playing animation…")
+            self._restart_playback_clock()
+            self._schedule_next_tick()
+
+    def _update_frame_count(self, frames):
+        self.frames = frames
+        self.anim_total = len(frames)
+        self.scrub_slider.config(to=max(0, self.anim_total - 1))
+        self.update_tick_display()
+        if not self._animating:
+            self.next_tick_btn.config(state=('normal' if self.frame_i < self.anim_total - 1 else 'disabled'))
+
+    def _start_playback(self, frames):
+        self.notebook.select(self.simulation_tab)
+        self.frames = frames or []
 
         # reset animation state
         self.frame_i = 0
         self.anim_total = len(self.frames)
         self._animating = False
         self._anim_after_id = None
-        self.status_label.config(text="Simulation ready. Use ▶, Next, or Prev.")
+        self._waiting_for_frames = False
 
-        # clear canvases before first paint
-        for c in getattr(self, 'queue_canvases', []):
-            c.delete('all')
-        self.schedule_canvas.delete('all')
+        # clear canvases before first paint (drops the retained animation items)
+        self._clear_item_pools()
 
         # prime buttons
         self.play_btn.config(state=('normal' if self.anim_total > 0 else 'disabled'))
@@ -834,6 +958,7 @@ class MLFQGUI:
         self.reset_btn.config(state=('normal' if self.anim_total > 0 else 'disabled'))
         self.prev_tick_btn.config(state='disabled')
         self.next_tick_btn.config(state=('normal' if self.anim_total > 1 else 'disabled'))
+        self.scrub_slider.config(to=max(0, self.anim_total - 1))
 
         # paint tick 0 immediately
         if self.anim_total > 0:
@@ -871,21 +996,9 @@ class MLFQGUI:
 
     
     def _color_for(self, pid):
-        """Simplified color mapping"""
-        if not pid:
-            return "#808080"  # Gray for idle
-        
+        """Simplified color mapping (same colors as gantt_render.py, see drawing/colors.py)"""
         if pid not in self.color_map:
-            try:
-                if pid.startswith('P') and pid[1:].isdigit():
-                    process_num = int(pid[1:])
-                    color_index = (process_num - 1) % len(self.colors)
-                    self.color_map[pid] = self.colors[color_index]
-                else:
-                    self.color_map[pid] = "#808080"  # Gray fallback
-            except:
-                self.color_map[pid] = "#808080"  # Gray fallback
-        
+            self.color_map[pid] = process_color(pid, self.colors)
         return self.color_map[pid]
 
     def play_animation(self):
@@ -897,11 +1010,65 @@ class MLFQGUI:
         self.pause_btn.config(state='normal')
         self.prev_tick_btn.config(state='disabled')
         self.next_tick_btn.config(state='disabled')
+        self._restart_playback_clock()
         self._schedule_next_tick()
 
+    def _restart_playback_clock(self):
+        # Playback is time based: frame k is due (k - start frame) / rate seconds after the start
+        self._play_start_time = time.perf_counter()
+        self._play_start_frame = self.frame_i
+
+    def _playback_rate(self):
+        # Simulated ticks per second (speed slider delay times the rate multiplier)
+        try:
+            multiplier = max(1, int(self.playback_multiplier.get()))
+        except (tk.TclError, ValueError):
+            multiplier = 1
+        return (1000.0 / self.anim_delay_ms) * multiplier
+
+    def on_playback_rate_changed(self):
+        # Apply a new speed or multiplier without jumping in the animation
+        if self._animating:
+            if self._anim_after_id is not None:
+                self.root.after_cancel(self._anim_after_id)
+                self._anim_after_id = None
+            self._restart_playback_clock()
+            self._schedule_next_tick()
+
+    def on_scrub(self, value):
+        # Jump straight to the tick picked on the scrub slider.
+        if not self.frames:
+            return
+        i = max(0, min(self.anim_total - 1, int(float(value))))
+        if i == self.frame_i:
+            return
+        self.frame_i = i
+        self._repaint_animation_frame()
+
+        if self._animating:
+            # Keep playing from the new position
+            self._restart_playback_clock()
+        else:
+            self.prev_tick_btn.config(state=('normal' if self.frame_i > 0 else 'disabled'))
+            self.next_tick_btn.config(state=('normal' if self.frame_i < self.anim_total - 1 else 'disabled'))
+
+    def _seek_animation_to_time(self, t):
+        # Show the last animation frame at or before tick t (frames are in time order).
+        if not self.frames or not self.anim_total:
+            return
+        lo, hi = 0, self.anim_total - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.frames[mid]['t'] <= t:
+                lo = mid
+            else:
+                hi = mid - 1
+        self.on_scrub(lo)
+
     def pause_animation(self):
         # Pause the automated animation.
         self._animating = False
+        self._waiting_for_frames = False
         if getattr(self, '_anim_after_id', None):
             self.root.after_cancel(self._anim_after_id)
             self._anim_after_id = None
@@ -923,9 +1090,7 @@ class MLFQGUI:
         self.frame_i = 0
         
         # Clear and redraw all canvases
-        for canvas in self.queue_canvases:
-            canvas.delete('all')
-        self.schedule_canvas.delete('all')
+        self._clear_item_pools()
         
         # Draw initial frame if available
         if self.frames:
@@ -976,11 +1141,7 @@ class MLFQGUI:
         self.anim_delay_ms = 50 * (11 - v)   # 1→500ms, 10→50ms
 
         # If we're currently animating, apply the new delay immediately
-        if self._animating:
-            if self._anim_after_id is not None:
-                self.root.after_cancel(self._anim_after_id)
-                self._anim_after_id = None
-            self._schedule_next_tick()
+        self.on_playback_rate_changed()
 
     def update_tick_display(self):
         # Update the tick display label.
@@ -1013,15 +1174,30 @@ class MLFQGUI:
 
     def _schedule_next_tick(self):
         if self._animating:
-            self._anim_after_id = self.root.after(self.anim_delay_ms, self._animate_step)
+            # Wake up when the next frame is due, but not more often than ~60 times a second
+            due = self._play_start_time + (self.frame_i + 1 - self._play_start_frame) / self._playback_rate()
+            delay_ms = max(15, int((due - time.perf_counter()) * 1000))
+            self._anim_after_id = self.root.after(delay_ms, self._animate_step)
 
 
     def _animate_step(self):
         if not self._animating:
             return
 
+        # Show the frame that is due now. If drawing fell behind, the frames
+        # in between are skipped; if it keeps up, every frame is shown.
+        elapsed = time.perf_counter() - self._play_start_time
+        target = self._play_start_frame + int(elapsed * self._playback_rate())
+        self.frame_i = max(self.frame_i, min(target, self.anim_total - 1))
+
         if self.frame_i >= self.anim_total - 1:
             self._repaint_animation_frame()
+            if not self._frames_complete:
+                # Caught up with the simulation: wait here until the next chunk arrives
+                self._waiting_for_frames = True
+                self._anim_after_id = None
+                self.status_label.config(text="Waiting for the simulation…")
+                return
             self._animating = False
             
             if self._anim_after_id is not None:
@@ -1030,7 +1206,6 @@ class MLFQGUI:
             self._on_animation_finished()
             return
         self._repaint_animation_frame()
-        self.frame_i += 1
         self._schedule_next_tick()
 
     def _fill_queue_listboxes(self, fr):
@@ -1047,36 +1222,44 @@ class MLFQGUI:
         self.play_btn.config(state='normal')
 
     def _clear_previous_run_outputs(self):
-        # stop any in-flight animation
+        # stop any in-flight simulation and animation
+        if self._sim_runner is not None and self._sim_runner.is_running():
+            self._sim_runner.cancel()
+        self._streaming = False
+        self._frames_complete = True
+        self._waiting_for_frames = False
         self._animating = False
         if getattr(self, "_anim_after_id", None):
             self.root.after_cancel(self._anim_after_id)
             self._anim_after_id = None
 
-        # forget old data
+        # forget old data (and delete the on-disk frame file, if any)
+        if hasattr(self.frames, 'close'):
+            self.frames.close()
         self.frames = []
         self.timeline = []
+        self.timeline_index = TimelineIndex([])
         self.results = []
+        self.metrics = None
         self.frame_i = 0
         self.anim_total = 0
         self.color_map.clear()  # optional: new colors each run
 
         # clear canvases
-        for c in getattr(self, "queue_canvases", []):
-            c.delete("all")
-        if hasattr(self, "schedule_canvas"):
-            self.schedule_canvas.delete("all")
+        self._clear_item_pools()
         if hasattr(self, "timeline_grid_canvas"):
             self.timeline_grid_canvas.delete("all")
 
         # clear text widgets/tables
-        if hasattr(self, "timeline_text"):
-            self.timeline_text.delete("1.0", "end")
+        if hasattr(self, "timeline_text_view"):
+            self.timeline_text_view.set_model(())
+        if hasattr(self, "timeline_info_label"):
+            self.timeline_info_label.config(text="")
         if hasattr(self, "summary_text"):
             self.summary_text.delete("1.0", "end")
-        if hasattr(self, "results_tree"):
-            for iid in self.results_tree.get_children():
-                self.results_tree.delete(iid)
+        if hasattr(self, "results_view"):
+            self.results_view.set_model(ResultsTableModel())
+            self.results_count_label.config(text="")
 
         # reset status labels
         if hasattr(self, "timer_label"):
@@ -1087,6 +1270,9 @@ class MLFQGUI:
             self.execution_time_label.config(text="Execution Time: 0")
         if hasattr(self, "tick_label"):
             self.tick_label.config(text="Tick: 0/0")
+        if hasattr(self, "scrub_slider"):
+            self.scrub_var.set(0)
+            self.scrub_slider.config(to=0)
 
         # reset buttons
         if hasattr(self, "play_btn"):
@@ -1112,20 +1298,28 @@ APPLICATION ENTRY POINT
 =============================================================================
 """
 
-def main():
+def main(argv=None):
     """
     Main function to start the MLFQ GUI application.
     
     This function creates an instance of the MLFQGUI class and starts the
     application. It includes error handling to gracefully manage any startup
     issues and display helpful error messages to the user.
+
+    `python gui.py --measure-startup` prints how long the window took to be
+    built, drawn and ready (plus the lazily built tabs) and exits.
     
     References:
     - W3Schools. (2024). Python try except. https://www.w3schools.com/python/python_try_except.asp
     """
+    parser = argparse.ArgumentParser(description="MLFQ CPU Scheduler Simulator")
+    parser.add_argument('--measure-startup', action='store_true',
+                        help="print startup times and exit")
+    args = parser.parse_args(argv)
+
     try:
         # Create and run the GUI application
-        app = MLFQGUI()
+        app = MLFQGUI(measure_startup=args.measure_startup)
         app.run()
     except Exception as e:
         # If there's an error during startup, show an error message
@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
 
+from process_table import ProcessTableModel
+from gui_tabs.virtual_tree import VirtualTreeview
+
 def setup_configuration_tab(self):
         """
         Create the Configuration tab interface.
@@ -68,25 +71,14 @@ def setup_configuration_tab(self):
                                   font=("Arial", 9), fg="#666666")
         self.help_label.pack(anchor='w', padx=5, pady=(5, 0))
         
-        # Process tree
-        list_frame = tk.Frame(self.custom_frame)
-        list_frame.pack(fill='both', expand=True, padx=5, pady=5)
-        
+        # Process tree (virtual: only the rows on screen exist as Treeview items)
         columns = ('Name', 'Arrival', 'Burst', 'Priority')
-        self.process_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=8)
-        
-        for col in columns:
-            self.process_tree.heading(col, text=col)
-            self.process_tree.column(col, width=100)
+        self.process_view = VirtualTreeview(self.custom_frame, columns, model=ProcessTableModel(), height=8)
+        self.process_view.pack(fill='both', expand=True, padx=5, pady=5)
+        self.process_tree = self.process_view.tree
 
         self.process_tree.bind("<Double-1>", self._on_tree_double_click)
         
-        scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.process_tree.yview)
-        self.process_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.process_tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
         # Load custom processes button
         button_frame = tk.Frame(self.custom_frame)
         button_frame.pack(fill='x', padx=5, pady=5)
@@ -1,5 +1,10 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, messagebox
+
+from metrics import MetricsAggregator
+from results_model import ResultsTableModel, TimelineTextModel, RESULT_COLUMNS
+from gui_tabs.virtual_tree import VirtualTreeview
+from gui_tabs.virtual_text import VirtualText
 
 def setup_results_tab(self):
         """
@@ -14,9 +19,7 @@ def setup_results_tab(self):
         References:
         - W3Schools. (2024). Python tkinter grid. https://www.w3schools.com/python/python_tkinter_grid.asp
         """
-        self.results_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.results_tab, text="Simulation Results")
-        
+        # The tab's frame already exists (MLFQGUI.setup_gui); this fills it in
         main_container = tk.Frame(self.results_tab)
         main_container.pack(fill='both', expand=True, padx=10, pady=5)
         
@@ -24,6 +27,16 @@ def setup_results_tab(self):
         timeline_grid_frame = self.create_label_frame(main_container, "Animation - Simulation Timeline")
         timeline_grid_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
+        # Zoom controls (zooming far out switches to utilization bands)
+        zoom_bar = tk.Frame(timeline_grid_frame)
+        zoom_bar.pack(fill='x', padx=5, pady=(5, 0))
+        self.create_button(zoom_bar, "🔍 +", lambda: self._zoom_timeline_grid(2), width=5).pack(side='left', padx=2)
+        self.create_button(zoom_bar, "🔍 −", lambda: self._zoom_timeline_grid(0.5), width=5).pack(side='left', padx=2)
+        self.create_button(zoom_bar, "Fit", lambda: self._zoom_timeline_grid(None), width=5).pack(side='left', padx=2)
+        # What ran at the clicked tick (clicking also seeks the animation there)
+        self.timeline_info_label = tk.Label(zoom_bar, text="", font=("Arial", 9), fg="#666666")
+        self.timeline_info_label.pack(side='left', padx=10)
+
         timeline_container = tk.Frame(timeline_grid_frame)
         timeline_container.pack(fill='both', expand=True, padx=5, pady=5)
         
@@ -31,7 +44,14 @@ def setup_results_tab(self):
         
         timeline_v_scrollbar = ttk.Scrollbar(timeline_container, orient='vertical', command=self.timeline_grid_canvas.yview)
         timeline_h_scrollbar = ttk.Scrollbar(timeline_container, orient='horizontal', command=self.timeline_grid_canvas.xview)
-        self.timeline_grid_canvas.configure(yscrollcommand=timeline_v_scrollbar.set, xscrollcommand=timeline_h_scrollbar.set)
+
+        # Horizontal scrolling also redraws the grid, since only the visible columns exist
+        def _on_timeline_grid_xscroll(*args):
+            timeline_h_scrollbar.set(*args)
+            self._schedule_timeline_grid_redraw()
+
+        self.timeline_grid_canvas.configure(yscrollcommand=timeline_v_scrollbar.set, xscrollcommand=_on_timeline_grid_xscroll)
+        self.timeline_grid_canvas.bind('<Configure>', lambda e: self._schedule_timeline_grid_redraw(), add='+')
         
         # Vvbox for scroll bars
         self.timeline_grid_canvas.grid(row=0, column=0, sticky='nsew')
@@ -44,42 +64,51 @@ def setup_results_tab(self):
         
         # Add mouse wheel scrolling support for timeline grid canvas
         self._bind_mousewheel_to_canvas(self.timeline_grid_canvas)
+        self.timeline_grid_canvas.bind('<Button-1>', self._on_timeline_grid_click, add='+')
         
         # Timeline text
         timeline_text_frame = self.create_label_frame(main_container, "Detailed Timeline")
         timeline_text_frame.pack(fill='x', padx=5, pady=5)
         
-        self.timeline_text = scrolledtext.ScrolledText(timeline_text_frame, height=8, wrap='word', font=("Courier", 9))
-        self.timeline_text.pack(fill='both', expand=True, padx=5, pady=5)
+        # Paged: only the lines on screen are formatted and put in the widget
+        self.timeline_text_view = VirtualText(timeline_text_frame, height=8, font=("Courier", 9))
+        self.timeline_text_view.pack(fill='both', expand=True, padx=5, pady=5)
+        self.timeline_text = self.timeline_text_view.text
         
         # Results table
         results_table_frame = self.create_label_frame(main_container, "Process Results Summary")
         results_table_frame.pack(fill='x', padx=5, pady=5)
         
-        # Create container for results table with scrollbars
-        results_container = tk.Frame(results_table_frame)
-        results_container.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        columns = ('Process', 'Arrival', 'BT_Now', 'PT_Now', 'First Start', 'Completion', 'Turnaround', 'WT_Now', 'Response')
-        self.results_tree = ttk.Treeview(results_container, columns=columns, show='headings', height=6)
+        # Filter bar: column + text (a number with optional >, <, >=, <= for numeric columns)
+        filter_bar = tk.Frame(results_table_frame)
+        filter_bar.pack(fill='x', padx=5, pady=(5, 0))
+        tk.Label(filter_bar, text="Filter:", font=("Arial", 9)).pack(side='left')
+        self.results_filter_column = ttk.Combobox(filter_bar, values=RESULT_COLUMNS, state='readonly', width=12)
+        self.results_filter_column.current(0)
+        self.results_filter_column.pack(side='left', padx=5)
+        self.results_filter_entry = tk.Entry(filter_bar, width=15)
+        self.results_filter_entry.pack(side='left', padx=5)
+        self.results_filter_entry.bind("<Return>", lambda e: apply_results_filter(self))
+        self.create_button(filter_bar, "Apply", lambda: apply_results_filter(self), width=6).pack(side='left', padx=2)
+        self.create_button(filter_bar, "Clear", lambda: clear_results_filter(self), width=6).pack(side='left', padx=2)
+        self.results_count_label = tk.Label(filter_bar, text="", font=("Arial", 9), fg="#666666")
+        self.results_count_label.pack(side='left', padx=10)
+
+        # Virtual table: rows come from a ResultsTableModel, only visible ones are Treeview items
+        self.results_view = VirtualTreeview(results_table_frame, RESULT_COLUMNS, model=ResultsTableModel(), height=6)
+        self.results_tree = self.results_view.tree
 
         column_widths = {'Process': 60, 'Arrival': 60, 'BT_Now': 60, 'PT_Now': 60, 'First Start': 80, 'Completion': 80, 'Turnaround': 80, 'WT_Now': 70, 'Response': 70}
-        for col in columns:
-            self.results_tree.heading(col, text=col)
+        for i, col in enumerate(RESULT_COLUMNS):
+            # Clicking a heading sorts by that column (again to reverse)
+            self.results_tree.heading(col, command=lambda c=i: sort_results_table(self, c))
             self.results_tree.column(col, width=column_widths.get(col, 60))
         
-        # Vertical scrollbar
-        results_v_scrollbar = ttk.Scrollbar(results_container, orient='vertical', command=self.results_tree.yview)
         # Horizontal scrollbar
-        results_h_scrollbar = ttk.Scrollbar(results_container, orient='horizontal', command=self.results_tree.xview)
-        
-        # Configure both scrollbars
-        self.results_tree.configure(yscrollcommand=results_v_scrollbar.set, xscrollcommand=results_h_scrollbar.set)
-        
-        # Pack the table and scrollbars
-        self.results_tree.pack(side='left', fill='both', expand=True)
-        results_v_scrollbar.pack(side='right', fill='y')
+        results_h_scrollbar = ttk.Scrollbar(self.results_view.frame, orient='horizontal', command=self.results_tree.xview)
+        self.results_tree.configure(xscrollcommand=results_h_scrollbar.set)
         results_h_scrollbar.pack(side='bottom', fill='x')
+        self.results_view.pack(fill='both', expand=True, padx=5, pady=5)
         
         # Summary
         summary_frame = self.create_label_frame(self.results_tab, "Summary Statistics")
@@ -94,102 +123,86 @@ def populate_results_tab(self):
         # Draw the timeline grid visualization
         self._draw_timeline_grid()
         
-        # ---- Enhanced Timeline text ----
-        self.timeline_text.delete('1.0', 'end')
-        
-        # Header section
-        timeline_text = "=" * 80 + "\n"
-        timeline_text += "MLFQ CPU SCHEDULER - EXECUTION TIMELINE\n"
-        timeline_text += "=" * 80 + "\n\n"
-        
-        # Scheduling Rules Section
-        timeline_text += "SCHEDULING RULES:\n"
-        timeline_text += "-" * 40 + "\n"
-        timeline_text += f"• Time Quantum Q0 (Highest): {self.quantum_q0.get()} time units\n"
-        timeline_text += f"• Time Quantum Q1 (Medium): {self.quantum_q1.get()} time units\n"
-        timeline_text += f"• Time Quantum Q2 (Lowest): {self.quantum_q2.get()} time units\n"
-        timeline_text += f"• Demotion Threshold: {self.demote_threshold.get()} time units\n"
-        timeline_text += f"• Aging Threshold: {self.aging_threshold.get()} time units\n"
-        timeline_text += f"• Preemption: {'Enabled' if self.preempt.get() else 'Disabled'}\n\n"
-        
-        # Process Details Section
-        timeline_text += "PROCESS DETAILS:\n"
-        timeline_text += "-" * 40 + "\n"
-        timeline_text += f"{'Process':<10} {'PT_Now':<8} {'Arrival':<7} {'BT_Now':<6} {'PT_Used':<7} {'Completion':<10} {'Turnaround':<10} {'WT_Now':<8}\n"
-        timeline_text += "-" * 80 + "\n"
-        
-        for r in self.results:
-            pt_used = r['burst'] - (r['burst'] - r.get('remaining', 0)) if 'remaining' in r else r['burst']
-            timeline_text += f"{r['name']:<10} {r['priority']:<8} {r['arrival']:<7} {r['burst']:<6} {pt_used:<7} "
-            timeline_text += f"{r['completion'] if r['completion'] is not None else 'N/A':<10} "
-            timeline_text += f"{r['turnaround'] if r['turnaround'] is not None else 'N/A':<10} "
-            timeline_text += f"{r['waiting']:<8}\n"
-        
-        timeline_text += "\n"
-        
-        # Execution Timeline Section
-        timeline_text += "EXECUTION TIMELINE:\n"
-        timeline_text += "-" * 40 + "\n"
-        timeline_text += "Time | Process | Queue | Action\n"
-        timeline_text += "-" * 40 + "\n"
-        
-        if self.timeline:
-            for start, end, process, queue in self.timeline:
-                action = f"Executing in Q{queue}" if queue < 3 else "Running on CPU"
-                timeline_text += f"{start:4d} | {process:<7} | Q{queue:<4} | {action}\n"
-        else:
-            timeline_text += "No processes were executed.\n"
-        
-        timeline_text += "\n"
-        
-        # Time Axis Section
-        timeline_text += "TIME AXIS:\n"
-        timeline_text += "-" * 40 + "\n"
-        if self.timeline:
-            max_time = max(end for _, end, _, _ in self.timeline)
-            time_axis = " ".join([f"{i:2d}" for i in range(max_time + 1)])
-            timeline_text += f"Time: {time_axis}\n"
-        else:
-            timeline_text += "Time: No execution recorded\n"
-        
-        timeline_text += "\n" + "=" * 80 + "\n"
-        
-        self.timeline_text.insert('1.0', timeline_text)
+        # ---- Enhanced Timeline text (paged) ----
+        settings = {
+            'quantums': [self.quantum_q0.get(), self.quantum_q1.get(), self.quantum_q2.get()],
+            'demote_threshold': self.demote_threshold.get(),
+            'aging_threshold': self.aging_threshold.get(),
+            'preempt': self.preempt.get(),
+        }
+        self.timeline_text_view.set_model(TimelineTextModel(self.timeline_index, self.results, settings))
 
         # ---- Results table ----
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-
-        for r in self.results:
-            pt_used = r['burst'] - (r['burst'] - r.get('remaining', 0)) if 'remaining' in r else r['burst']
-            self.results_tree.insert('', 'end', values=(
-                r['name'], r['arrival'], r['burst'], r['priority'],
-                r['first_start'] if r['first_start'] is not None else "N/A",
-                r['completion']  if r['completion']  is not None else "N/A",
-                r['turnaround']  if r['turnaround']  is not None else "N/A",
-                r['waiting'],
-                r['response']    if r['response']    is not None else "N/A"
-            ))
+        self.results_view.set_model(ResultsTableModel(self.results))
+        _update_results_headings(self)
 
         # ---- Summary ----
         self.summary_text.delete('1.0', 'end')
-        completed = [r for r in self.results if r['completion'] is not None]
-        if completed:
-            avg_wait = sum(r['waiting'] for r in completed) / len(completed)
-            avg_ta   = sum(r['turnaround'] for r in completed) / len(completed)
-            avg_resp = sum(r['response'] for r in completed if r['response'] is not None) / len(completed)
-            total_bt = sum(r['burst'] for r in completed)
-            makespan = max(r['completion'] for r in completed) - min(r['arrival'] for r in completed)
-            cpu_util = (total_bt / makespan) * 100 if makespan > 0 else 100.0
+        metrics = getattr(self, 'metrics', None)
+        if metrics is None:
+            # No streaming aggregator from the run, build one from the results
+            metrics = MetricsAggregator()
+            for r in self.results:
+                metrics.add_result(r)
+        if metrics.completed:
+            # Busy ticks from the timeline index over the same span as the makespan
+            makespan = metrics.makespan()
+            if makespan > 0:
+                start = metrics.first_arrival
+                utilization = self.timeline_index.busy_time(start, start + makespan) / makespan * 100
+            else:
+                utilization = 100.0
+            wait = metrics.overall['waiting']
+            ta = metrics.overall['turnaround']
+            resp = metrics.overall['response']
             summary_text = (
                 f"Summary Statistics:\n"
-                f"• Average WT_Now: {avg_wait:.2f}\n"
-                f"• Average Turnaround Time: {avg_ta:.2f}\n"
-                f"• Average Response Time: {avg_resp:.2f}\n"
-                f"• CPU Utilization: {cpu_util:.2f}%\n"
-                f"• Total Processes: {len(completed)}\n"
-                f"• Total Simulation Time: {makespan}\n"
+                f"• Average WT_Now: {wait.stats.mean:.2f}  (p50 {wait.percentile(50):.2f}, p95 {wait.percentile(95):.2f}, p99 {wait.percentile(99):.2f})\n"
+                f"• Average Turnaround Time: {ta.stats.mean:.2f}  (p50 {ta.percentile(50):.2f}, p95 {ta.percentile(95):.2f}, p99 {ta.percentile(99):.2f})\n"
+                f"• Average Response Time: {resp.stats.mean:.2f}  (p50 {resp.percentile(50):.2f}, p95 {resp.percentile(95):.2f}, p99 {resp.percentile(99):.2f})\n"
+                f"• CPU Utilization: {utilization:.2f}%\n"
+                f"• Total Processes: {metrics.completed}\n"
+                f"• Total Simulation Time: {metrics.makespan()}\n"
             )
+            for level, per_level in sorted(metrics.by_level.items()):
+                summary_text += (
+                    f"• Finished in Q{level}: {per_level['turnaround'].stats.count} processes, "
+                    f"avg TAT {per_level['turnaround'].stats.mean:.2f}, "
+                    f"p95 TAT {per_level['turnaround'].percentile(95):.2f}\n"
+                )
         else:
             summary_text = "No processes completed."
-        self.summary_text.insert('1.0', summary_text)
\ No newline at end of file
+        self.summary_text.insert('1.0', summary_text)
+
+def sort_results_table(self, column):
+        """Sort the results by a column; clicking the same column again reverses it."""
+        model = self.results_view.model
+        descending = model.sort_column == column and not model.descending
+        model.sort(column, descending)
+        self.results_view.refresh()
+        _update_results_headings(self)
+
+def apply_results_filter(self):
+        """Show only the results matching the filter bar."""
+        model = self.results_view.model
+        try:
+            model.filter(self.results_filter_column.current(), self.results_filter_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid filter", "Use a number, optionally with >, <, >=, <= or = (e.g. >=10).")
+            return
+        self.results_view.scroll_to(0)
+        _update_results_headings(self)
+
+def clear_results_filter(self):
+        self.results_filter_entry.delete(0, 'end')
+        apply_results_filter(self)
+
+def _update_results_headings(self):
+        # Arrow on the sorted column, and how many rows the filter keeps
+        model = self.results_view.model
+        for i, col in enumerate(RESULT_COLUMNS):
+            arrow = ""
+            if model.sort_column == i:
+                arrow = " ▼" if model.descending else " ▲"
+            self.results_tree.heading(col, text=col + arrow)
+        self.results_count_label.config(text=f"{len(model)} of {len(model.names)} processes")
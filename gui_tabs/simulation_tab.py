@@ -14,9 +14,7 @@ def setup_simulation_tab(self):
         References:
         - W3Schools. (2024). Python tkinter canvas. https://www.w3schools.com/python/python_tkinter_canvas.asp
         """
-        self.simulation_tab = ttk.Frame(self.notebook)
-        self.notebook.add(self.simulation_tab, text="Simulation")
-        
+        # The tab's frame already exists (MLFQGUI.setup_gui); this fills it in
         # Status header
         status_header = tk.Frame(self.simulation_tab, bg='#2c3e50', height=60)
         status_header.pack(fill='x', padx=10, pady=(10, 5))
@@ -49,9 +47,13 @@ def setup_simulation_tab(self):
         self.reset_btn = self.create_button(controls_frame, "⟲ Reset", self.reset_animation, 
                                            state='disabled', width=8)
         
+        self.cancel_btn = self.create_button(controls_frame, "✖ Cancel", self.cancel_simulation,
+                                           state='disabled', width=8)
+        
         self.play_btn.pack(side='left', padx=2)
         self.pause_btn.pack(side='left', padx=2)
         self.reset_btn.pack(side='left', padx=2)
+        self.cancel_btn.pack(side='left', padx=2)
 
         # Speed control
         speed_frame = tk.Frame(controls_frame, bg='#2c3e50')
@@ -64,6 +66,13 @@ def setup_simulation_tab(self):
                                    length=100, font=("Arial", 8), bg='#2c3e50', fg='white')
         self.speed_slider.pack(side='left', padx=2)
 
+        # Rate multiplier for long runs (frames are skipped when drawing can't keep up)
+        tk.Label(speed_frame, text="×", font=("Arial", 9), bg='#2c3e50', fg='white').pack(side='left')
+        self.rate_spinbox = tk.Spinbox(speed_frame, values=(1, 10, 100, 1000, 10000), width=6,
+                                       textvariable=self.playback_multiplier)
+        self.rate_spinbox.pack(side='left', padx=2)
+        self.playback_multiplier.trace_add('write', lambda *args: self.on_playback_rate_changed())
+
         # Main content area
         main_content = tk.Frame(self.simulation_tab)
         main_content.pack(fill='both', expand=True, padx=10, pady=5)
@@ -122,6 +131,12 @@ def setup_simulation_tab(self):
                                  fg="#2c3e50")
         self.tick_label.pack(side='right', padx=5)
 
+        # Scrub slider: jump to any tick directly
+        self.scrub_var = tk.IntVar(value=0)
+        self.scrub_slider = tk.Scale(right_panel, from_=0, to=0, orient='horizontal', showvalue=False,
+                                     variable=self.scrub_var, command=self.on_scrub)
+        self.scrub_slider.pack(fill='x', pady=(0, 5))
+
         # Status label
         self.status_label = tk.Label(right_panel, text="Ready to run simulation", 
                                    font=("Arial", 10), fg="#666666")
@@ -135,7 +150,6 @@ def setup_simulation_tab(self):
         self.settings_text.pack(fill='x', padx=5, pady=5)
 
         self.update_settings_display()
-        self.toggle_custom_processes()
 
 def repaint_animation_frame(self):
         if not self.frames:
@@ -161,3 +175,7 @@ def repaint_animation_frame(self):
 
         self.tick_label.config(text=f"Tick: {self.frame_i+1}/{self.anim_total}")
 
+        # Keep the scrub slider in step (setting the variable does not call on_scrub)
+        if self.scrub_var.get() != self.frame_i:
+            self.scrub_var.set(self.frame_i)
+
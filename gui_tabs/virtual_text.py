@@ -0,0 +1,90 @@
+import tkinter as tk
+from tkinter import ttk
+
+# A read-only Text widget that only holds the page of lines on screen.
+#
+# Like VirtualTreeview, the lines come from a model with len(model) and
+# model.row(i) -> str. Scrolling replaces the page instead of moving through
+# one huge string, so a report with a million lines opens instantly.
+
+class VirtualText:
+
+    def __init__(self, parent, model=None, height=8, font=("Courier", 9)):
+        self.frame = tk.Frame(parent)
+        self.text = tk.Text(self.frame, height=height, wrap='none', font=font, state='disabled')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._on_scrollbar)
+        self.xscrollbar = ttk.Scrollbar(self.frame, orient='horizontal', command=self.text.xview)
+        self.text.configure(xscrollcommand=self.xscrollbar.set)
+
+        self.text.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.xscrollbar.grid(row=1, column=0, sticky='ew')
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        self.model = model if model is not None else ()
+        self.height = height   # lines shown until the widget knows its real size
+        self.first = 0         # model line shown at the top
+        self._shown = None     # (first, count, len) currently in the widget
+
+        self.text.bind('<Configure>', lambda e: self.refresh())
+        # Returning 'break' keeps the Text class bindings from scrolling the page itself
+        self.text.bind('<MouseWheel>', lambda e: self._scroll_break(-1 * int(e.delta / 120) * 3))
+        self.text.bind('<Button-4>', lambda e: self._scroll_break(-3))
+        self.text.bind('<Button-5>', lambda e: self._scroll_break(3))
+        self.text.bind('<Prior>', lambda e: self._scroll_break(-self.visible_rows()))
+        self.text.bind('<Next>', lambda e: self._scroll_break(self.visible_rows()))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_model(self, model):
+        """Show a different model, scrolled to the top."""
+        self.model = model
+        self.first = 0
+        self._shown = None
+        self.refresh()
+
+    def visible_rows(self):
+        # Lines that fit, measured from the height of the first display line
+        info = self.text.dlineinfo('1.0') if self.text.winfo_ismapped() else None
+        if info:
+            return max(1, (self.text.winfo_height() - 2 * info[1]) // max(1, info[3]))
+        return self.height
+
+    def refresh(self):
+        """Put the current page of lines into the widget."""
+        total = len(self.model)
+        rows = self.visible_rows()
+        self.first = max(0, min(self.first, total - rows))
+        count = min(rows, total - self.first)
+
+        if self._shown != (self.first, count, total):
+            self._shown = (self.first, count, total)
+            page = "\n".join([self.model.row(i) for i in range(self.first, self.first + count)])
+            self.text.configure(state='normal')
+            self.text.delete('1.0', 'end')
+            self.text.insert('1.0', page)
+            self.text.configure(state='disabled')
+
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll(self, rows):
+        self.first = max(0, self.first + rows)
+        self.refresh()
+
+    def _scroll_break(self, rows):
+        self.scroll(rows)
+        return 'break'
+
+    def _on_scrollbar(self, *args):
+        # ('moveto', fraction) or ('scroll', n, 'units' | 'pages')
+        if args[0] == 'moveto':
+            self.first = max(0, int(float(args[1]) * len(self.model)))
+            self.refresh()
+        elif args[0] == 'scroll':
+            step = self.visible_rows() if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
@@ -0,0 +1,147 @@
+import tkinter as tk
+from tkinter import ttk
+
+# A Treeview that only holds the rows currently on screen.
+#
+# The data lives in a model object with len(model) and model.row(i) -> tuple
+# of column values. The tree keeps one item per visible line ("slot") and
+# fills the slots from the model whenever the view scrolls or the model changes,
+# so a model with 100k rows costs the same to show as one with 10.
+
+class VirtualTreeview:
+
+    def __init__(self, parent, columns, model=None, height=8, column_width=100):
+        self.frame = tk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', height=height,
+                                 selectmode='browse')
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=column_width)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self._on_scrollbar)
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.model = model if model is not None else ()
+        self.height = height   # rows shown until the widget knows its real size
+        self.first = 0         # model index shown in the top slot
+        self.slots = []        # tree item ids, top to bottom
+        self.selected = None   # model index of the selected row (follows scrolling)
+
+        self.tree.bind('<Configure>', lambda e: self.refresh())
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll(-1 * int(e.delta / 120) * 3))
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self._on_arrow(-1))
+        self.tree.bind('<Down>', lambda e: self._on_arrow(1))
+        self.tree.bind('<Prior>', lambda e: self.scroll(-self.visible_rows()))
+        self.tree.bind('<Next>', lambda e: self.scroll(self.visible_rows()))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_model(self, model):
+        """Show a different model, scrolled to the top."""
+        self.model = model
+        self.first = 0
+        self.selected = None
+        self.refresh()
+
+    def visible_rows(self):
+        # Rows that fit in the widget, measured from the first row's bounding box
+        if self.slots and self.tree.winfo_ismapped():
+            bbox = self.tree.bbox(self.slots[0])
+            if bbox:
+                _, top, _, row_height = bbox
+                return max(1, (self.tree.winfo_height() - top) // max(1, row_height))
+        return self.height
+
+    def refresh(self):
+        """Fill the slots from the model at the current scroll position."""
+        total = len(self.model)
+        rows = self.visible_rows()
+        self.first = max(0, min(self.first, total - rows))
+        count = min(rows, total - self.first)
+
+        # Add or remove slots so there is one per visible row
+        while len(self.slots) < count:
+            self.slots.append(self.tree.insert('', 'end'))
+        while len(self.slots) > count:
+            self.tree.delete(self.slots.pop())
+
+        for k, iid in enumerate(self.slots):
+            self.tree.item(iid, values=self.model.row(self.first + k))
+
+        # The first fill can show that more rows fit than assumed; fill those too
+        if count < total - self.first and self.visible_rows() > count:
+            self.refresh()
+            return
+
+        # Keep the highlight on the selected model row, not on the slot
+        k = -1 if self.selected is None else self.selected - self.first
+        want = (self.slots[k],) if 0 <= k < len(self.slots) else ()
+        if self.tree.selection() != want:
+            self.tree.selection_set(want)
+
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def refresh_row(self, index):
+        """Redraw one model row if it is on screen."""
+        k = index - self.first
+        if 0 <= k < len(self.slots):
+            self.tree.item(self.slots[k], values=self.model.row(index))
+
+    def index_of(self, iid):
+        """Model index of the row shown in tree item `iid` (None if it isn't a slot)."""
+        try:
+            return self.first + self.slots.index(iid)
+        except ValueError:
+            return None
+
+    def scroll(self, rows):
+        self.scroll_to(self.first + rows)
+
+    def scroll_to(self, index):
+        """Put model row `index` at the top (as far as the model allows)."""
+        old = self.first
+        self.first = max(0, index)
+        self.refresh()
+        return self.first != old
+
+    def see(self, index):
+        """Scroll just enough to show model row `index`."""
+        rows = self.visible_rows()
+        if index < self.first:
+            self.scroll_to(index)
+        elif index >= self.first + rows:
+            self.scroll_to(index - rows + 1)
+
+    def _on_scrollbar(self, *args):
+        # ('moveto', fraction) or ('scroll', n, 'units' | 'pages')
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.model)))
+        elif args[0] == 'scroll':
+            step = self.visible_rows() if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def _on_select(self, event=None):
+        selected = self.tree.selection()
+        if selected:
+            self.selected = self.index_of(selected[0])
+
+    def _on_arrow(self, delta):
+        # Move the selection, scrolling the model when it leaves the window
+        if not len(self.model):
+            return 'break'
+        index = self.first if self.selected is None else self.selected + delta
+        self.selected = max(0, min(len(self.model) - 1, index))
+        self.see(self.selected)
+        self.refresh()
+        k = self.selected - self.first
+        if 0 <= k < len(self.slots):
+            self.tree.focus(self.slots[k])
+        return 'break'
@@ -0,0 +1,244 @@
+# Streaming Metrics for the MLFQ Scheduler
+# Collects waiting, turnaround and response statistics as processes complete,
+# without keeping every result around.
+
+import math
+
+
+class RunningStats:
+    """Running count/mean/variance/min/max using Welford's algorithm."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+
+    def merge(self, other):
+        # Chan et al. pairwise combination, so per-worker stats can be joined
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative accuracy (DDSketch style).
+    Values are put into logarithmic buckets, so any quantile is reported
+    within `relative_accuracy` of the true value and two sketches built
+    with the same accuracy can be merged by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}      # bucket index -> count
+        self.zero_count = 0    # values <= 0 (scheduler times are never negative)
+        self.count = 0
+
+    def add(self, x, n=1):
+        self.count += n
+        if x <= 0:
+            self.zero_count += n
+            return
+        key = math.ceil(math.log(x) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + n
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, n in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        # Nearest rank, 0-based, like MetricSummary's exact values
+        rank = max(0, math.ceil(q * self.count) - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class MetricSummary:
+    """
+    Running stats plus a quantile sketch for one metric. The first
+    `exact_limit` values are also kept as is, so small runs report exact
+    (nearest-rank) percentiles; past that only the sketch is used.
+    """
+
+    def __init__(self, relative_accuracy=0.01, exact_limit=1024):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.exact_limit = exact_limit
+        self._values = []      # None once more than exact_limit values were seen
+
+    def add(self, x):
+        self.stats.add(x)
+        self.sketch.add(x)
+        if self._values is not None:
+            if len(self._values) < self.exact_limit:
+                self._values.append(x)
+            else:
+                self._values = None
+
+    def merge(self, other):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        if self._values is not None:
+            if other._values is None or len(self._values) + len(other._values) > self.exact_limit:
+                self._values = None
+            else:
+                self._values.extend(other._values)
+        return self
+
+    def percentile(self, p):
+        if self._values:
+            # Nearest-rank percentile of the exact values
+            ordered = sorted(self._values)
+            return ordered[max(1, math.ceil(p / 100.0 * len(ordered))) - 1]
+        return self.sketch.quantile(p / 100.0)
+
+    def as_dict(self):
+        return {
+            'count': self.stats.count,
+            'mean': self.stats.mean,
+            'stdev': self.stats.stdev,
+            'min': self.stats.min,
+            'max': self.stats.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+METRIC_NAMES = ('waiting', 'turnaround', 'response')
+
+
+class MetricsAggregator:
+    """
+    Streaming aggregator for scheduler results.
+
+    Pass it to SimpleMLFQScheduler(listeners=[...]) and it is fed from the
+    completion events, or call add_result() with result dicts. Aggregators
+    built by different workers can be combined with merge().
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.overall = {m: MetricSummary(relative_accuracy) for m in METRIC_NAMES}
+        # queue level -> {metric -> MetricSummary}
+        self.by_level = {}
+        self.completed = 0
+        self.total_burst = 0
+        self.first_arrival = None
+        self.last_completion = None
+
+    def _level(self, level):
+        if level not in self.by_level:
+            self.by_level[level] = {m: MetricSummary(self.relative_accuracy) for m in METRIC_NAMES}
+        return self.by_level[level]
+
+    def add(self, level, arrival, burst, completion, waiting, turnaround, response):
+        self.completed += 1
+        self.total_burst += burst
+        if self.first_arrival is None or arrival < self.first_arrival:
+            self.first_arrival = arrival
+        if self.last_completion is None or completion > self.last_completion:
+            self.last_completion = completion
+
+        values = {'waiting': waiting, 'turnaround': turnaround, 'response': response}
+        per_level = self._level(level)
+        for m in METRIC_NAMES:
+            if values[m] is None:
+                continue
+            self.overall[m].add(values[m])
+            per_level[m].add(values[m])
+
+    def on_complete(self, process):
+        # Scheduler listener hook, called once when a process finishes
+        self.add(process.queue_level, process.arrival_time, process.burst_time,
+                 process.completion_time, process.waiting_time,
+                 process.get_turnaround_time(), process.get_response_time())
+
+    def add_result(self, r):
+        # Same as on_complete, but for the result dicts returned by simulate_with_frames
+        if r['completion'] is None:
+            return
+        self.add(r['priority'] - 1, r['arrival'], r['burst'], r['completion'],
+                 r['waiting'], r['turnaround'], r['response'])
+
+    def merge(self, other):
+        for m in METRIC_NAMES:
+            self.overall[m].merge(other.overall[m])
+        for level, summaries in other.by_level.items():
+            mine = self._level(level)
+            for m in METRIC_NAMES:
+                mine[m].merge(summaries[m])
+        self.completed += other.completed
+        self.total_burst += other.total_burst
+        if other.first_arrival is not None:
+            self.first_arrival = other.first_arrival if self.first_arrival is None else min(self.first_arrival, other.first_arrival)
+        if other.last_completion is not None:
+            self.last_completion = other.last_completion if self.last_completion is None else max(self.last_completion, other.last_completion)
+        return self
+
+    def makespan(self):
+        if self.completed == 0:
+            return 0
+        return self.last_completion - self.first_arrival
+
+    def cpu_utilization(self):
+        makespan = self.makespan()
+        return (self.total_burst / makespan) * 100 if makespan > 0 else 100.0
+
+    def summary(self):
+        return {
+            'completed': self.completed,
+            'makespan': self.makespan(),
+            'cpu_utilization': self.cpu_utilization(),
+            'overall': {m: self.overall[m].as_dict() for m in METRIC_NAMES},
+            'by_level': {
+                level: {m: s[m].as_dict() for m in METRIC_NAMES}
+                for level, s in sorted(self.by_level.items())
+            },
+        }
@@ -70,6 +70,7 @@ class Process:
         self.process_time = 0         # Demotion counter
         self.time_in_current_queue = 0  # Aging counter
         self.enqueued_at = 0            # When the process was enqueued
+        self.enqueue_number = 0         # Order of that enqueue (top-k snapshot totals)
         
     def is_finished(self):
         """Check if the process is completely done."""
@@ -0,0 +1,57 @@
+# Process Table Model
+# Columnar storage behind the process editor in the Configuration tab.
+# Names live in a list and the numbers in typed arrays, so a workload with
+# 100k processes costs a few bytes per process, and editing a cell only
+# touches that one value instead of rebuilding the whole process list.
+
+from array import array
+from itertools import islice
+
+COLUMNS = ('Name', 'Arrival', 'Burst', 'Priority')
+
+
+class ProcessTableModel:
+    """Rows of (name, arrival, burst, priority) stored column by column."""
+
+    def __init__(self, rows=()):
+        self.names = []
+        self.arrivals = array('q')
+        self.bursts = array('q')
+        self.priorities = array('b')
+        self.extend(rows)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return zip(self.names, self.arrivals, self.bursts, self.priorities)
+
+    def extend(self, rows):
+        for name, arrival, burst, priority in rows:
+            self.names.append(str(name))
+            self.arrivals.append(int(arrival))
+            self.bursts.append(int(burst))
+            self.priorities.append(int(priority))
+
+    def row(self, i):
+        return (self.names[i], self.arrivals[i], self.bursts[i], self.priorities[i])
+
+    def set_value(self, i, column, value):
+        """Set one numeric cell; column is 1 (Arrival), 2 (Burst) or 3 (Priority)."""
+        (self.arrivals, self.bursts, self.priorities)[column - 1][i] = value
+
+    def truncate(self, n):
+        """Drop every row from index n on."""
+        del self.names[n:]
+        del self.arrivals[n:]
+        del self.bursts[n:]
+        del self.priorities[n:]
+
+    def next_number(self):
+        """Number for the next auto-generated name (P1, P2, ...)."""
+        nums = [int(nm[1:]) for nm in self.names if nm.startswith('P') and nm[1:].isdigit()]
+        return (max(nums) + 1) if nums else 1
+
+    def to_list(self, limit=None):
+        """The rows as a list of tuples (what the scheduler takes)."""
+        return list(islice(self, limit))
@@ -0,0 +1,187 @@
+# Results Models
+# Indexed data behind the Results tab. The process results are stored column by
+# column so sorting and filtering work on plain arrays, and the detailed timeline
+# text is produced one line at a time, so the GUI only formats the lines it shows.
+
+from array import array
+
+RESULT_COLUMNS = ('Process', 'Arrival', 'BT_Now', 'PT_Now', 'First Start', 'Completion', 'Turnaround', 'WT_Now', 'Response')
+RESULT_KEYS = ('name', 'arrival', 'burst', 'priority', 'first_start', 'completion', 'turnaround', 'waiting', 'response')
+# Stored for None (process never started / finished); all real values are >= 0
+MISSING = -1
+
+# Filter operators for numeric columns, longest first so ">=" wins over ">"
+_OPERATORS = (
+    ('>=', lambda a, b: a >= b),
+    ('<=', lambda a, b: a <= b),
+    ('>', lambda a, b: a > b),
+    ('<', lambda a, b: a < b),
+    ('=', lambda a, b: a == b),
+)
+
+
+class ResultsTableModel:
+    """
+    Result rows stored column by column, plus `order`: the indices of the
+    rows shown (after filtering), in display order (after sorting).
+    """
+
+    def __init__(self, results=()):
+        self.names = []
+        self.columns = [array('q') for _ in RESULT_KEYS[1:]]
+        for r in results:
+            self.names.append(r['name'])
+            for col, key in zip(self.columns, RESULT_KEYS[1:]):
+                col.append(MISSING if r[key] is None else r[key])
+        self.order = array('q', range(len(self.names)))
+        self.sort_column = None
+        self.descending = False
+
+    def __len__(self):
+        return len(self.order)
+
+    def row(self, i):
+        j = self.order[i]
+        values = [self.names[j]]
+        for col in self.columns:
+            values.append("N/A" if col[j] == MISSING else col[j])
+        return tuple(values)
+
+    def sort(self, column, descending=False):
+        """Sort the shown rows by column index (0 = Process)."""
+        self.sort_column, self.descending = column, descending
+        if column == 0:
+            key = self.names.__getitem__
+            self.order = array('q', sorted(self.order, key=key, reverse=descending))
+            return
+        col = self.columns[column - 1]
+        # N/A rows go last in both directions
+        if descending:
+            key = lambda j: (col[j] == MISSING, -col[j])
+        else:
+            key = lambda j: (col[j] == MISSING, col[j])
+        self.order = array('q', sorted(self.order, key=key))
+
+    def filter(self, column, text):
+        """
+        Show only rows whose column matches `text`: a substring for Process,
+        and a number with an optional >, <, >=, <= or = for the other columns.
+        An empty text shows every row. The current sort is kept.
+        """
+        text = text.strip()
+        n = len(self.names)
+        if not text:
+            keep = range(n)
+        elif column == 0:
+            keep = [j for j in range(n) if text in self.names[j]]
+        else:
+            test = _OPERATORS[-1][1]
+            for op, fn in _OPERATORS:
+                if text.startswith(op):
+                    test, text = fn, text[len(op):].strip()
+                    break
+            value = int(text)  # ValueError for the caller to report
+            col = self.columns[column - 1]
+            keep = [j for j in range(n) if col[j] != MISSING and test(col[j], value)]
+        self.order = array('q', keep)
+        if self.sort_column is not None:
+            self.sort(self.sort_column, self.descending)
+
+
+class TimelineTextModel:
+    """
+    The "Detailed Timeline" report as numbered lines, generated on demand.
+    Sections with one line per process or per slice are indexed, not built.
+    `timeline` is the run's TimelineIndex (or anything with len, [i] and .end).
+    """
+
+    # Ticks per line in the TIME AXIS section
+    AXIS_TICKS_PER_LINE = 40
+
+    def __init__(self, timeline, results=(), settings=None):
+        self.timeline = timeline
+        self.results = results
+        settings = settings or {}
+
+        head = ["=" * 80, "MLFQ CPU SCHEDULER - EXECUTION TIMELINE", "=" * 80, ""]
+        if settings:
+            head += [
+                "SCHEDULING RULES:",
+                "-" * 40,
+                f"• Time Quantum Q0 (Highest): {settings['quantums'][0]} time units",
+                f"• Time Quantum Q1 (Medium): {settings['quantums'][1]} time units",
+                f"• Time Quantum Q2 (Lowest): {settings['quantums'][2]} time units",
+                f"• Demotion Threshold: {settings['demote_threshold']} time units",
+                f"• Aging Threshold: {settings['aging_threshold']} time units",
+                f"• Preemption: {'Enabled' if settings['preempt'] else 'Disabled'}",
+                "",
+            ]
+        head += [
+            "PROCESS DETAILS:",
+            "-" * 40,
+            f"{'Process':<10} {'PT_Now':<8} {'Arrival':<7} {'BT_Now':<6} {'PT_Used':<7} {'Completion':<10} {'Turnaround':<10} {'WT_Now':<8}",
+            "-" * 80,
+        ]
+        middle = [
+            "",
+            "EXECUTION TIMELINE:",
+            "-" * 40,
+            "Time | Process | Queue | Action",
+            "-" * 40,
+        ]
+        tail_head = ["", "TIME AXIS:", "-" * 40]
+
+        self.max_time = timeline.end if len(timeline) else None
+        if self.max_time is None:
+            axis_lines = 1
+        else:
+            axis_lines = (self.max_time + self.AXIS_TICKS_PER_LINE) // self.AXIS_TICKS_PER_LINE
+
+        # (first line, line count, function(i) -> text) for each section
+        self.sections = []
+        self._add_section(len(head), head.__getitem__)
+        self._add_section(len(results), self._result_line)
+        self._add_section(len(middle), middle.__getitem__)
+        self._add_section(max(1, len(timeline)), self._slice_line)
+        self._add_section(len(tail_head), tail_head.__getitem__)
+        self._add_section(axis_lines, self._axis_line)
+        footer = ["", "=" * 80]
+        self._add_section(len(footer), footer.__getitem__)
+
+    def _add_section(self, count, line_fn):
+        first = self.sections[-1][0] + self.sections[-1][1] if self.sections else 0
+        self.sections.append((first, count, line_fn))
+
+    def __len__(self):
+        first, count, _ = self.sections[-1]
+        return first + count
+
+    def row(self, i):
+        # Sections are few, a linear scan is enough
+        for first, count, line_fn in self.sections:
+            if i < first + count:
+                return line_fn(i - first)
+        raise IndexError("line out of range")
+
+    def _result_line(self, i):
+        r = self.results[i]
+        pt_used = r['burst'] - (r['burst'] - r.get('remaining', 0)) if 'remaining' in r else r['burst']
+        return (f"{r['name']:<10} {r['priority']:<8} {r['arrival']:<7} {r['burst']:<6} {pt_used:<7} "
+                f"{r['completion'] if r['completion'] is not None else 'N/A':<10} "
+                f"{r['turnaround'] if r['turnaround'] is not None else 'N/A':<10} "
+                f"{r['waiting']:<8}")
+
+    def _slice_line(self, i):
+        if not len(self.timeline):
+            return "No processes were executed."
+        start, end, process, queue = self.timeline[i]
+        action = f"Executing in Q{queue}" if queue < 3 else "Running on CPU"
+        return f"{start:4d} | {process:<7} | Q{queue:<4} | {action}"
+
+    def _axis_line(self, i):
+        if self.max_time is None:
+            return "Time: No execution recorded"
+        first = i * self.AXIS_TICKS_PER_LINE
+        last = min(self.max_time, first + self.AXIS_TICKS_PER_LINE - 1)
+        prefix = "Time: " if i == 0 else "      "
+        return prefix + " ".join([f"{t:2d}" for t in range(first, last + 1)])
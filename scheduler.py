@@ -2,17 +2,100 @@
 # Simple MLFQ (Multi-Level Feedback Queue) Scheduler
 # This is the heart of our CPU scheduler simulation
 
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+from frame_codec import NameTable
 from process import Process
+from timeline import Timeline
+
+
+class SimulationCancelled(Exception):
+    # Raised by a listener (e.g. from on_tick) to stop a running simulation early
+    pass
+
+
+class PreparedWorkload:
+    """
+    A process list made ready once for many runs: sorted by arrival (ties keep
+    the input order), names interned in that order, and one Process object per
+    process that every run re-initializes instead of allocating a new one.
+    Process names must be unique.
+    """
+
+    def __init__(self, process_list):
+        self.entries = sorted((tuple(p) for p in process_list), key=lambda x: x[1])
+        self.names = NameTable(name for name, _, _, _ in self.entries)
+        if len(self.names.names) != len(self.entries):
+            raise ValueError("Process names must be unique")
+        # name -> Process reused by every run (see SimpleMLFQScheduler._arrive)
+        self.pool = {name: Process(name, at, bt, pr) for name, at, bt, pr in self.entries}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def index(self, name):
+        """Position of a process in arrival order (its column in BatchResults)."""
+        return self.names.ids[name]
+
+
+class BatchResults:
+    """
+    Results of simulate_many, column by column. Per-process columns
+    (completion, first_start, waiting) hold one row of len(workload) values
+    per run, back to back, with -1 for "didn't happen"; processes are in
+    arrival order (workload.entries). Per-run columns (completed, slices,
+    cancelled) hold one value per run.
+    """
+
+    def __init__(self, workload, configs):
+        n, runs = len(workload), len(configs)
+        self.workload = workload
+        self.configs = configs
+        self.completion = array('q', [-1]) * (n * runs)
+        self.first_start = array('q', [-1]) * (n * runs)
+        self.waiting = array('q', [0]) * (n * runs)
+        self.completed = array('q', [0]) * runs
+        self.slices = array('q', [0]) * runs
+        self.cancelled = array('b', [0]) * runs
+
+    def __len__(self):
+        return len(self.configs)
+
+    def row(self, column, run):
+        """Run `run`'s values of a per-process column ('completion', 'first_start' or 'waiting')."""
+        n = len(self.workload)
+        return memoryview(getattr(self, column))[run * n:(run + 1) * n]
 
 class SimpleMLFQScheduler:
     
     # Set in here are defaults
-    def __init__(self, quantums=[3, 3, 3], demote_threshold=6, aging_threshold=5, preempt=True):
+    def __init__(self, quantums=[3, 3, 3], demote_threshold=6, aging_threshold=5, preempt=True, listeners=None, snapshot_limit=None,
+                 cycle_period=None):
         
         self.quantums = quantums
         self.demote_threshold = demote_threshold
         self.aging_threshold = aging_threshold
         self.preempt = preempt
+
+        # Frames list only the first `snapshot_limit` processes of each queue plus
+        # per-queue totals (None = list every queued process)
+        self.snapshot_limit = snapshot_limit
+
+        # For periodic workloads: compare the scheduler state every `cycle_period`
+        # ticks and skip ahead over repeated periods (see _cycle_boundary)
+        self.cycle_period = cycle_period
+        self._cycle_log = None
+
+        # Process objects to reuse (PreparedWorkload.pool), None = make new ones
+        self._process_pool = None
+
+        # Objects notified of simulation events (e.g. metrics.MetricsAggregator)
+        # A listener only needs the hook methods it cares about, like on_complete(process),
+        # on_slice(start, end, name, level) for each run on the CPU, and
+        # on_aging / on_demotion(time, name, from_level, to_level)
+        self.listeners = list(listeners) if listeners else []
         
         # Create 3 queues with each queue as a list of processes
         self.queues = [[], [], []]
@@ -26,13 +109,19 @@ class SimpleMLFQScheduler:
         self.cpu_proc_end = None
         
         # Keep track of what happened during simulation
-        # List of (start_time, end_time, process_name, queue_level)
-        self.timeline = []  
+        # (start_time, end_time, process_name, queue_level) slices, stored column by column
+        self.timeline = Timeline()
         
         # Current time in the simulation
         self.current_time = 0
 
         self.current_run_start = 0
+
+        # Running totals per queue, kept only in top-k snapshot mode:
+        # sum of remaining time, and a max-deque of (enqueue number, waiting - enqueue time)
+        self._queued_remaining = [0, 0, 0]
+        self._waiting_max = [deque(), deque(), deque()]
+        self._enqueue_count = 0
         
     def add_process(self, process):
         # Adds a process to the scheduler.
@@ -55,6 +144,29 @@ class SimpleMLFQScheduler:
         # Uses list.append() to add the process to the queue (W3Schools: Python List Methods)
         # This puts the process at the end of the queue (FIFO - First In, First Out)
         self.queues[queue_level].append(process.name)
+        if self.snapshot_limit is not None:
+            self._track_enqueue(process, queue_level)
+
+    def _track_enqueue(self, process, queue_level):
+        # While queued, waiting time grows by one per tick, so
+        # waiting(t) = waiting at enqueue + (t - enqueued_at). The largest
+        # "waiting - enqueued_at" in a queue therefore gives its max waiting at any time.
+        self._queued_remaining[queue_level] += process.remaining_time
+        self._enqueue_count += 1
+        process.enqueue_number = self._enqueue_count
+        key = process.waiting_time - self.current_time
+        maxes = self._waiting_max[queue_level]
+        while maxes and maxes[-1][1] <= key:
+            maxes.pop()
+        maxes.append((process.enqueue_number, key))
+
+    def _track_dequeue(self, process, queue_level):
+        # Processes only leave from the front of a queue (dispatch or aging),
+        # so anything enqueued up to this one is gone from the max-deque too
+        self._queued_remaining[queue_level] -= process.remaining_time
+        maxes = self._waiting_max[queue_level]
+        while maxes and maxes[0][0] <= process.enqueue_number:
+            maxes.popleft()
         
     def _get_next_process(self):
         # Get the next process to run (from the highest priority non-empty queue).
@@ -67,7 +179,10 @@ class SimpleMLFQScheduler:
                 process_name = self.queues[queue_level].pop(0) 
                 # Uses dictionary lookup to get the actual Process object (W3Schools: Python Dictionaries)
                 # We stored the process using its name as the key
-                return self.processes[process_name]
+                process = self.processes[process_name]
+                if self.snapshot_limit is not None:
+                    self._track_dequeue(process, queue_level)
+                return process
         # Returns None if no processes are ready to run (GeeksforGeeks: Python None)
         return None  
     
@@ -107,10 +222,14 @@ class SimpleMLFQScheduler:
             for i in reversed(processes_to_move):
                 process_name = self.queues[queue_level].pop(i)
                 process = self.processes[process_name]
+                if self.snapshot_limit is not None:
+                    self._track_dequeue(process, queue_level)
                 new_queue = process.queue_level - 1
 
                 # Reset waiting time (queue level)
                 self._add_to_queue(process, new_queue)
+                if self.listeners:
+                    self._emit_level_change('on_aging', self.current_time, process.name, queue_level, new_queue)
 
     def _handle_demotion(self, exiting_process):
         # Move processes to lower priority queues if they've used too much CPU time.
@@ -123,11 +242,21 @@ class SimpleMLFQScheduler:
         if exiting_process.process_time >= self.demote_threshold and exiting_process.queue_level < 2:
             exiting_process.queue_level += 1
             exiting_process.process_time = 0
+            if self.listeners:
+                # The slice ended at the end of this tick
+                self._emit_level_change('on_demotion', self.current_time + 1, exiting_process.name,
+                                        exiting_process.queue_level - 1, exiting_process.queue_level)
 
     def _arrive(self, sorted_processes):
+        pool = self._process_pool
         while sorted_processes and self.current_time >= sorted_processes[0][1]:
             name, at, bt, pr = sorted_processes[0]
-            self.add_process(Process(name, at, bt, pr))
+            if pool is not None:
+                process = pool[name]
+                process.__init__(name, at, bt, pr)  # fresh state, same object as last run
+            else:
+                process = Process(name, at, bt, pr)
+            self.add_process(process)
             sorted_processes.pop(0)
 
     def _preemption_check(self, sorted_processes, time_to_run, base_priority=None):
@@ -190,24 +319,44 @@ class SimpleMLFQScheduler:
         if p.remaining_time > 0:
             return p
             
+    def _emit(self, hook, *args):
+        # Call the named hook on every listener that defines it
+        for listener in self.listeners:
+            fn = getattr(listener, hook, None)
+            if fn is not None:
+                fn(*args)
+
+    def _emit_level_change(self, hook, time, name, from_level, to_level):
+        # Aging and demotion events; logged so skipped periods can replay them
+        if self._cycle_log is not None:
+            self._cycle_log['events'].append((hook, time, name, from_level, to_level))
+        self._emit(hook, time, name, from_level, to_level)
+
     def _process_completed(self):
         return sum(1 for p in self.processes.values() if p.completion_time is not None)
     
     def _append_slice(self, start, end, name, qlvl):
-        # If last entry is same process and end == start (back-to-back), extend it
-        if self.timeline and self.timeline[-1][2] == name and self.timeline[-1][1] == start:
-            s0, _, n0, q0 = self.timeline.pop()
-            self.timeline.append((s0, end, n0, q0))
+        if self._cycle_log is not None:
+            self._cycle_log['slices'].append((start, end, name, qlvl))
+        # If last entry is same process and end == start (back-to-back), extend it in place
+        timeline = self.timeline
+        if timeline and timeline.ends[-1] == start and timeline.last_name() == name:
+            timeline.extend_last(end)
         else:   
-            self.timeline.append((start, end, name, qlvl))
+            timeline.append(start, end, name, qlvl)
+        if self.listeners:
+            self._emit('on_slice', start, end, name, qlvl)
 
     def _snapshot(self, running_name):
         
         # Queues with attributes
+        limit = self.snapshot_limit
         detailed_queues = []
         for queue_level in range(3):
             queue_info = []
-            for process_name in self.queues[queue_level]:
+            # In top-k mode only the front of each queue is copied
+            names = self.queues[queue_level] if limit is None else self.queues[queue_level][:limit]
+            for process_name in names:
                 if process_name in self.processes:
                     p = self.processes[process_name]
                     queue_info.append({
@@ -237,28 +386,480 @@ class SimpleMLFQScheduler:
                 'processing_time': p.process_time,
             }
 
-        return {
+        frame = {
             't': self.current_time,
             'queues': detailed_queues,
             'running': running_info
         }
+        if limit is not None:
+            frame['queue_stats'] = self._queue_stats()
+        return frame
+
+    def _queue_stats(self):
+        # Totals for whole queues, including the processes left out of a top-k frame
+        stats = []
+        for queue_level in range(3):
+            maxes = self._waiting_max[queue_level]
+            stats.append({
+                'count': len(self.queues[queue_level]),
+                'total_remaining': self._queued_remaining[queue_level],
+                'max_waiting': maxes[0][1] + self.current_time if maxes else 0,
+            })
+        return stats
+
+
+    # == Round robin fast path ==
+    # With demotion and aging off, a process never changes queue, so between
+    # arrivals each queue is plain round robin under strict priority. Nothing
+    # changes between dispatches except the clock, so the run can go slice by
+    # slice instead of tick by tick, and whole rounds of a queue in which nobody
+    # finishes can be added up at once. Waiting time is settled when a process
+    # is dispatched (and for everything still queued when the fast path stops).
+
+    def _rounds_enabled(self, keep_frames):
+        # Only if nobody needs the per-tick hooks or frames the fast path skips
+        if self.demote_threshold > 0 or self.aging_threshold > 0 or min(self.quantums) <= 0:
+            return False
+        if keep_frames:
+            return False
+        return not any(hasattr(l, 'on_tick') or hasattr(l, 'on_frame') for l in self.listeners)
+
+    def _run_rounds(self, requeue_holder, next_arrival=None, stop=None):
+        # Called at the top of the loop. Runs whole slices that start before
+        # `next_arrival` (None = nothing left to arrive) and `stop` and end by
+        # them, then leaves the state as the main loop would have it at the top
+        # of that tick. Returns the requeue holder and whether time moved.
+        until = next_arrival if stop is None else stop if next_arrival is None else min(next_arrival, stop)
+        if self.cpu is not None and until is not None and self.cpu_proc_end > until:
+            return requeue_holder, False
+
+        start = now = self.current_time
+        queues = [deque(self.processes[name] for name in queue) for queue in self.queues]
+
+        # Waiting counted so far: up to the tick before `start` for processes that
+        # were queued then, otherwise since they were enqueued
+        def settle(p, t):
+            p.waiting_time += t - max(p.enqueued_at, start - 1)
+            p.time_in_current_queue = t - p.enqueued_at
+
+        def finish_slice(p, begin, end):
+            self._append_slice(begin, end, p.name, p.queue_level)
+            if p.remaining_time <= 0 and p.completion_time is None:
+                p.completion_time = end
+                if self._cycle_log is not None:
+                    self._cycle_log['completed'].append(p)
+                if self.listeners:
+                    self._emit('on_complete', p)
+                return None
+            return p
+
+        # Let the process on the CPU run out its slice
+        if self.cpu is not None:
+            p, end = self.cpu, self.cpu_proc_end
+            p.remaining_time -= end - now
+            p.process_time += end - now
+            self.cpu = None
+            self.cpu_proc_end = None
+            requeue_holder = finish_slice(p, self.current_run_start, end)
+            now = end
+
+        streak = 0  # full-quantum dispatches in a row with no one finishing
+        while until is None or now < until:
+            if requeue_holder is not None:
+                p = requeue_holder
+                requeue_holder = None
+                p.enqueued_at = now
+                p.time_in_current_queue = 0
+                queues[p.queue_level].append(p)
+
+            level = next((i for i in range(3) if queues[i]), None)
+            if level is None:
+                # Idle (or done): nothing happens until the next arrival
+                if next_arrival is not None:
+                    now = until
+                break
+            queue, q = queues[level], self.quantums[level]
+
+            # After a full round the queue repeats: each process waits
+            # (k - 1) * q between its turns. Add up the rounds nobody finishes in.
+            k = len(queue)
+            if k >= 2 and streak >= k:
+                rounds = (min(p.remaining_time for p in queue) - 1) // q
+                if until is not None:
+                    # The last process must be back in the queue before `until`
+                    rounds = min(rounds, (until - now - 1) // (k * q))
+                if rounds > 0:
+                    for r in range(rounds):
+                        for i, p in enumerate(queue):
+                            begin = now + (r * k + i) * q
+                            self._append_slice(begin, begin + q, p.name, level)
+                    for p in queue:
+                        p.waiting_time += rounds * (k - 1) * q
+                        p.remaining_time -= rounds * q
+                        p.process_time += rounds * q
+                        p.enqueued_at += rounds * k * q
+                    now += rounds * k * q
+
+            p = queue[0]
+            run = min(q, p.remaining_time)
+            if until is not None and now + run > until:
+                break  # an arrival could preempt it: leave it to the main loop
+            queue.popleft()
+            settle(p, now)
+            if p.first_start_time is None:
+                p.first_start_time = now
+            p.remaining_time -= run
+            p.process_time += run
+            requeue_holder = finish_slice(p, now, now + run)
+            now += run
+            streak = streak + 1 if requeue_holder is not None and run == q else 0
+
+        # Queued processes have waited up to the tick before `now`
+        for queue in queues:
+            for p in queue:
+                if p.enqueued_at < now:
+                    settle(p, now - 1)
+        self.queues = [[p.name for p in queue] for queue in queues]
+        self.current_time = now
+        if self.snapshot_limit is not None:
+            self._rebuild_queue_totals()
+        return requeue_holder, now != start
+
+    # == Cycle detection ==
+    # A periodic trace repeats the same arrivals every `cycle_period` ticks. If the
+    # scheduler state at one period boundary equals the state at the previous one,
+    # shifted by the period (times relative to the boundary, processes numbered
+    # by their position in the arrival order), then every following period plays
+    # out the same way as long as the arrivals keep repeating. The slices and
+    # completions logged during the last period are then copied forward, shifted,
+    # for all remaining repetitions at once.
+
+    def _cycle_enabled(self, keep_frames):
+        # Same rule as _rounds_enabled: only if nobody needs the skipped hooks or frames
+        if not self.cycle_period or self.cycle_period <= 0 or keep_frames:
+            return False
+        return not any(hasattr(l, 'on_tick') or hasattr(l, 'on_frame') for l in self.listeners)
+
+    def _cycle_setup(self, sorted_processes):
+        entries = list(sorted_processes)
+        index = {name: j for j, (name, _, _, _) in enumerate(entries)}
+        if len(index) != len(entries):
+            return None  # Processes are matched by name, so names must be unique
+        return {
+            'entries': entries,
+            'arrivals': [at for _, at, _, _ in entries],
+            'index': index,
+            'lookahead': max(self.quantums),  # preemption looks this far ahead
+            'last': None,
+        }
+
+    def _cycle_state(self, cycle, base, pending, requeue_holder):
+        # Everything the rest of the run depends on, relative to the current time
+        # and to `base` (number of processes arriving before now)
+        t = self.current_time
+        index = cycle['index']
+
+        def proc(p):
+            if p is None:
+                return None
+            return (index[p.name] - base, p.arrival_time - t, p.burst_time, p.priority, p.queue_level,
+                    p.remaining_time, p.process_time, p.waiting_time, p.enqueued_at - t,
+                    p.time_in_current_queue,
+                    None if p.first_start_time is None else p.first_start_time - t)
+
+        # Not-yet-arrived processes close to now, in list order (preemption can reorder them)
+        upcoming = []
+        for name, at, bt, pr in pending:
+            if at >= t + cycle['lookahead']:
+                break
+            upcoming.append((index[name] - base, at - t, bt, pr))
+
+        last_slice = None
+        if self.timeline:
+            last_slice = (index[self.timeline.last_name()] - base, self.timeline.ends[-1] - t)
+
+        return (
+            tuple(tuple(proc(self.processes[name]) for name in queue) for queue in self.queues),
+            proc(self.cpu),
+            None if self.cpu is None else (self.cpu_proc_end - t, self.current_run_start - t),
+            proc(requeue_holder),
+            tuple(upcoming),
+            last_slice,
+        )
+
+    def _cycle_boundary(self, cycle, pending, requeue_holder):
+        # Called at the top of the loop every cycle_period ticks
+        prev, log = cycle['last'], self._cycle_log
+        cycle['last'] = self._cycle_mark(cycle, pending, requeue_holder)
+
+        if prev is not None and log is not None and prev['state'] == cycle['last']['state']:
+            jumped = self._cycle_jump(cycle, prev, cycle['last']['base'], log, pending, requeue_holder)
+            if jumped is not None:
+                requeue_holder = jumped[0]
+                # Compare the next period against the boundary we jumped to
+                cycle['last'] = self._cycle_mark(cycle, pending, requeue_holder)
+
+        self._cycle_log = {'slices': [], 'completed': [], 'events': []}
+        return requeue_holder
+
+    def _cycle_mark(self, cycle, pending, requeue_holder):
+        base = bisect_left(cycle['arrivals'], self.current_time)
+        return {'t': self.current_time, 'base': base,
+                'state': self._cycle_state(cycle, base, pending, requeue_holder)}
+
+    def _cycle_repeats(self, cycle, prev_t, prev_base, base):
+        # How many more periods the arrivals keep repeating after this boundary
+        period = self.cycle_period
+        entries, arrivals = cycle['entries'], cycle['arrivals']
+        per_period = base - prev_base
+        if per_period < 0 or (per_period == 0 and base == len(entries)):
+            return 0
+
+        # First arrival (from this boundary on) that isn't the one a period earlier, shifted
+        j = base
+        while j < len(entries):
+            i = j - per_period
+            if i < 0 or arrivals[j] != arrivals[i] + period or entries[j][2:] != entries[i][2:]:
+                break
+            j += 1
+        first_mismatch = j
 
+        # r more periods are safe if every arrival up to r periods + lookahead ahead
+        # repeats, and none from a period earlier is missing
+        repeats = 0
+        while True:
+            horizon = prev_t + (repeats + 1) * period + cycle['lookahead']
+            lo, hi = bisect_left(arrivals, horizon), bisect_left(arrivals, horizon + period)
+            if hi > first_mismatch or hi - lo != per_period:
+                return repeats
+            repeats += 1
+
+    def _cycle_jump(self, cycle, prev, base, log, pending, requeue_holder):
+        repeats = self._cycle_repeats(cycle, prev['t'], prev['base'], base)
+        if repeats <= 0:
+            return None
+
+        period = self.cycle_period
+        per_period = base - prev['base']
+        entries, index = cycle['entries'], cycle['index']
+
+        def shifted(p, j, dt):
+            # Copy of process p as the process with arrival position j, dt ticks later
+            q = Process(*entries[j])
+            q.queue_level = p.queue_level
+            q.priority = p.priority
+            q.remaining_time = p.remaining_time
+            q.process_time = p.process_time
+            q.waiting_time = p.waiting_time
+            q.time_in_current_queue = p.time_in_current_queue
+            q.enqueued_at = p.enqueued_at + dt
+            q.first_start_time = None if p.first_start_time is None else p.first_start_time + dt
+            q.completion_time = None if p.completion_time is None else p.completion_time + dt
+            return q
+
+        skip, renumber = repeats * period, repeats * per_period
+        try:
+            # Processes finishing in the skipped periods, period by period
+            finished = []
+            for r in range(1, repeats + 1):
+                for p in log['completed']:
+                    finished.append(shifted(p, index[p.name] + r * per_period, r * period))
+            # Processes still in the system afterwards (keyed by the name they have now)
+            alive_now = [self.processes[name] for queue in self.queues for name in queue]
+            alive_now += [p for p in (self.cpu, requeue_holder) if p is not None]
+            alive = {p.name: shifted(p, index[p.name] + renumber, skip) for p in alive_now}
+            moved = [entries[index[name] + renumber] for name, at, _, _ in pending
+                     if at < self.current_time + cycle['lookahead']]
+        except IndexError:
+            return None
+
+        # Every process in the system now must either finish in a skipped period
+        # or be one of the processes left afterwards, else the state wasn't periodic
+        covered = {q.name for q in alive.values()}.union(q.name for q in finished)
+        if any(p.name not in covered for p in alive_now):
+            return None
+
+        # == Commit the jump ==
+        self._cycle_log = None  # the copied slices aren't part of the next period
+        for r in range(1, repeats + 1):
+            for start, end, name, qlvl in log['slices']:
+                self._append_slice(start + r * period, end + r * period,
+                                   entries[index[name] + r * per_period][0], qlvl)
+            if self.listeners:
+                for hook, time, name, from_level, to_level in log['events']:
+                    self._emit(hook, time + r * period, entries[index[name] + r * per_period][0],
+                               from_level, to_level)
+        for q in finished:
+            self.processes[q.name] = q
+        for q in alive.values():
+            self.processes[q.name] = q
+
+        rename = lambda name: entries[index[name] + renumber][0]
+        self.queues = [[rename(name) for name in queue] for queue in self.queues]
+        if self.cpu is not None:
+            self.cpu = alive[self.cpu.name]
+            self.cpu_proc_end += skip
+            self.current_run_start += skip
+        if requeue_holder is not None:
+            requeue_holder = alive[requeue_holder.name]
+        self.current_time += skip
+
+        # Not-yet-arrived processes: the shifted near ones, then the rest in arrival order
+        pending[:] = moved + entries[bisect_left(cycle['arrivals'], self.current_time + cycle['lookahead']):]
+
+        if self.snapshot_limit is not None:
+            self._rebuild_queue_totals()
+        if self.listeners:
+            for q in finished:
+                self._emit('on_complete', q)
+        return (requeue_holder,)
+
+    def _rebuild_queue_totals(self):
+        # Recompute the top-k snapshot totals after the queues were replaced.
+        # At the top of a tick, queued processes have been counted as waiting up to
+        # the tick before, so "waiting - current_time" at enqueue equals this:
+        offset = 1 - self.current_time
+        self._queued_remaining = [0, 0, 0]
+        self._waiting_max = [deque(), deque(), deque()]
+        for queue_level, queue in enumerate(self.queues):
+            maxes = self._waiting_max[queue_level]
+            for name in queue:
+                p = self.processes[name]
+                self._queued_remaining[queue_level] += p.remaining_time
+                self._enqueue_count += 1
+                p.enqueue_number = self._enqueue_count
+                key = p.waiting_time + offset
+                while maxes and maxes[-1][1] <= key:
+                    maxes.pop()
+                maxes.append((p.enqueue_number, key))
+
+    def _record_frame(self, frames, running_name):
+        # Snapshots are only built if someone keeps or listens to them
+        if not self._keep_frames and not self.listeners:
+            return
+        frame = self._snapshot(running_name)
+        if self._keep_frames:
+            frames.append(frame)
+        if self.listeners:
+            self._emit('on_frame', frame)
+
+    def simulate_with_frames(self, process_list, keep_frames=True):
+        # keep_frames=False still sends every frame to listeners' on_frame hook,
+        # but does not keep them in the returned list (useful for streaming)
+        # process_list can also be a PreparedWorkload
+        frames = self._simulate(process_list, keep_frames)
+        if frames is None:
+            return
+
+        # Result details
+        results = []
+        for pname in sorted(self.processes.keys()):
+            p = self.processes[pname]
+            results.append({
+                'name': p.name,
+                'arrival': p.arrival_time,
+                'burst': p.burst_time,
+                'priority': p.priority,
+                'first_start': p.first_start_time,
+                'completion': p.completion_time,
+                'turnaround': p.get_turnaround_time(),
+                'waiting': p.waiting_time,
+                'response': p.get_response_time()
+            })
+        
+        return self.timeline, results, frames
 
-    def simulate_with_frames(self, process_list):
+    def simulate_many(self, workload, configs):
+        """
+        Run one workload (a PreparedWorkload, or a process list to prepare) once
+        per config and return a BatchResults. Each config is a dict of
+        constructor options such as {'quantums': [2, 4, 8], 'aging_threshold': 0};
+        options it leaves out keep this scheduler's values. A run stopped with
+        SimulationCancelled is marked in `cancelled` and the next one starts.
+        """
+        if not isinstance(workload, PreparedWorkload):
+            workload = PreparedWorkload(workload)
+        configs = list(configs)
+        base = {
+            'quantums': self.quantums,
+            'demote_threshold': self.demote_threshold,
+            'aging_threshold': self.aging_threshold,
+            'preempt': self.preempt,
+            'listeners': self.listeners,
+            'snapshot_limit': self.snapshot_limit,
+            'cycle_period': self.cycle_period,
+        }
+        out = BatchResults(workload, configs)
+        ids = workload.names.ids
+        n = len(workload)
+        for config in configs:
+            unknown = set(config) - set(base)
+            if unknown:
+                raise TypeError("Unknown scheduler option(s): %s" % ', '.join(sorted(unknown)))
+        try:
+            for run, config in enumerate(configs):
+                # Only set the options here; _simulate resets the run state
+                self._set_options(dict(base, **config))
+                try:
+                    self._simulate(workload, keep_frames=False)
+                except SimulationCancelled:
+                    out.cancelled[run] = 1
+                offset = run * n
+                completed = 0
+                for name, p in self.processes.items():
+                    i = offset + ids[name]
+                    if p.completion_time is not None:
+                        out.completion[i] = p.completion_time
+                        completed += 1
+                    if p.first_start_time is not None:
+                        out.first_start[i] = p.first_start_time
+                    out.waiting[i] = p.waiting_time
+                out.completed[run] = completed
+                out.slices[run] = len(self.timeline)
+        finally:
+            # Leave the scheduler configured as it was before the batch
+            self._set_options(base)
+        return out
+
+    def _set_options(self, options):
+        for key, value in options.items():
+            if key == 'listeners':
+                value = list(value) if value else []
+            setattr(self, key, value)
+
+    def _simulate(self, process_list, keep_frames):
+        # The run itself; returns the frames, or None if there are no processes
         # For reset every simulation
         self.__init__(  # reset state using current config
             quantums=self.quantums,
             demote_threshold=self.demote_threshold,
             aging_threshold=self.aging_threshold,
-            preempt=self.preempt
+            preempt=self.preempt,
+            listeners=self.listeners,
+            snapshot_limit=self.snapshot_limit,
+            cycle_period=self.cycle_period
         )
 
         # == SNAPSHOT ==
         frames = []
+        self._keep_frames = keep_frames
         requeue_holder = None
 
         # Prepare for the main simulation loop
-        sorted_processes = sorted(process_list, key=lambda x: x[1])
+        if isinstance(process_list, PreparedWorkload):
+            # Already sorted and interned; reuse its Process objects
+            sorted_processes = list(process_list.entries)
+            self._process_pool = process_list.pool
+            self.timeline = Timeline(names=process_list.names)
+        else:
+            sorted_processes = sorted(process_list, key=lambda x: x[1])
+
+        # Cycle skipping leaves no frames or ticks for the skipped periods, so not
+        # with keep_frames or when a listener wants them
+        cycle = None
+        if self._cycle_enabled(keep_frames):
+            cycle = self._cycle_setup(sorted_processes)
+        rounds = self._rounds_enabled(keep_frames)
 
         # Extra handler if no processes
         if not sorted_processes:
@@ -271,6 +872,25 @@ class SimpleMLFQScheduler:
             self._arrive(sorted_processes)
 
         while True:
+            # == Periodic workloads: skip repeated periods ==
+            if cycle is not None and self.current_time % self.cycle_period == 0:
+                requeue_holder = self._cycle_boundary(cycle, sorted_processes, requeue_holder)
+
+            # == Demotion and aging off: go slice by slice up to the next arrival ==
+            if rounds:
+                next_arrival = sorted_processes[0][1] if sorted_processes else None
+                # With cycle detection, also stop at the next period boundary
+                boundary = None
+                if cycle is not None:
+                    boundary = (self.current_time // self.cycle_period + 1) * self.cycle_period
+                requeue_holder, moved = self._run_rounds(requeue_holder, next_arrival, boundary)
+                if moved:
+                    if not sorted_processes and not requeue_holder and self._process_completed() == len(self.processes):
+                        # The last process finished at the end of the previous tick
+                        self.current_time -= 1
+                        break
+                    continue
+
             # == Increase waiting time ==
             self._update_time_in_queue()
 
@@ -296,7 +916,7 @@ class SimpleMLFQScheduler:
                         # Optional: final snapshot(None) here
                         break
                     # If meron pa, snapshot for idle
-                    frames.append(self._snapshot(None))
+                    self._record_frame(frames, None)
                 else:
                     # Snapshot ! ++ Add end time ng process
                     q = self.quantums[next_proc.queue_level]
@@ -317,12 +937,16 @@ class SimpleMLFQScheduler:
                             sorted_processes.insert(0, vip)
 
                     self._move_to_CPU(next_proc, run_end)
-                    frames.append(self._snapshot(self.cpu.name))
+                    self._record_frame(frames, self.cpu.name)
 
             if self.cpu:
                 self.cpu.remaining_time -= 1
                 self.cpu.process_time += 1
 
+            # Per-tick hook (queue lengths and CPU state for this tick)
+            if self.listeners:
+                self._emit('on_tick', self)
+
             # Check for process completion
             if self.cpu_proc_end is not None and self.current_time + 1 == self.cpu_proc_end:
                 # Store 
@@ -335,6 +959,10 @@ class SimpleMLFQScheduler:
                 # Check for completion
                 if self.cpu and self.cpu.remaining_time <= 0 and self.cpu.completion_time is None:
                     self.cpu.completion_time = self.current_time + 1
+                    if self._cycle_log is not None:
+                        self._cycle_log['completed'].append(self.cpu)
+                    if self.listeners:
+                        self._emit('on_complete', self.cpu)
 
                 # == Out CPU ==
                 if self.cpu.remaining_time > 0:
@@ -350,20 +978,4 @@ class SimpleMLFQScheduler:
             # Move time forward    
             self.current_time += 1
 
-        # Result details
-        results = []
-        for pname in sorted(self.processes.keys()):
-            p = self.processes[pname]
-            results.append({
-                'name': p.name,
-                'arrival': p.arrival_time,
-                'burst': p.burst_time,
-                'priority': p.priority,
-                'first_start': p.first_start_time,
-                'completion': p.completion_time,
-                'turnaround': p.get_turnaround_time(),
-                'waiting': p.waiting_time,
-                'response': p.get_response_time()
-            })
-        
-        return self.timeline, results, frames
+        return frames
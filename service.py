@@ -0,0 +1,404 @@
+# Local Simulation Service
+# A long-running HTTP server on localhost that runs simulations for other
+# tools, so they don't each start Python and import the scheduler again.
+#
+#   python service.py --port 8765 --workers 4
+#
+# Endpoints (JSON in, JSON out):
+#   POST /simulate  {"processes": [[name, arrival, burst, priority], ...],
+#                    "config": {"quantums": [3, 3, 3], ...}, "timeline": false}
+#                   -> {"results": [...], "summary": {...}, "timeline": [...]}
+#   POST /batch     {"requests": [<simulate body>, ...]}
+#                   -> one JSON line per request as it finishes: {"index": i, ...}
+#   GET  /stats     request, batch, dedup and latency counters
+#   GET  /health
+#
+# Requests are collected for a couple of milliseconds and sent to a warm
+# process pool in batches. Identical requests share one run: while it is in
+# flight, and afterwards from a small cache of recent results.
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from metrics import MetricsAggregator, MetricSummary
+from scheduler import SimpleMLFQScheduler
+
+DEFAULT_PORT = 8765
+# A batch goes out once it has this many requests...
+BATCH_SIZE = 16
+# ...or this many seconds after its first request arrived
+BATCH_WINDOW = 0.002
+# Finished results kept for identical requests
+CACHE_SIZE = 256
+# Scheduler options a request may set
+CONFIG_KEYS = ('quantums', 'demote_threshold', 'aging_threshold', 'preempt', 'cycle_period')
+
+
+# == Worker side ==
+
+def _run_job(job):
+    processes, config, with_timeline = job
+    metrics = MetricsAggregator()
+    scheduler = SimpleMLFQScheduler(listeners=[metrics], **config)
+    out = scheduler.simulate_with_frames(processes, keep_frames=False)
+    timeline, results, _ = out or ([], [], [])
+    reply = {'results': results, 'summary': metrics.summary()}
+    if with_timeline:
+        reply['timeline'] = [list(s) for s in timeline]
+    return reply
+
+
+def _run_batch(jobs):
+    # One pool task per batch; a failing job doesn't take the others down
+    replies = []
+    for job in jobs:
+        try:
+            replies.append((True, _run_job(job)))
+        except Exception as e:
+            replies.append((False, str(e)))
+    return replies
+
+
+def _warm_up():
+    # Run a tiny simulation so the worker has imported and touched everything
+    _run_job(([('P1', 0, 2, 1), ('P2', 1, 3, 2)], {}, False))
+
+
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def parse_request(body):
+    """Check a /simulate body; returns (processes, config, with_timeline) or raises ValueError."""
+    if not isinstance(body, dict):
+        raise ValueError("Request must be a JSON object")
+    raw_processes = body.get('processes', [])
+    if not isinstance(raw_processes, list):
+        raise ValueError("processes must be a list")
+    processes = []
+    for p in raw_processes:
+        if not isinstance(p, (list, tuple)) or len(p) != 4:
+            raise ValueError("Each process must be [name, arrival, burst, priority]")
+        name, arrival, burst, priority = p
+        if not all(_is_int(v) for v in (arrival, burst, priority)):
+            raise ValueError(f"Process {name}: arrival, burst and priority must be integers")
+        # Same rules as the GUI's file loader
+        if arrival < 0 or burst < 1 or priority not in (1, 2, 3):
+            raise ValueError(f"Process {name}: needs arrival >= 0, burst >= 1 and priority 1-3")
+        processes.append((str(name), arrival, burst, priority))
+
+    config = body.get('config') or {}
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+    config = dict(config)
+    unknown = set(config) - set(CONFIG_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    if 'quantums' in config:
+        quantums = config['quantums']
+        if not isinstance(quantums, list) or len(quantums) != 3 or not all(_is_int(q) and q > 0 for q in quantums):
+            raise ValueError("quantums must be a list of three positive integers")
+        config['quantums'] = list(quantums)
+    for key in ('demote_threshold', 'aging_threshold'):
+        if key in config and not (_is_int(config[key]) and config[key] >= 0):
+            raise ValueError(f"{key} must be a non-negative integer")
+    if 'preempt' in config and not isinstance(config['preempt'], bool):
+        raise ValueError("preempt must be true or false")
+    if config.get('cycle_period') is not None and not (_is_int(config['cycle_period']) and config['cycle_period'] >= 0):
+        raise ValueError("cycle_period must be a non-negative integer")
+    return processes, config, bool(body.get('timeline', False))
+
+
+def request_key(job):
+    """Identical jobs get the same key."""
+    processes, config, with_timeline = job
+    text = json.dumps([processes, sorted(config.items()), with_timeline], separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class ServiceCounters:
+    """Throughput and latency counters, read through snapshot()."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.completed = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_jobs = 0
+        self.dedup_in_flight = 0
+        self.dedup_cache = 0
+        self.latency = MetricSummary()   # seconds from submit to result, per run
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        latency = self.latency.as_dict()
+        ms = {k: (v * 1000 if isinstance(v, float) else v) for k, v in latency.items() if k != 'count'}
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'completed': self.completed,
+            'errors': self.errors,
+            'requests_per_s': self.requests / uptime if uptime > 0 else 0.0,
+            'batches': self.batches,
+            'avg_batch_size': self.batched_jobs / self.batches if self.batches else 0.0,
+            'dedup_in_flight': self.dedup_in_flight,
+            'dedup_cache': self.dedup_cache,
+            'latency_ms': ms,
+        }
+
+
+class SimulationService:
+    """
+    Batches jobs onto a warm process pool. submit() returns a
+    concurrent.futures.Future with the reply dict.
+    """
+
+    def __init__(self, workers=None, batch_size=BATCH_SIZE, batch_window=BATCH_WINDOW,
+                 cache_size=CACHE_SIZE):
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.cache_size = cache_size
+        self.counters = ServiceCounters()
+
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        # Start every worker now so the first request doesn't pay for it
+        warm = [self.pool.submit(_warm_up) for _ in range(self.workers)]
+        for f in warm:
+            f.result()
+
+        self._lock = threading.Lock()
+        self._in_flight = {}         # key -> Future shared by identical requests
+        self._cache = OrderedDict()  # key -> reply, most recent last
+        self._pending = queue.Queue()
+        self._batcher = threading.Thread(target=self._batch_loop, daemon=True)
+        self._batcher.start()
+
+    def submit(self, job):
+        key = request_key(job)
+        with self._lock:
+            self.counters.requests += 1
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.counters.dedup_cache += 1
+                future = Future()
+                future.set_result(self._cache[key])
+                return future
+            if key in self._in_flight:
+                self.counters.dedup_in_flight += 1
+                return self._in_flight[key]
+            future = Future()
+            self._in_flight[key] = future
+        self._pending.put((key, job, future, time.monotonic()))
+        return future
+
+    def _batch_loop(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._pending.put(None)  # stop after this batch
+                    break
+                batch.append(item)
+
+            with self._lock:
+                self.counters.batches += 1
+                self.counters.batched_jobs += len(batch)
+                pool = self.pool
+            jobs = [job for _, job, _, _ in batch]
+            try:
+                task = pool.submit(_run_batch, jobs)
+            except BrokenProcessPool:
+                # A worker died since the last batch; this one goes to a new pool
+                task = self._replace_pool(pool).submit(_run_batch, jobs)
+            task.add_done_callback(lambda task, batch=batch, pool=pool: self._batch_done(batch, task, pool))
+
+    def _replace_pool(self, broken):
+        # A pool whose worker died refuses all further work, so start a new one
+        # (once, however many batches saw the old one break)
+        with self._lock:
+            if self.pool is broken:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+                broken.shutdown(wait=False)
+            return self.pool
+
+    def _batch_done(self, batch, task, pool):
+        try:
+            replies = task.result()
+        except BrokenProcessPool as e:  # a worker process died
+            self._replace_pool(pool)
+            replies = [(False, f"Worker failed: {e}")] * len(batch)
+        except Exception as e:
+            replies = [(False, f"Worker failed: {e}")] * len(batch)
+        now = time.monotonic()
+        for (key, _, future, submitted), (ok, reply) in zip(batch, replies):
+            with self._lock:
+                del self._in_flight[key]
+                if ok:
+                    self.counters.completed += 1
+                    self.counters.latency.add(now - submitted)
+                    self._cache[key] = reply
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+                else:
+                    self.counters.errors += 1
+            if ok:
+                future.set_result(reply)
+            else:
+                future.set_exception(RuntimeError(reply))
+
+    def stats(self):
+        with self._lock:
+            return self.counters.snapshot()
+
+    def close(self):
+        self._pending.put(None)
+        self._batcher.join()
+        self.pool.shutdown()
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 for keep-alive and chunked /batch replies
+    protocol_version = 'HTTP/1.1'
+    service = None  # set by make_server
+
+    def log_message(self, format, *args):
+        pass  # quiet; use /stats
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length) or b'null')
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.service.stats())
+        elif self.path == '/health':
+            self._send_json(200, {'ok': True})
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        try:
+            body = self._read_json()
+            if self.path == '/simulate':
+                jobs = [parse_request(body)]
+            elif self.path == '/batch':
+                if not isinstance(body, dict) or not isinstance(body.get('requests'), list):
+                    raise ValueError("Batch must be {\"requests\": [...]}")
+                jobs = [parse_request(r) for r in body['requests']]
+            else:
+                self._send_json(404, {'error': f"Unknown path: {self.path}"})
+                return
+        except ValueError as e:  # includes bad JSON
+            self._send_json(400, {'error': str(e)})
+            return
+
+        futures = [self.service.submit(job) for job in jobs]
+        if self.path == '/simulate':
+            try:
+                self._send_json(200, futures[0].result())
+            except RuntimeError as e:
+                self._send_json(500, {'error': str(e)})
+            return
+
+        # Stream one JSON line per request, in the order they finish
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        finished = queue.Queue()
+        for i, f in enumerate(futures):
+            f.add_done_callback(lambda f, i=i: finished.put((i, f)))
+        for _ in futures:
+            i, f = finished.get()
+            try:
+                line = {'index': i, **f.result()}
+            except RuntimeError as e:
+                line = {'index': i, 'error': str(e)}
+            data = (json.dumps(line) + "\n").encode('utf-8')
+            self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def make_server(service, port=DEFAULT_PORT, host='127.0.0.1'):
+    """An HTTP server for `service`; call serve_forever() on it."""
+    handler = type('BoundServiceHandler', (ServiceHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def call(path, payload=None, port=DEFAULT_PORT, host='127.0.0.1', timeout=60):
+    """
+    Small client: GET `path` (payload None) or POST `payload` as JSON.
+    Returns the decoded reply; for /batch, a list of the streamed lines.
+    """
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        if payload is None:
+            conn.request('GET', path)
+        else:
+            conn.request('POST', path, json.dumps(payload), {'Content-Type': 'application/json'})
+        reply = conn.getresponse()
+        data = reply.read().decode('utf-8')
+    finally:
+        conn.close()
+    if reply.getheader('Content-Type') == 'application/x-ndjson':
+        return [json.loads(line) for line in data.splitlines() if line]
+    result = json.loads(data)
+    if reply.status != 200:
+        raise RuntimeError(result.get('error', f"HTTP {reply.status}"))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve MLFQ simulations over HTTP on localhost.")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--batch-window-ms', type=float, default=BATCH_WINDOW * 1000)
+    args = parser.parse_args(argv)
+
+    service = SimulationService(args.workers, args.batch_size, args.batch_window_ms / 1000)
+    server = make_server(service, args.port)
+    print(f"Serving on http://127.0.0.1:{args.port} with {service.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == '__main__':
+    main()
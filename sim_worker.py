@@ -0,0 +1,201 @@
+# Runs a simulation in a separate process so the GUI stays responsive.
+# The worker reports progress through a queue, stops when the cancel event is set,
+# and hands the timeline and frames back through shared memory as raw arrays
+# instead of pickling them. Frames are sent in chunks while the simulation runs,
+# so the GUI can start the animation before the run is finished.
+
+import multiprocessing as mp
+import queue
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from scheduler import SimpleMLFQScheduler, SimulationCancelled
+from metrics import MetricsAggregator
+from frame_codec import FrameEncoder, NameTable, PackedFrames, encode_timeline, decode_timeline
+from frame_store import FrameStore
+
+# How often (in ticks) the worker looks at the cancel flag
+CANCEL_CHECK_TICKS = 256
+# Minimum seconds between two progress messages
+PROGRESS_INTERVAL = 0.1
+# Frames are sent once this many seconds passed since the last chunk...
+CHUNK_INTERVAL = 0.05
+# ...or once a chunk holds this many frames (the first chunk goes out early)
+MAX_CHUNK_FRAMES = 8192
+FIRST_CHUNK_FRAMES = 32
+
+
+class ProgressReporter:
+    """Scheduler listener that reports progress and raises on cancellation."""
+
+    def __init__(self, messages, cancel_event):
+        self.messages = messages
+        self.cancel_event = cancel_event
+        self.completed = 0
+        self._ticks = 0
+        self._last_report = 0.0
+
+    def on_complete(self, process):
+        self.completed += 1
+
+    def on_tick(self, scheduler):
+        self._ticks += 1
+        if self._ticks % CANCEL_CHECK_TICKS:
+            return
+        if self.cancel_event.is_set():
+            raise SimulationCancelled()
+        now = time.monotonic()
+        if now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self.messages.put(('progress', scheduler.current_time, self.completed))
+
+
+class FrameStreamer:
+    """Scheduler listener that encodes frames and ships them to the GUI in chunks."""
+
+    def __init__(self, messages, names):
+        self.messages = messages
+        self.names = names
+        self.encoder = FrameEncoder(names)
+        self._sent_names = 0
+        self._sent_any = False
+        self._last_flush = time.monotonic()
+
+    def on_frame(self, frame):
+        self.encoder.add(frame)
+        n = len(self.encoder)
+        if n >= (MAX_CHUNK_FRAMES if self._sent_any else FIRST_CHUNK_FRAMES) or \
+                time.monotonic() - self._last_flush >= CHUNK_INTERVAL:
+            self.flush()
+
+    def new_names(self):
+        # Names interned since the last message (the GUI keeps the full list)
+        names = self.names.names[self._sent_names:]
+        self._sent_names = len(self.names.names)
+        return names
+
+    def flush(self):
+        if not len(self.encoder):
+            return
+        data, ends = self.encoder.take_chunk()
+        shm_name, layout = _pack_arrays([data, ends])
+        self.messages.put(('frames', shm_name, layout, self.new_names()))
+        self._sent_any = True
+        self._last_flush = time.monotonic()
+
+
+def _pack_arrays(arrays):
+    """Copy int arrays into one shared memory block; returns (name, [(typecode, offset, nbytes)])."""
+    layout = []
+    total = 0
+    for a in arrays:
+        layout.append((a.typecode, total, len(a) * a.itemsize))
+        total += len(a) * a.itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(1, total))
+    for a, (_, offset, nbytes) in zip(arrays, layout):
+        shm.buf[offset:offset + nbytes] = a.tobytes()
+    name = shm.name
+    shm.close()
+    return name, layout
+
+
+def _unpack_arrays(name, layout):
+    """Read the arrays written by _pack_arrays and free the shared memory block."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = []
+        for typecode, offset, nbytes in layout:
+            a = array(typecode)
+            a.frombytes(shm.buf[offset:offset + nbytes])
+            arrays.append(a)
+    finally:
+        shm.close()
+        shm.unlink()
+    return arrays
+
+
+def _worker_main(processes, config, messages, cancel_event):
+    try:
+        names = NameTable()
+        metrics = MetricsAggregator()
+        progress = ProgressReporter(messages, cancel_event)
+        streamer = FrameStreamer(messages, names)
+        scheduler = SimpleMLFQScheduler(listeners=[metrics, progress, streamer], **config)
+        # Frames go out through the streamer, the worker does not keep them
+        timeline, results, _ = scheduler.simulate_with_frames(processes, keep_frames=False) or ([], [], [])
+        streamer.flush()
+
+        shm_name, layout = _pack_arrays(list(encode_timeline(timeline, names)))
+        messages.put(('done', shm_name, layout, streamer.new_names(), results, metrics))
+    except SimulationCancelled:
+        messages.put(('cancelled',))
+    except Exception as e:
+        messages.put(('error', str(e)))
+
+
+class SimulationRunner:
+    """
+    Starts one simulation in a worker process.
+    Call poll() regularly (e.g. from root.after); it returns a list of
+    messages: ('progress', tick, completed), ('frames', frames),
+    ('done', timeline, results, frames, metrics), ('cancelled',) or ('error', message).
+    `frames` is the same growing PackedFrames every time; it gets longer as
+    chunks arrive. With on_disk=True it is a FrameStore instead, which keeps
+    the frame data in a memory-mapped temporary file.
+    """
+
+    def __init__(self, processes, config, on_disk=False):
+        ctx = mp.get_context('spawn')
+        self.messages = ctx.Queue()
+        self.cancel_event = ctx.Event()
+        self.process = ctx.Process(target=_worker_main,
+                                   args=(list(processes), dict(config), self.messages, self.cancel_event),
+                                   daemon=True)
+        self.finished = False
+        self.names = []
+        if on_disk:
+            self.frames = FrameStore(self.names)
+        else:
+            self.frames = PackedFrames(array('i'), array('q', [0]), self.names)
+
+    def start(self):
+        self.process.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_running(self):
+        return not self.finished
+
+    def poll(self):
+        out = []
+        while True:
+            try:
+                msg = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if msg[0] == 'frames':
+                _, shm_name, layout, new_names = msg
+                data, ends = _unpack_arrays(shm_name, layout)
+                self.names.extend(new_names)
+                self.frames.extend(data, ends)
+                msg = ('frames', self.frames)
+            elif msg[0] == 'done':
+                _, shm_name, layout, new_names, results, metrics = msg
+                starts, ends, ids, levels = _unpack_arrays(shm_name, layout)
+                self.names.extend(new_names)
+                timeline = decode_timeline(starts, ends, ids, levels, self.names)
+                msg = ('done', timeline, results, self.frames, metrics)
+            if msg[0] in ('done', 'cancelled', 'error'):
+                self.finished = True
+            out.append(msg)
+
+        # Worker died without saying anything (e.g. killed)
+        if not out and not self.finished and not self.process.is_alive() and self.messages.empty():
+            self.finished = True
+            out.append(('error', "Simulation worker exited unexpectedly"))
+
+        if self.finished:
+            self.process.join(timeout=1)
+        return out
@@ -0,0 +1,360 @@
+# Distributed Sweeps
+# Runs every (workload, configuration) pair of a sweep on worker processes
+# that connect over TCP, so a sweep can use several machines.
+#
+#   python sweep.py coordinator traces/*.txt --port 9100 --out sweep.csv
+#   python sweep.py worker --host coordinator-host --port 9100      (on each machine)
+#   python sweep.py coordinator traces/*.txt --local-workers 4     (all on this machine)
+#
+# Workers pull one task at a time and send back one row of metrics (SWEEP_FIELDS).
+# A workload is sent to a worker only the first time it needs it; workers keep
+# the most recent ones, and the coordinator prefers giving a worker tasks for
+# workloads it already has. If a worker disconnects or stops answering, its
+# task goes back in the queue and is tried again (up to max_attempts times).
+#
+# Messages are JSON objects, each sent as a 4-byte big-endian length and the
+# UTF-8 text.
+
+import argparse
+import csv
+import inspect
+import json
+import os
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+from collections import OrderedDict, deque
+
+from metrics import MetricsAggregator
+from process import load_defaults
+from scheduler import SimpleMLFQScheduler
+from tuner import search_space
+
+DEFAULT_PORT = 9100
+# Workloads a worker keeps
+WORKER_CACHE_SIZE = 32
+# Seconds a worker may take for one task before it counts as stalled
+DEFAULT_TASK_TIMEOUT = 300.0
+# Scheduler options a sweep config sets, with the scheduler's own defaults
+CONFIG_DEFAULTS = {
+    name: param.default for name, param in inspect.signature(SimpleMLFQScheduler).parameters.items()
+    if name in ('quantums', 'demote_threshold', 'aging_threshold', 'preempt')
+}
+# Metrics in a result row
+SWEEP_FIELDS = ('completed', 'makespan', 'cpu_utilization', 'slices',
+                'avg_waiting', 'p95_waiting', 'max_waiting',
+                'avg_turnaround', 'p95_turnaround', 'avg_response', 'p95_response')
+
+_LENGTH = struct.Struct('>I')
+
+
+def send_message(sock, message):
+    data = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exact(sock, n):
+    chunks = []
+    while n:
+        chunk = sock.recv(n)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock):
+    """The next message, or None once the other side has closed the connection."""
+    header = _recv_exact(sock, _LENGTH.size)
+    if header is None:
+        return None
+    data = _recv_exact(sock, _LENGTH.unpack(header)[0])
+    return None if data is None else json.loads(data)
+
+
+def run_task(processes, config):
+    """Simulate one workload with one config; returns a row of SWEEP_FIELDS values."""
+    metrics = MetricsAggregator()
+    scheduler = SimpleMLFQScheduler(listeners=[metrics], **config)
+    out = scheduler.simulate_with_frames([tuple(p) for p in processes], keep_frames=False)
+    summary = metrics.summary()
+    overall = summary['overall']
+    return [
+        summary['completed'], summary['makespan'], summary['cpu_utilization'], len(out[0]) if out else 0,
+        overall['waiting']['mean'], overall['waiting']['p95'], overall['waiting']['max'],
+        overall['turnaround']['mean'], overall['turnaround']['p95'],
+        overall['response']['mean'], overall['response']['p95'],
+    ]
+
+
+def complete_config(config):
+    """
+    A sweep config with every option in CONFIG_DEFAULTS filled in (left-out
+    ones get the scheduler's defaults). Raises ValueError for a bad config.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("A config must be a JSON object")
+    unknown = set(config) - set(CONFIG_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    config = dict(CONFIG_DEFAULTS, **config)
+    quantums = config['quantums']
+    if (not isinstance(quantums, (list, tuple)) or len(quantums) != 3
+            or not all(isinstance(q, int) and not isinstance(q, bool) and q > 0 for q in quantums)):
+        raise ValueError("quantums must be a list of three positive integers")
+    config['quantums'] = list(quantums)
+    for key in ('demote_threshold', 'aging_threshold'):
+        value = config[key]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"{key} must be a non-negative integer")
+    if not isinstance(config['preempt'], bool):
+        raise ValueError("preempt must be true or false")
+    return config
+
+
+# == Coordinator ==
+
+class SweepCoordinator:
+    """
+    Hands out the tasks of a sweep to connected workers and collects the rows.
+    `workloads` maps a workload id to its process list; every workload runs
+    with every config in `configs` (completed with complete_config, so a bad
+    one fails here). run() returns {(workload_id, config_index): row} plus the
+    failed tasks in self.failed.
+    """
+
+    def __init__(self, workloads, configs, host='0.0.0.0', port=DEFAULT_PORT,
+                 max_attempts=3, task_timeout=DEFAULT_TASK_TIMEOUT):
+        self.workloads = dict(workloads)
+        self.configs = [complete_config(c) for c in configs]
+        self.max_attempts = max_attempts
+        # Seconds a worker may take for one task (None = wait forever); a stalled
+        # worker's task is then retried like one from a lost connection
+        self.task_timeout = task_timeout
+
+        self.results = {}
+        self.failed = {}     # task -> last error message
+        self.attempts = {}   # task -> tries so far
+        # Pending tasks grouped by workload, so workers can be given ones they have cached
+        self._pending = OrderedDict((wid, deque(range(len(self.configs)))) for wid in self.workloads)
+        self._remaining = len(self.workloads) * len(self.configs)
+        self._cond = threading.Condition()
+
+        coordinator = self
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                coordinator._serve_worker(self.request)
+
+        self.server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        self.server.daemon_threads = True
+        self.server.allow_reuse_address = True
+        self.server.server_bind()
+        self.server.server_activate()
+        self.port = self.server.server_address[1]
+
+    def run(self, progress=None):
+        """Serve workers until every task has a result or has failed for good."""
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        with self._cond:
+            while self._remaining:
+                self._cond.wait(timeout=1.0)
+                if progress is not None:
+                    progress(len(self.results), len(self.failed), self._remaining)
+        self.server.shutdown()
+        self.server.server_close()
+        return self.results
+
+    def _next_task(self, cached):
+        # Prefer a workload the worker has; otherwise the one with most tasks left
+        # (called with the lock held)
+        for wid in cached:
+            if self._pending.get(wid):
+                return wid, self._pending[wid].popleft()
+        best = max(self._pending, key=lambda wid: len(self._pending[wid]), default=None)
+        if best is None or not self._pending[best]:
+            return None
+        return best, self._pending[best].popleft()
+
+    def _finish(self, task, row=None, error=None):
+        # Record a result, or retry / give up on a failed task
+        with self._cond:
+            if row is not None:
+                self.results[task] = row
+                self._remaining -= 1
+            else:
+                self.attempts[task] = self.attempts.get(task, 0) + 1
+                if self.attempts[task] >= self.max_attempts:
+                    self.failed[task] = error
+                    self._remaining -= 1
+                else:
+                    self._pending[task[0]].appendleft(task[1])
+            self._cond.notify_all()
+
+    def _serve_worker(self, sock):
+        cached = set()   # workloads this worker has
+        task = None
+        try:
+            hello = recv_message(sock)
+            if not hello or hello.get('type') != 'hello':
+                return
+            cached.update(hello.get('cached', ()))
+            while True:
+                with self._cond:
+                    while True:
+                        task = self._next_task(cached)
+                        if task is not None or not self._remaining:
+                            break
+                        # Tasks are out on other workers and may come back
+                        self._cond.wait()
+                if task is None:
+                    send_message(sock, {'type': 'done'})
+                    return
+
+                wid, config_index = task
+                message = {'type': 'task', 'workload_id': wid, 'config_index': config_index,
+                           'config': self.configs[config_index]}
+                if wid not in cached:
+                    message['workload'] = self.workloads[wid]
+                send_message(sock, message)
+                sock.settimeout(self.task_timeout)
+                reply = recv_message(sock)
+                sock.settimeout(None)
+                if reply is None:
+                    raise ConnectionError("worker disconnected")
+                if not isinstance(reply, dict):
+                    raise ValueError("reply is not an object")
+                cached = set(reply.get('cached', cached))
+
+                done, task = task, None
+                row = reply.get('row') if reply.get('type') == 'result' else None
+                if row is not None:
+                    self._finish(done, row=row)
+                elif reply.get('type') == 'result':
+                    self._finish(done, error="result without a row")
+                else:
+                    self._finish(done, error=reply.get('message', 'worker error'))
+        except (OSError, ValueError, KeyError, TypeError) as e:   # lost connection, timeout, bad message
+            if task is not None:
+                self._finish(task, error=f"worker lost: {e}")
+        finally:
+            sock.close()
+
+
+# == Worker ==
+
+def run_worker(host='127.0.0.1', port=DEFAULT_PORT, cache_size=WORKER_CACHE_SIZE):
+    """Connect to a coordinator and run tasks until it says the sweep is done."""
+    cache = OrderedDict()   # workload id -> processes, most recently used last
+    try:
+        with socket.create_connection((host, port)) as sock:
+            send_message(sock, {'type': 'hello', 'cached': []})
+            while True:
+                message = recv_message(sock)
+                if message is None or message.get('type') == 'done':
+                    return
+                wid = message['workload_id']
+                if 'workload' in message:
+                    cache[wid] = message['workload']
+                    if len(cache) > cache_size:
+                        cache.popitem(last=False)
+                cache.move_to_end(wid)
+                try:
+                    row = run_task(cache[wid], message['config'])
+                    reply = {'type': 'result', 'row': row}
+                except Exception as e:
+                    reply = {'type': 'error', 'message': str(e)}
+                reply['cached'] = list(cache)
+                send_message(sock, reply)
+    except ConnectionError:
+        # The coordinator is gone, e.g. the sweep finished before this worker connected
+        return
+
+
+def start_local_workers(count, port, host='127.0.0.1'):
+    """Start `count` worker processes on this machine (returns the Popen objects)."""
+    script = os.path.abspath(__file__)
+    return [subprocess.Popen([sys.executable, script, 'worker', '--host', host, '--port', str(port)])
+            for _ in range(count)]
+
+
+def write_csv(path, results, configs):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(('workload', 'q0', 'q1', 'q2', 'demote', 'aging', 'preempt') + SWEEP_FIELDS)
+        for (wid, ci), row in sorted(results.items()):
+            c = configs[ci]
+            writer.writerow([wid, *c['quantums'], c['demote_threshold'], c['aging_threshold'],
+                             c['preempt'], *row])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run MLFQ sweeps on workers connected over TCP.")
+    sub = parser.add_subparsers(dest='mode', required=True)
+
+    coord = sub.add_parser('coordinator', help="hand out a sweep and collect the results")
+    coord.add_argument('traces', nargs='+', help="process files to sweep over")
+    coord.add_argument('--configs', help="JSON file with a list of scheduler configs "
+                                         "(default: tuner.search_space())")
+    coord.add_argument('--host', default='0.0.0.0')
+    coord.add_argument('--port', type=int, default=DEFAULT_PORT)
+    coord.add_argument('--out', default='sweep.csv')
+    coord.add_argument('--local-workers', type=int, default=0, help="also start this many workers here")
+    coord.add_argument('--max-attempts', type=int, default=3)
+    coord.add_argument('--task-timeout', type=float, default=DEFAULT_TASK_TIMEOUT,
+                       help="seconds before a task is retried (0 = never)")
+
+    work = sub.add_parser('worker', help="run tasks for a coordinator")
+    work.add_argument('--host', default='127.0.0.1')
+    work.add_argument('--port', type=int, default=DEFAULT_PORT)
+    work.add_argument('--cache-size', type=int, default=WORKER_CACHE_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.mode == 'worker':
+        run_worker(args.host, args.port, args.cache_size)
+        return
+
+    workloads = {}
+    for path in args.traces:
+        # load_defaults falls back to the built-in processes for a missing file
+        if not os.path.exists(path):
+            parser.error(f"no such file: {path}")
+        wid = os.path.basename(path)
+        if wid in workloads:
+            parser.error(f"two traces are named {wid}; workloads are identified by file name")
+        workloads[wid] = load_defaults(path)[3]
+    if args.configs:
+        with open(args.configs) as f:
+            configs = json.load(f)
+    else:
+        configs = search_space()
+    # Fill in and check the configs before any work goes out
+    try:
+        configs = [complete_config(c) for c in configs]
+    except (TypeError, ValueError) as e:
+        parser.error(f"bad config: {e}")
+    coordinator = SweepCoordinator(workloads, configs, args.host, args.port,
+                                   args.max_attempts, args.task_timeout or None)
+    print(f"{len(workloads)} workloads x {len(configs)} configs, listening on port {coordinator.port}")
+    local = start_local_workers(args.local_workers, coordinator.port)
+
+    def progress(done, failed, remaining):
+        print(f"\r{done} done, {failed} failed, {remaining} left", end='', flush=True)
+
+    try:
+        results = coordinator.run(progress)
+    finally:
+        for p in local:
+            p.wait()
+    print()
+    write_csv(args.out, results, configs)
+    print(f"Wrote {len(results)} rows to {args.out}" +
+          (f" ({len(coordinator.failed)} tasks failed)" if coordinator.failed else ""))
+
+
+if __name__ == '__main__':
+    main()
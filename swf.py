@@ -0,0 +1,154 @@
+# SWF Import
+# Reads job traces in the Standard Workload Format (SWF) used by the public
+# parallel workload archives and turns each job into a
+# (name, arrival, burst, priority) process.
+#
+#   for process in read_swf('trace.swf', time_scale=1/60):   # seconds -> minutes
+#       ...
+#   stream = load_swf('trace.swf', limit=100000)            # baselines.ArrivalStream
+#
+# SWF lines have 18 whitespace-separated fields; -1 means "unknown" and lines
+# starting with ';' are header comments. Only these fields are used:
+#   1 job number -> name ("J<number>")
+#   2 submit time -> arrival (relative to the first job, times time_scale)
+#   4 run time -> burst (times time_scale, at least min_burst)
+#   15 queue number, 16 partition number, 9 requested time: priority sources
+#   (times used for priorities are scaled too, so bins are in scaled units)
+# The file is read line by line, so memory use doesn't grow with the trace.
+
+import argparse
+from bisect import bisect_left
+
+from baselines import ArrivalStream
+
+# SWF field positions (0-based)
+JOB = 0
+SUBMIT = 1
+RUN = 3
+REQUESTED_TIME = 8
+QUEUE = 14
+PARTITION = 15
+
+# Where priorities can come from; 'runtime' gives short jobs the highest priority
+PRIORITY_SOURCES = {
+    'queue': QUEUE,
+    'partition': PARTITION,
+    'requested': REQUESTED_TIME,
+    'runtime': RUN,
+}
+# Sources holding times, which only make sense with bins
+TIME_SOURCES = ('requested', 'runtime')
+
+
+def priority_binner(bins=None, default=3):
+    """
+    Function mapping an SWF value to priority 1-3. bins are upper bounds:
+    with bins=(b1, b2), values <= b1 get 1, values <= b2 get 2, the rest 3.
+    Without bins the value is used as is, clamped to 1-3. Unknown values
+    (negative) get `default`.
+    """
+    if bins is None:
+        return lambda value: default if value < 0 else max(1, min(3, int(value)))
+    bins = sorted(bins)
+    return lambda value: default if value < 0 else min(3, 1 + bisect_left(bins, value))
+
+
+def read_swf(source, time_scale=1.0, min_burst=1, priority_from='queue', bins=None,
+             default_priority=3, limit=None):
+    """
+    Yield (name, arrival, burst, priority) for each job in an SWF trace.
+    `source` is a path or an open text file. Jobs without a run time are skipped.
+    Times are scaled by time_scale and rounded; arrivals start at 0.
+    The 'requested' and 'runtime' priority sources need `bins`.
+    """
+    if priority_from not in PRIORITY_SOURCES:
+        raise ValueError(f"Unknown priority source: {priority_from}")
+    if priority_from in TIME_SOURCES and bins is None:
+        # Clamping a time to 1-3 would put nearly every job in priority 3
+        raise ValueError(f"Priority source '{priority_from}' needs bins")
+    field = PRIORITY_SOURCES[priority_from]
+    binner = priority_binner(bins, default_priority)
+    needed = max(field, RUN) + 1
+
+    f = open(source, 'r') if isinstance(source, str) else source
+    try:
+        first_submit = None
+        count = 0
+        scaled = time_scale != 1
+        scale_value = field in (RUN, REQUESTED_TIME) and scaled
+        for line_num, line in enumerate(f, 1):
+            # Fields after the last one needed are left unsplit
+            parts = line.split(None, needed)
+            if not parts or parts[0][0] == ';':
+                continue
+            if len(parts) < needed:
+                raise ValueError(f"Line {line_num}: expected at least {needed} SWF fields")
+            try:
+                submit = _number(parts[SUBMIT])
+                run = _number(parts[RUN])
+                value = _number(parts[field])
+            except ValueError:
+                raise ValueError(f"Line {line_num}: invalid SWF values")
+            if run < 0 or submit < 0:
+                continue   # cancelled job or missing data
+
+            if first_submit is None:
+                first_submit = submit
+            if scaled:
+                arrival = max(0, round((submit - first_submit) * time_scale))
+                burst = max(min_burst, round(run * time_scale))
+                if scale_value and value >= 0:
+                    value *= time_scale
+            else:
+                arrival = max(0, round(submit - first_submit))
+                burst = max(min_burst, round(run))
+            yield 'J' + parts[JOB], arrival, burst, binner(value)
+
+            count += 1
+            if limit is not None and count >= limit:
+                break
+    finally:
+        if f is not source:
+            f.close()
+
+
+def _number(text):
+    # SWF values are almost always integers; int() is the faster parse
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def load_swf(source, **options):
+    """The jobs of an SWF trace as an ArrivalStream (same options as read_swf)."""
+    return ArrivalStream.from_rows(read_swf(source, **options))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert an SWF trace into a process file.")
+    parser.add_argument('file', help="SWF trace")
+    parser.add_argument('out', help="process file to write")
+    parser.add_argument('--time-scale', type=float, default=1.0, help="multiply all times by this")
+    parser.add_argument('--min-burst', type=int, default=1)
+    parser.add_argument('--priority-from', default='queue', choices=sorted(PRIORITY_SOURCES))
+    parser.add_argument('--bins', type=float, nargs=2, default=None,
+                        help="upper bounds for priority 1 and 2 (needed for requested and runtime; "
+                             "default: use the value itself)")
+    parser.add_argument('--limit', type=int, default=None, help="only the first N jobs")
+    args = parser.parse_args(argv)
+    if args.priority_from in TIME_SOURCES and args.bins is None:
+        parser.error(f"--priority-from {args.priority_from} needs --bins")
+
+    count = 0
+    with open(args.out, 'w') as out:
+        out.write(f"# Converted from {args.file}\n")
+        for name, arrival, burst, priority in read_swf(args.file, args.time_scale, args.min_burst,
+                                                       args.priority_from, args.bins, limit=args.limit):
+            out.write(f"{name} {arrival} {burst} {priority}\n")
+            count += 1
+    print(f"Wrote {count} processes to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import math
+
+import pytest
+
+from metrics import MetricSummary, QuantileSketch
+
+
+def _nearest_rank(values, p):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(p / 100.0 * len(ordered))) - 1]
+
+
+@pytest.mark.parametrize('n', [1022, 1023, 1024, 1025, 1026])
+@pytest.mark.parametrize('p', [50, 95, 99])
+def test_exact_and_sketch_percentiles_agree_around_the_limit(n, p):
+    # Distinct values more than the sketch's accuracy apart, out of order
+    values = [1.05 ** ((i * 7919) % n) for i in range(n)]
+    summary = MetricSummary(exact_limit=1024)
+    sketch = QuantileSketch()
+    for x in values:
+        summary.add(x)
+        sketch.add(x)
+    exact = _nearest_rank(values, p)
+    # Both paths pick the same rank; the sketch only rounds within its accuracy
+    assert sketch.quantile(p / 100.0) == pytest.approx(exact, rel=0.01)
+    assert summary.percentile(p) == pytest.approx(exact, rel=0.01)
+    if n <= 1024:
+        assert summary.percentile(p) == exact
+
+
+def test_small_integer_samples_report_real_values():
+    summary = MetricSummary()
+    for x in [0, 3, 7, 12, 15, 19, 19, 16]:
+        summary.add(x)
+    assert summary.as_dict()['p95'] == 19
+    assert summary.percentile(50) == 12
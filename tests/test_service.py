@@ -0,0 +1,41 @@
+import os
+import signal
+
+import pytest
+
+from service import SimulationService, parse_request
+
+
+@pytest.fixture
+def service():
+    service = SimulationService(workers=1)
+    yield service
+    service.close()
+
+
+def _job(burst):
+    return parse_request({'processes': [['P1', 0, burst, 1], ['P2', 1, 3, 2]]})
+
+
+def test_service_recovers_after_a_worker_dies(service):
+    assert service.submit(_job(2)).result(timeout=30)['results']
+
+    broken = service.pool
+    for process in list(broken._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+
+    # The request that meets the dead worker may fail; the next ones must not
+    try:
+        service.submit(_job(4)).result(timeout=30)
+    except RuntimeError:
+        pass
+    reply = service.submit(_job(5)).result(timeout=30)
+    assert [r['name'] for r in reply['results']] == ['P1', 'P2']
+    assert service.pool is not broken
+
+
+def test_parse_request_rejects_bad_values():
+    for body in ({'processes': 5}, {'config': 5}, {'config': {'quantums': 3}},
+                 {'processes': [['P1', 0, 0, 1]]}, {'config': {'aging_threshold': -1}}):
+        with pytest.raises(ValueError):
+            parse_request(body)
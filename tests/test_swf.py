@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+from swf import read_swf
+
+
+def _trace(run_times):
+    # Minimal SWF lines: job, submit, wait, run, then the other 14 fields as -1
+    lines = ["; header comment"]
+    for i, run in enumerate(run_times, 1):
+        lines.append(" ".join([str(i), str(i * 10), "0", str(run)] + ["-1"] * 14))
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def test_runtime_priorities_use_bins():
+    jobs = list(read_swf(_trace([5, 60, 600, 3600]), priority_from='runtime', bins=(60, 600)))
+    assert [p for _, _, _, p in jobs] == [1, 1, 2, 3]
+    assert {p for _, _, _, p in jobs} == {1, 2, 3}
+
+
+@pytest.mark.parametrize('source', ['runtime', 'requested'])
+def test_time_sources_need_bins(source):
+    with pytest.raises(ValueError):
+        list(read_swf(_trace([5, 60]), priority_from=source))
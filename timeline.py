@@ -0,0 +1,86 @@
+# Columnar Timeline
+# Stores the scheduler's execution slices as four growable typed arrays
+# (start, end, process id, queue level) instead of a list of tuples. Process
+# names are interned once, so a run with millions of context switches costs
+# about 21 bytes per slice, and the arrays can be handed to NumPy or written
+# out as raw buffers without copying.
+#
+# It still iterates and indexes like the old list of
+# (start, end, name, queue_level) tuples, so existing callers keep working.
+
+from array import array
+
+from frame_codec import NameTable
+
+
+class Timeline:
+
+    def __init__(self, slices=(), names=None):
+        self.names = names if names is not None else NameTable()
+        self.starts = array('q')
+        self.ends = array('q')
+        self.pids = array('i')
+        self.levels = array('b')
+        for start, end, name, queue_level in slices:
+            self.append(start, end, name, queue_level)
+
+    @classmethod
+    def from_arrays(cls, starts, ends, pids, levels, names):
+        """Wrap existing arrays (no copy); `names` is a list or NameTable indexed by pid."""
+        tl = cls(names=names if isinstance(names, NameTable) else NameTable(names))
+        tl.starts, tl.ends, tl.pids = starts, ends, pids
+        tl.levels = levels if levels.typecode == 'b' else array('b', levels)
+        return tl
+
+    def append(self, start, end, name, queue_level):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.pids.append(self.names.id_for(name))
+        self.levels.append(queue_level)
+
+    def extend_last(self, end):
+        """Move the end of the last slice (back-to-back run of the same process)."""
+        self.ends[-1] = end
+
+    def last_name(self):
+        return self.names.names[self.pids[-1]] if self.pids else None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        return (self.starts[i], self.ends[i], self.names.names[self.pids[i]], self.levels[i])
+
+    def __iter__(self):
+        names = self.names.names
+        for start, end, pid, level in zip(self.starts, self.ends, self.pids, self.levels):
+            yield (start, end, names[pid], level)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"Timeline({len(self)} slices)"
+
+    def buffers(self):
+        """Read-only memoryviews of (starts, ends, pids, levels), no copying (same caveat as to_numpy)."""
+        return tuple(memoryview(a).toreadonly() for a in (self.starts, self.ends, self.pids, self.levels))
+
+    def to_numpy(self):
+        """
+        The columns as NumPy arrays sharing memory with this timeline
+        (needs NumPy). The timeline can't grow while they are alive.
+        """
+        import numpy as np
+        return {
+            'start': np.frombuffer(self.starts, dtype=np.int64),
+            'end': np.frombuffer(self.ends, dtype=np.int64),
+            'pid': np.frombuffer(self.pids, dtype=np.int32),
+            'queue_level': np.frombuffer(self.levels, dtype=np.int8),
+            'names': list(self.names.names),
+        }
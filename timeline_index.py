@@ -0,0 +1,95 @@
+# Timeline Index
+# Built once per run from the scheduler's (start, end, name, queue_level) slices.
+# Works on the Timeline's own columns; a plain list of tuples is copied into one.
+# Answers "what was running at time t", "all slices of process P" and
+# "slices overlapping [a, b)" with a binary search instead of a scan.
+#
+# The scheduler runs one process at a time, so slices never overlap: sorted by
+# start, their ends are sorted too, which is what makes both searches work.
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from timeline import Timeline
+
+
+class TimelineIndex:
+
+    def __init__(self, timeline):
+        if not isinstance(timeline, Timeline):
+            # A list of tuples: copy it into columns once
+            timeline = Timeline(timeline)
+        starts = timeline.starts
+        # Scheduler output is already in order; sort anything else by start
+        if any(starts[i] > starts[i + 1] for i in range(len(starts) - 1)):
+            timeline = Timeline(sorted(timeline, key=lambda s: s[0]))
+
+        # The timeline's own columns and name table, not copies
+        self.starts = timeline.starts
+        self.ends = timeline.ends
+        self.pids = timeline.pids
+        self.levels = timeline.levels
+        self._names = timeline.names.names
+        self.by_process = {}       # name -> array of slice positions, in time order
+        self.busy_prefix = array('q', [0])  # busy ticks in slices [0, i)
+
+        by_pid = {}
+        busy = 0
+        for i, (start, end, pid) in enumerate(zip(self.starts, self.ends, self.pids)):
+            by_pid.setdefault(pid, array('q')).append(i)
+            busy += end - start
+            self.busy_prefix.append(busy)
+        for pid, positions in by_pid.items():
+            self.by_process[self._names[pid]] = positions
+
+        # Time the last slice ends (0 for an empty run)
+        self.end = self.ends[-1] if self.ends else 0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        return (self.starts[i], self.ends[i], self._names[self.pids[i]], self.levels[i])
+
+    def __iter__(self):
+        names = self._names
+        for start, end, pid, level in zip(self.starts, self.ends, self.pids, self.levels):
+            yield (start, end, names[pid], level)
+
+    def position_at(self, t):
+        """Position of the slice running at time t, or None if the CPU was idle."""
+        i = bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return i
+        return None
+
+    def at(self, t):
+        """The (start, end, name, queue_level) slice running at time t, or None."""
+        i = self.position_at(t)
+        return None if i is None else self[i]
+
+    def slices_of(self, name):
+        """All slices of one process, in time order."""
+        return [self[i] for i in self.by_process.get(name, ())]
+
+    def overlapping_range(self, a, b):
+        """range of slice positions that overlap [a, b)."""
+        return range(bisect_right(self.ends, a), bisect_left(self.starts, b))
+
+    def overlapping(self, a, b):
+        """Slices that overlap [a, b), in time order."""
+        return [self[i] for i in self.overlapping_range(a, b)]
+
+    def busy_time(self, a=0, b=None):
+        """Ticks in [a, b) during which the CPU ran something."""
+        if b is None:
+            b = self.end
+        positions = self.overlapping_range(a, b)
+        if not positions:
+            return 0
+        first, last = positions[0], positions[-1]
+        busy = self.busy_prefix[last + 1] - self.busy_prefix[first]
+        # Trim the partial slices at both edges
+        busy -= max(0, a - self.starts[first])
+        busy -= max(0, self.ends[last] - b)
+        return busy
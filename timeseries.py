@@ -0,0 +1,121 @@
+# Queue-Length and Utilization Time Series for the MLFQ Scheduler
+# Records Q0/Q1/Q2 depths, CPU busy time and throughput per time window.
+# Windows are merged two at a time when there are too many of them,
+# so memory stays bounded no matter how long the simulation runs.
+
+import csv
+
+NUM_QUEUES = 3
+
+
+class QueueTimeSeries:
+    """
+    Fixed-window, self-downsampling time series.
+
+    Pass it to SimpleMLFQScheduler(listeners=[...]); it is fed by the
+    on_tick and on_complete hooks. Each window keeps the number of ticks
+    seen, the summed and maximum length of every queue, the busy CPU ticks
+    and the number of completions. When more than `max_windows` windows
+    exist, neighbouring windows are merged and the window size doubles.
+    """
+
+    def __init__(self, window=1, max_windows=1024):
+        self.window = max(1, int(window))
+        self.max_windows = max(2, int(max_windows))
+        self.start = None   # first recorded tick
+
+        # One entry per window
+        self.ticks = []
+        self.busy = []
+        self.completed = []
+        self.queue_sum = [[] for _ in range(NUM_QUEUES)]
+        self.queue_max = [[] for _ in range(NUM_QUEUES)]
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def _slot(self, t):
+        if self.start is None:
+            self.start = t
+        i = (t - self.start) // self.window
+        while i >= self.max_windows:
+            self._downsample()
+            i = (t - self.start) // self.window
+        while len(self.ticks) <= i:
+            self.ticks.append(0)
+            self.busy.append(0)
+            self.completed.append(0)
+            for lvl in range(NUM_QUEUES):
+                self.queue_sum[lvl].append(0)
+                self.queue_max[lvl].append(0)
+        return i
+
+    def _downsample(self):
+        # Merge windows pairwise and double the window size
+        def pairs(values, combine):
+            return [combine(values[i:i + 2]) for i in range(0, len(values), 2)]
+
+        self.ticks = pairs(self.ticks, sum)
+        self.busy = pairs(self.busy, sum)
+        self.completed = pairs(self.completed, sum)
+        for lvl in range(NUM_QUEUES):
+            self.queue_sum[lvl] = pairs(self.queue_sum[lvl], sum)
+            self.queue_max[lvl] = pairs(self.queue_max[lvl], max)
+        self.window *= 2
+
+    def record(self, t, lengths, busy, n=1):
+        """Record `n` ticks starting at `t` with the given queue lengths and CPU state."""
+        while n > 0:
+            i = self._slot(t)
+            # How many of the n ticks fall into this window
+            span = min(n, self.start + (i + 1) * self.window - t)
+            self.ticks[i] += span
+            if busy:
+                self.busy[i] += span
+            for lvl in range(NUM_QUEUES):
+                self.queue_sum[lvl][i] += lengths[lvl] * span
+                if lengths[lvl] > self.queue_max[lvl][i]:
+                    self.queue_max[lvl][i] = lengths[lvl]
+            t += span
+            n -= span
+
+    def record_completion(self, t):
+        self.completed[self._slot(t)] += 1
+
+    # Scheduler listener hooks
+    def on_tick(self, scheduler):
+        q = scheduler.queues
+        self.record(scheduler.current_time, (len(q[0]), len(q[1]), len(q[2])), scheduler.cpu is not None)
+
+    def on_complete(self, process):
+        # completion_time is the end of the final tick, count it in that tick
+        self.record_completion(process.completion_time - 1)
+
+    def columns(self):
+        """Return the series as a dict of equal-length lists, ready for plotting."""
+        cols = {'time': [], 'ticks': [], 'cpu_utilization': [], 'throughput': []}
+        for lvl in range(NUM_QUEUES):
+            cols[f'q{lvl}_avg'] = []
+            cols[f'q{lvl}_max'] = []
+        for i, ticks in enumerate(self.ticks):
+            cols['time'].append(self.start + i * self.window)
+            cols['ticks'].append(ticks)
+            cols['cpu_utilization'].append(self.busy[i] / ticks if ticks else 0.0)
+            cols['throughput'].append(self.completed[i] / ticks if ticks else 0.0)
+            for lvl in range(NUM_QUEUES):
+                cols[f'q{lvl}_avg'].append(self.queue_sum[lvl][i] / ticks if ticks else 0.0)
+                cols[f'q{lvl}_max'].append(self.queue_max[lvl][i])
+        return cols
+
+    def rows(self):
+        cols = self.columns()
+        keys = list(cols)
+        for values in zip(*(cols[k] for k in keys)):
+            yield dict(zip(keys, values))
+
+    def to_csv(self, path):
+        cols = self.columns()
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(cols))
+            writer.writerows(zip(*cols.values()))
@@ -0,0 +1,239 @@
+# Trace Export
+# Scheduler listener that streams a run to a trace file for a trace viewer
+# (chrome://tracing or ui.perfetto.dev), for runs too big for the Tk canvas.
+#
+#   python trace_export.py Processes/sample_processes.txt run.json
+#   python trace_export.py big_trace.txt run.pftrace --counters
+#
+# The trace has one track for the CPU and one per queue level. Every slice
+# shows up on the CPU track and on the track of the level it ran from;
+# aging and demotion are instant events on the level the process moved to.
+# With queue_counters=True there are also queue-length counters, but that
+# uses on_tick, which turns off the scheduler's fast paths.
+#
+# Two formats:
+#   'json'  - Trace Event JSON ({"traceEvents": [...]})
+#   'proto' - Perfetto's binary protobuf trace (TracePacket / TrackEvent),
+#             written by hand so no protobuf package is needed
+# Events are written through a buffer of `buffer_size` bytes, so memory use
+# stays the same however long the run is.
+
+import argparse
+import os
+import json
+
+from process import load_defaults
+from scheduler import SimpleMLFQScheduler
+
+LEVEL_NAMES = ('Q0', 'Q1', 'Q2')
+# Track ids (thread ids in JSON): the CPU, then Q0-Q2, then the Q0-Q2 length counters
+CPU_TRACK = 1
+LEVEL_TRACK = 2
+COUNTER_TRACK = 5
+
+
+class TraceWriter:
+    """
+    Listener (on_slice, on_aging, on_demotion and optionally on_tick) that
+    writes the run to `path`. One tick is `tick_us` microseconds in the trace.
+    Call close() (or use it as a context manager) when the run is over.
+    """
+
+    def __init__(self, path, format=None, tick_us=1000, buffer_size=1 << 16, queue_counters=False):
+        if format is None:
+            format = 'proto' if path.endswith(('.pftrace', '.perfetto-trace', '.pb')) else 'json'
+        if format not in ('json', 'proto'):
+            raise ValueError(f"Unknown trace format: {format}")
+        self.format = format
+        self.tick_us = tick_us
+        self.buffer_size = buffer_size
+        self._file = open(path, 'wb')
+        self._buffer = []
+        self._buffered = 0
+        self._first = True   # no JSON event written yet (for the commas)
+        # Slice not written yet, so back-to-back pieces can be merged: [start, end, name, level]
+        self._pending = None
+        self._lengths = None
+
+        if queue_counters:
+            # Only defined when asked for, since any on_tick listener slows the run down
+            self.on_tick = self._on_tick
+
+        if format == 'json':
+            self._write(b'{"traceEvents":[')
+            self._json({'ph': 'M', 'pid': 1, 'name': 'process_name', 'args': {'name': 'MLFQ'}})
+            for track, name in enumerate(('CPU',) + LEVEL_NAMES, CPU_TRACK):
+                self._json({'ph': 'M', 'pid': 1, 'tid': track, 'name': 'thread_name', 'args': {'name': name}})
+                self._json({'ph': 'M', 'pid': 1, 'tid': track, 'name': 'thread_sort_index',
+                            'args': {'sort_index': track}})
+        else:
+            self._packet(_message(60, _varint_field(1, _uuid(0)) + _string_field(2, 'MLFQ')))
+            for track, name in enumerate(('CPU',) + LEVEL_NAMES, CPU_TRACK):
+                self._packet(_message(60, _varint_field(1, _uuid(track)) + _string_field(2, name)
+                                      + _varint_field(5, _uuid(0))))
+            if queue_counters:
+                for level, name in enumerate(LEVEL_NAMES):
+                    self._packet(_message(60, _varint_field(1, _uuid(COUNTER_TRACK + level))
+                                          + _string_field(2, f"{name} length")
+                                          + _varint_field(5, _uuid(0)) + _message(8, b'')))
+
+    # == Listener hooks ==
+
+    def on_slice(self, start, end, name, level):
+        pending = self._pending
+        if pending is not None and pending[1] == start and pending[2] == name and pending[3] == level:
+            pending[1] = end
+            return
+        if pending is not None:
+            self._write_slice(*pending)
+        self._pending = [start, end, name, level]
+
+    def on_aging(self, time, name, from_level, to_level):
+        self._write_instant(time, f"{name} aged", to_level, name, from_level, to_level)
+
+    def on_demotion(self, time, name, from_level, to_level):
+        self._write_instant(time, f"{name} demoted", to_level, name, from_level, to_level)
+
+    def _on_tick(self, scheduler):
+        lengths = tuple(len(queue) for queue in scheduler.queues)
+        if lengths == self._lengths:
+            return
+        t = scheduler.current_time
+        if self.format == 'json':
+            self._json({'ph': 'C', 'pid': 1, 'name': 'Queue lengths', 'ts': t * self.tick_us,
+                        'args': dict(zip(LEVEL_NAMES, lengths))})
+        else:
+            for level, n in enumerate(lengths):
+                if self._lengths is None or self._lengths[level] != n:
+                    self._track_event(t, COUNTER_TRACK + level, 4, extra=_varint_field(30, n))
+        self._lengths = lengths
+
+    # == Writing ==
+
+    def _write_slice(self, start, end, name, level):
+        if self.format == 'json':
+            event = {'ph': 'X', 'pid': 1, 'name': name, 'ts': start * self.tick_us,
+                     'dur': (end - start) * self.tick_us}
+            self._json(dict(event, tid=CPU_TRACK))
+            self._json(dict(event, tid=LEVEL_TRACK + level))
+        else:
+            # Begin/end pairs (types 1 and 2) on the CPU track and the level's track
+            for track in (CPU_TRACK, LEVEL_TRACK + level):
+                self._track_event(start, track, 1, name)
+                self._track_event(end, track, 2)
+
+    def _write_instant(self, time, label, level, name, from_level, to_level):
+        # Slices come in time order, so the pending one is written first
+        if self._pending is not None and self._pending[1] <= time:
+            self._write_slice(*self._pending)
+            self._pending = None
+        if self.format == 'json':
+            self._json({'ph': 'i', 's': 't', 'pid': 1, 'tid': LEVEL_TRACK + level, 'name': label,
+                        'ts': time * self.tick_us,
+                        'args': {'process': name, 'from': LEVEL_NAMES[from_level], 'to': LEVEL_NAMES[to_level]}})
+        else:
+            self._track_event(time, LEVEL_TRACK + level, 3, label)
+
+    def _json(self, event):
+        data = json.dumps(event, separators=(',', ':')).encode('utf-8')
+        if self._first:
+            self._first = False
+            self._write(data)
+        else:
+            self._write(b',' + data)
+
+    def _track_event(self, time, track, kind, name=None, extra=b''):
+        body = _varint_field(9, kind) + _varint_field(11, _uuid(track))
+        if name is not None:
+            body += _string_field(23, name)
+        # timestamp is in nanoseconds; sequence id 1 for every packet
+        self._packet(_varint_field(8, time * self.tick_us * 1000) + _varint_field(10, 1)
+                     + _message(11, body + extra))
+
+    def _packet(self, packet):
+        # Trace.packet = 1
+        self._write(_message(1, packet))
+
+    def _write(self, data):
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self._file.write(b''.join(self._buffer))
+        self._buffer.clear()
+        self._buffered = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._pending is not None:
+            self._write_slice(*self._pending)
+            self._pending = None
+        if self.format == 'json':
+            self._write(b']}\n')
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# == Protobuf encoding ==
+# Just enough of the wire format: varints (wire type 0) and
+# length-delimited strings / messages (wire type 2)
+
+def _varint(n):
+    out = bytearray()
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _varint_field(field, n):
+    return _varint(field << 3) + _varint(n)
+
+
+def _message(field, data):
+    return _varint(field << 3 | 2) + _varint(len(data)) + data
+
+
+def _string_field(field, text):
+    return _message(field, text.encode('utf-8'))
+
+
+def _uuid(track):
+    # Track uuids only need to be unique within the trace; 0 is the parent track
+    return 0x4d4c4651_00000000 + track
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the MLFQ and write the run as a trace file.")
+    parser.add_argument('file', help="process file (name arrival burst priority per line)")
+    parser.add_argument('out', help="trace file (.json, or .pftrace for the binary format)")
+    parser.add_argument('--format', choices=('json', 'proto'), default=None)
+    parser.add_argument('--tick-us', type=int, default=1000, help="microseconds per tick in the trace")
+    parser.add_argument('--counters', action='store_true', help="add queue-length counters (slower)")
+    parser.add_argument('--no-preempt', action='store_true', help="run the MLFQ without preemption")
+    args = parser.parse_args(argv)
+
+    # load_defaults falls back to the built-in processes for a missing file
+    if not os.path.exists(args.file):
+        parser.error(f"no such file: {args.file}")
+    quantums, demote, aging, processes = load_defaults(args.file)
+    with TraceWriter(args.out, args.format, args.tick_us, queue_counters=args.counters) as writer:
+        scheduler = SimpleMLFQScheduler(quantums=list(quantums), demote_threshold=demote,
+                                        aging_threshold=aging, preempt=not args.no_preempt,
+                                        listeners=[writer])
+        out = scheduler.simulate_with_frames(processes, keep_frames=False)
+    print(f"Wrote {len(out[0]) if out else 0} slices to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+# Configuration Tuner
+# Searches Q0/Q1/Q2 and the demotion and aging thresholds for the MLFQ
+# settings that minimize one objective (e.g. p95 response time) on a workload.
+#
+# Uses successive halving: many candidates run on a short prefix of the
+# workload, the best 1/eta of them move on to a prefix eta times longer, and
+# so on until the survivors run the whole workload. Inside a round, a run is
+# stopped as soon as its finished processes already make it worse than the
+# cut-off for moving on (EarlyStop). Candidates run in worker processes.
+#
+#   python tuner.py Processes/sample_processes.txt --objective p95_response
+#   python tuner.py my_trace.txt --objective avg_turnaround --candidates 243 --eta 3
+
+import argparse
+import os
+import math
+import multiprocessing as mp
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+from process import load_defaults
+from scheduler import SimpleMLFQScheduler, SimulationCancelled
+
+# Objective name -> (metric, statistic); every objective is minimized
+OBJECTIVES = {
+    'avg_waiting': ('waiting', 'mean'),
+    'avg_turnaround': ('turnaround', 'mean'),
+    'avg_response': ('response', 'mean'),
+    'p95_waiting': ('waiting', 'p95'),
+    'p95_turnaround': ('turnaround', 'p95'),
+    'p95_response': ('response', 'p95'),
+    'makespan': ('makespan', 'max'),
+}
+
+# Default search space
+QUANTUM_CHOICES = (1, 2, 3, 4, 6, 8, 12, 16)
+DEMOTE_CHOICES = (0, 2, 4, 6, 8, 12, 16)
+AGING_CHOICES = (0, 3, 5, 8, 12, 20)
+
+
+class EarlyStop:
+    """
+    Scheduler listener that works out the objective from the completions and
+    raises SimulationCancelled once the run can no longer get below
+    `threshold()`. Only on_complete is used, so the scheduler's fast paths
+    stay on. After a full run, value() is the exact objective.
+    """
+
+    def __init__(self, objective, processes, threshold=lambda: math.inf):
+        self.metric, self.stat = OBJECTIVES[objective]
+        self.threshold = threshold
+        self.n = len(processes)
+        self.first_arrival = min((p[1] for p in processes), default=0)
+        self.values = []
+        self.total = 0
+        self.above = 0          # finished processes already over the threshold
+        # A process that hasn't finished still adds at least its burst to the turnaround
+        self.unfinished_floor = sum(p[2] for p in processes) if self.metric == 'turnaround' else 0
+
+    def _metric(self, p):
+        if self.metric == 'waiting':
+            return p.waiting_time
+        if self.metric == 'turnaround':
+            return p.get_turnaround_time()
+        if self.metric == 'response':
+            return p.get_response_time()
+        return p.completion_time - self.first_arrival
+
+    def on_complete(self, process):
+        value = self._metric(process)
+        self.values.append(value)
+        self.total += value
+        if self.metric == 'turnaround':
+            self.unfinished_floor -= process.burst_time
+
+        limit = self.threshold()
+        if self.stat == 'mean':
+            lower_bound = (self.total + self.unfinished_floor) / self.n
+            if lower_bound > limit:
+                raise SimulationCancelled()
+        elif self.stat == 'p95':
+            # The p95 is over the limit once more than 5% of all values are
+            if value > limit:
+                self.above += 1
+                if self.above > self.n - _rank(self.n, 0.95):
+                    raise SimulationCancelled()
+        elif value > limit:
+            # Makespan only grows
+            raise SimulationCancelled()
+
+    def value(self):
+        if not self.values:
+            return math.inf
+        if self.stat == 'mean':
+            return self.total / len(self.values)
+        if self.stat == 'p95':
+            return sorted(self.values)[_rank(len(self.values), 0.95) - 1]
+        return max(self.values)
+
+
+def _rank(n, q):
+    # Nearest-rank percentile position (1-based)
+    return max(1, math.ceil(q * n))
+
+
+def search_space(quantums=QUANTUM_CHOICES, demotes=DEMOTE_CHOICES, agings=AGING_CHOICES,
+                 preempt=True, increasing=True):
+    """Every configuration in the grid; with increasing=True only Q0 <= Q1 <= Q2."""
+    configs = []
+    for q0, q1, q2, demote, aging in product(quantums, quantums, quantums, demotes, agings):
+        if increasing and not q0 <= q1 <= q2:
+            continue
+        configs.append({
+            'quantums': [q0, q1, q2],
+            'demote_threshold': demote,
+            'aging_threshold': aging,
+            'preempt': preempt,
+        })
+    return configs
+
+
+# == Worker side ==
+# The workload and the shared cut-off are handed to each worker once
+
+_workload = None
+_threshold = None
+
+
+def _init_worker(processes, threshold):
+    global _workload, _threshold
+    _workload = processes
+    _threshold = threshold
+
+
+def _evaluate(task):
+    # Returns (candidate index, objective), or (index, None) if it was stopped early
+    index, config, budget, objective = task
+    processes = _workload[:budget]
+    stop = EarlyStop(objective, processes, lambda: _threshold.value)
+    scheduler = SimpleMLFQScheduler(listeners=[stop], **config)
+    try:
+        scheduler.simulate_with_frames(processes, keep_frames=False)
+    except SimulationCancelled:
+        return index, None
+    return index, stop.value()
+
+
+# == Successive halving ==
+
+def tune(processes, objective='avg_turnaround', configs=None, candidates=81, eta=3,
+         workers=None, seed=None, progress=None, min_processes=20):
+    """
+    Find the configuration that minimizes `objective` on `processes`.
+    Draws `candidates` configurations from `configs` (default: search_space()).
+    The first round runs at least `min_processes` processes.
+    progress(budget, evaluated, survivors) is called after each round.
+    Returns {'config', 'objective', 'evaluations', 'stopped_early', 'rounds'}.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    # Prefixes are taken in arrival order, like the scheduler sees them
+    processes = sorted(processes, key=lambda p: p[1])
+    if not processes:
+        raise ValueError("No processes to tune on")
+
+    configs = search_space() if configs is None else list(configs)
+    rnd = random.Random(seed)
+    if len(configs) > candidates:
+        configs = rnd.sample(configs, candidates)
+
+    n = len(processes)
+    rounds = max(0, math.floor(math.log(len(configs), eta)))
+    alive = list(range(len(configs)))
+    threshold = mp.Value('d', math.inf)
+    history = []
+    evaluations = stopped = 0
+    best = None
+
+    if workers == 1:
+        _init_worker(processes, threshold)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(processes, threshold))
+    try:
+        for r in range(rounds + 1):
+            budget = min(n, max(min_processes, math.ceil(n / eta ** (rounds - r))))
+            keep = max(1, len(alive) // eta) if r < rounds else 1
+            threshold.value = math.inf
+            tasks = [(i, configs[i], budget, objective) for i in alive]
+
+            # The cut-off is the keep-th best score finished so far in this round
+            scores = {}
+            finished = []
+
+            def record(index, value):
+                nonlocal stopped
+                if value is None:
+                    stopped += 1
+                    value = math.inf
+                scores[index] = value
+                if value < math.inf:
+                    finished.append(value)
+                    finished.sort()
+                    if len(finished) >= keep:
+                        threshold.value = finished[keep - 1]
+
+            if executor is None:
+                for task in tasks:
+                    record(*_evaluate(task))
+            else:
+                for future in as_completed([executor.submit(_evaluate, task) for task in tasks]):
+                    record(*future.result())
+            evaluations += len(tasks)
+
+            alive = sorted(alive, key=lambda i: (scores[i], i))[:keep]
+            history.append({'budget': budget, 'evaluated': len(tasks), 'survivors': len(alive)})
+            if progress is not None:
+                progress(budget, len(tasks), len(alive))
+        best = alive[0]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return {
+        'config': configs[best],
+        'objective': scores[best],
+        'evaluations': evaluations,
+        'stopped_early': stopped,
+        'rounds': history,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search for the best MLFQ settings on a workload.")
+    parser.add_argument('file', help="process file (name arrival burst priority per line)")
+    parser.add_argument('--objective', default='avg_turnaround', choices=sorted(OBJECTIVES))
+    parser.add_argument('--candidates', type=int, default=81, help="configurations to start with")
+    parser.add_argument('--eta', type=int, default=3, help="keep 1/eta of the candidates each round")
+    parser.add_argument('--no-preempt', action='store_true', help="tune the MLFQ without preemption")
+    parser.add_argument('--any-order', action='store_true', help="also try Q0 > Q1 or Q1 > Q2")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # load_defaults falls back to the built-in processes for a missing file
+    if not os.path.exists(args.file):
+        parser.error(f"no such file: {args.file}")
+    _, _, _, processes = load_defaults(args.file)
+    configs = search_space(preempt=not args.no_preempt, increasing=not args.any_order)
+
+    def progress(budget, evaluated, survivors):
+        print(f"{evaluated:5d} candidates on {budget} processes -> {survivors} kept")
+
+    result = tune(processes, args.objective, configs, args.candidates, args.eta,
+                  args.workers, args.seed, progress)
+    config = result['config']
+    print(f"\nBest {args.objective}: {result['objective']:.2f} "
+          f"({result['evaluations']} runs, {result['stopped_early']} stopped early)")
+    # Same keys as a process file, ready to paste
+    print(f"Q0 {config['quantums'][0]}\nQ1 {config['quantums'][1]}\nQ2 {config['quantums'][2]}")
+    print(f"DEMOTE {config['demote_threshold']}\nAGING {config['aging_threshold']}")
+
+
+if __name__ == '__main__':
+    main()